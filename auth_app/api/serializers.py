@@ -3,6 +3,8 @@ from django.contrib.auth import get_user_model, authenticate
 from rest_framework import serializers
 from rest_framework.authtoken.models import Token
 
+from core.fast_serializers import ValuesSerializer
+
 User = get_user_model()
 
 class UserRegistrationSerializer(serializers.ModelSerializer):
@@ -25,13 +27,25 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
         return attrs
     
     def create(self, validated_data):
-        """Create new user with token"""
+        """Create new user with token, save(encoded_password=...) skips hashing"""
         validated_data.pop('repeated_password')
+        encoded_password = validated_data.pop('encoded_password', None)
         
         # Generate username automatically from email
         validated_data['username'] = validated_data['email']
         
-        user = User.objects.create_user(**validated_data)
+        if encoded_password is None:
+            user = User.objects.create_user(**validated_data)
+        else:
+            # Same as create_user() with the hash made by the async view
+            validated_data['password'] = encoded_password
+            validated_data['email'] = User.objects.normalize_email(
+                validated_data['email']
+            )
+            validated_data['username'] = User.normalize_username(
+                validated_data['username']
+            )
+            user = User.objects.create(**validated_data)
         
         # Create token
         token, created = Token.objects.get_or_create(user=user)
@@ -67,14 +81,16 @@ class UserLoginSerializer(serializers.Serializer):
         return email, password
     
     def _authenticate_user(self, email, password):
-        """Authenticate user via email"""
-        try:
-            user_obj = User.objects.get(email=email)
-            username = user_obj.username
-        except User.DoesNotExist:
-            raise serializers.ValidationError("Invalid credentials.")
-        
-        user = authenticate(username=username, password=password)
+        """
+        Authenticate user via email (auth_app.backends.EmailBackend), async
+        views authenticate first and pass the result as context['user']
+        """
+        if 'user' in self.context:
+            user = self.context['user']
+        else:
+            user = authenticate(
+                self.context.get('request'), email=email, password=password
+            )
         if not user:
             raise serializers.ValidationError("Invalid credentials.")
         
@@ -87,7 +103,11 @@ class UserLoginSerializer(serializers.Serializer):
     
     def _prepare_response_data(self, attrs, user):
         """Prepare response data with token"""
-        token, created = Token.objects.get_or_create(user=user)
+        try:
+            # Loaded together with the user by EmailBackend
+            token = user.auth_token
+        except Token.DoesNotExist:
+            token, created = Token.objects.get_or_create(user=user)
         
         attrs['user'] = user
         attrs['token'] = token.key
@@ -103,3 +123,28 @@ class UserSerializer(serializers.ModelSerializer):
     class Meta:
         model = User
         fields = ['id', 'email', 'fullname']
+
+class UserValuesSerializer(ValuesSerializer):
+    """
+    Fast read-only equivalent of UserSerializer for values() rows
+    
+    prefix selects a related user, e.g. 'assignee__'.
+    """
+    
+    def __init__(self, prefix=''):
+        self.id_key = f'{prefix}id'
+        self.email_key = f'{prefix}email'
+        self.fullname_key = f'{prefix}fullname'
+    
+    def get_value_fields(self):
+        return [self.id_key, self.email_key, self.fullname_key]
+    
+    def to_representation(self, row):
+        user_id = row[self.id_key]
+        if user_id is None:
+            return None
+        return {
+            'id': user_id,
+            'email': row[self.email_key],
+            'fullname': row[self.fullname_key],
+        }
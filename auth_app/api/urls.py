@@ -1,8 +1,20 @@
+from django.conf import settings
 from django.urls import path
-from .views import RegistrationView, LoginView, UserDeleteView
+from .views import (
+    AsyncLoginView,
+    AsyncRegistrationView,
+    RegistrationView,
+    LoginView,
+    UserDeleteView
+)
+
+if settings.ASYNC_AUTH_VIEWS:
+    registration_view, login_view = AsyncRegistrationView, AsyncLoginView
+else:
+    registration_view, login_view = RegistrationView, LoginView
 
 urlpatterns = [
-    path('registration/', RegistrationView.as_view(), name='registration'),
-    path('login/', LoginView.as_view(), name='login'),
+    path('registration/', registration_view.as_view(), name='registration'),
+    path('login/', login_view.as_view(), name='login'),
     path('users/<int:user_id>/', UserDeleteView.as_view(), name='user-delete'),
 ]
\ No newline at end of file
@@ -1,11 +1,16 @@
-from django.contrib.auth import get_user_model
+from asgiref.sync import sync_to_async
+from django.contrib.auth import aauthenticate, get_user_model
+from django.contrib.auth.hashers import make_password
 from django.shortcuts import get_object_or_404
 
 from rest_framework import status
+from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from auth_app.hashers import run_in_hash_pool
+from core.async_views import AsyncDispatchMixin
 from .serializers import UserRegistrationSerializer, UserLoginSerializer, UserSerializer
 
 User = get_user_model()
@@ -20,15 +25,17 @@ class RegistrationView(APIView):
     def post(self, request):
         serializer = UserRegistrationSerializer(data=request.data)
         if serializer.is_valid():
-            user = serializer.save()
-            response_data = {
-                'token': user.token,
-                'fullname': user.fullname,
-                'email': user.email,
-                'user_id': user.id
-            }
-            return Response(response_data, status=status.HTTP_201_CREATED)
+            return self._created_response(serializer.save())
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+    
+    def _created_response(self, user):
+        response_data = {
+            'token': user.token,
+            'fullname': user.fullname,
+            'email': user.email,
+            'user_id': user.id
+        }
+        return Response(response_data, status=status.HTTP_201_CREATED)
 
 class LoginView(APIView):
     """
@@ -38,8 +45,13 @@ class LoginView(APIView):
     permission_classes = [AllowAny]
     
     def post(self, request):
-        serializer = UserLoginSerializer(data=request.data)
-        if serializer.is_valid():
+        serializer = UserLoginSerializer(
+            data=request.data, context={'request': request}
+        )
+        return self._login_response(serializer, serializer.is_valid())
+    
+    def _login_response(self, serializer, is_valid):
+        if is_valid:
             response_data = {
                 'token': serializer.validated_data['token'],
                 'fullname': serializer.validated_data['fullname'],
@@ -49,6 +61,41 @@ class LoginView(APIView):
             return Response(response_data, status=status.HTTP_200_OK)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
+class AsyncRegistrationView(AsyncDispatchMixin, RegistrationView):
+    """
+    RegistrationView for ASGI servers, the password is hashed in the hash pool
+    """
+    
+    async def post(self, request):
+        serializer = UserRegistrationSerializer(data=request.data)
+        if not await sync_to_async(serializer.is_valid)():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        
+        encoded_password = await run_in_hash_pool(
+            make_password, serializer.validated_data['password']
+        )
+        user = await sync_to_async(serializer.save)(encoded_password=encoded_password)
+        return self._created_response(user)
+
+class AsyncLoginView(AsyncDispatchMixin, LoginView):
+    """
+    LoginView for ASGI servers, the password is verified in the hash pool
+    """
+    
+    async def post(self, request):
+        serializer = UserLoginSerializer(
+            data=request.data, context={'request': request}
+        )
+        try:
+            credentials = serializer.to_internal_value(request.data)
+        except ValidationError:
+            # is_valid() reports the field errors
+            pass
+        else:
+            serializer.context['user'] = await aauthenticate(request, **credentials)
+        is_valid = await sync_to_async(serializer.is_valid)()
+        return self._login_response(serializer, is_valid)
+
 class UserDeleteView(APIView):
     """
     DELETE /api/users/{user_id}/
@@ -4,4 +4,8 @@ from django.apps import AppConfig
 class AuthAppConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'auth_app'
-    verbose_name = 'Authentication'
\ No newline at end of file
+    verbose_name = 'Authentication'
+    
+    def ready(self):
+        # Register token cache eviction
+        from . import signals  # noqa: F401
@@ -0,0 +1,63 @@
+"""
+Token authentication with a cross-request cache.
+
+Drop-in replacement for DRF's ``TokenAuthentication``: the token -> user
+lookup is cached, so the Token/User join query only runs once per token
+and timeout. ``auth_app.signals`` evicts entries when a token is deleted
+or its user is saved or deleted. The cache is shared between processes
+with ``TOKEN_AUTH_CACHE['CACHE_ALIAS']``; without it a revoked token or
+deactivated user keeps authenticating in other processes for at most
+``LOCAL_TIMEOUT`` seconds.
+"""
+
+import copy
+
+from django.conf import settings
+
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+
+from core.cache import InvalidatedCache
+
+
+def _build_token_cache():
+    options = getattr(settings, 'TOKEN_AUTH_CACHE', {})
+    return InvalidatedCache(
+        'auth-token',
+        max_size=options.get('MAX_SIZE', 10000),
+        timeout=options.get('TIMEOUT', 60),
+        cache_alias=options.get('CACHE_ALIAS'),
+        local_timeout=options.get('LOCAL_TIMEOUT', 5),
+    )
+
+
+token_cache = _build_token_cache()
+
+
+def evict_token(key):
+    """Remove a token key from the authentication cache"""
+    token_cache.invalidate([key])
+
+
+def evict_user_tokens(user_id):
+    """Remove all cached tokens of a user"""
+    token_cache.invalidate(
+        Token.objects.filter(user_id=user_id).values_list('key', flat=True)
+    )
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    TokenAuthentication with cached token-to-user resolution
+    """
+    
+    def authenticate_credentials(self, key):
+        cached = token_cache.get(key)
+        if cached is None:
+            # Raises AuthenticationFailed for unknown tokens and inactive users
+            cached = super().authenticate_credentials(key)
+            token_cache.set(key, cached)
+        
+        # Requests must not share (and mutate) the same user instance
+        user, token = cached
+        return copy.copy(user), token
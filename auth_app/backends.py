@@ -0,0 +1,108 @@
+"""
+Email authentication backend used by the login endpoint.
+
+The user is looked up by email together with its API token in one query,
+so a login needs a single round trip when the token exists. Emails without
+an account are remembered in a bounded in-process cache for a short time:
+repeated failing attempts with unknown emails (credential stuffing) do not
+reach the database. ``auth_app.signals`` evicts an email when a user with
+it is saved.
+
+Stored hashes made with other hasher settings are replaced after a
+successful login. ``aauthenticate`` (async views) runs the hashing in the
+hash pool of ``auth_app.hashers``.
+"""
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+from django.contrib.auth.hashers import make_password, verify_password
+
+from auth_app.hashers import run_in_hash_pool
+from core.cache import LRUCache
+
+UserModel = get_user_model()
+
+
+def _build_unknown_email_cache():
+    options = getattr(settings, 'LOGIN_UNKNOWN_EMAIL_CACHE', {})
+    return LRUCache(
+        max_size=options.get('MAX_SIZE', 10000),
+        timeout=options.get('TIMEOUT', 30),
+    )
+
+
+unknown_email_cache = _build_unknown_email_cache()
+
+
+def forget_unknown_email(email):
+    """An account with this email exists now"""
+    unknown_email_cache.delete(email)
+
+
+class EmailBackend(ModelBackend):
+    """
+    ModelBackend looking users up by email with their token preloaded
+    
+    Accepts email= (login endpoint) or username= (admin login, the email is
+    the USERNAME_FIELD). The returned user has ``auth_token`` loaded if it
+    exists.
+    """
+    
+    def authenticate(self, request, username=None, password=None, email=None, **kwargs):
+        email = email or username or kwargs.get(UserModel.USERNAME_FIELD)
+        if email is None or password is None:
+            return None
+        
+        user = self.get_user_by_email(email)
+        is_correct, must_update = self.verify_password(user, password)
+        if not is_correct or not self.user_can_authenticate(user):
+            return None
+        if must_update:
+            self.upgrade_password(user, make_password(password))
+        return user
+    
+    async def aauthenticate(self, request, username=None, password=None, email=None,
+                            **kwargs):
+        """authenticate() with the password hashing in the hash pool"""
+        email = email or username or kwargs.get(UserModel.USERNAME_FIELD)
+        if email is None or password is None:
+            return None
+        
+        user = await sync_to_async(self.get_user_by_email)(email)
+        is_correct, must_update = await run_in_hash_pool(
+            self.verify_password, user, password
+        )
+        if not is_correct or not self.user_can_authenticate(user):
+            return None
+        if must_update:
+            encoded = await run_in_hash_pool(make_password, password)
+            await sync_to_async(self.upgrade_password)(user, encoded)
+        return user
+    
+    def verify_password(self, user, password):
+        """(is_correct, must_update), no database access"""
+        if user is None:
+            # Hash anyway, unknown emails take as long as wrong passwords
+            make_password(password)
+            return False, False
+        return verify_password(password, user.password)
+    
+    def upgrade_password(self, user, encoded):
+        """Store the hash made with the current hasher settings"""
+        # Assigned directly, a rehash is not a password change
+        user.password = encoded
+        user.save(update_fields=['password'])
+    
+    def get_user_by_email(self, email):
+        """User with its token, None for unknown (or recently unknown) emails"""
+        if unknown_email_cache.get(email):
+            return None
+        try:
+            return UserModel._default_manager.select_related('auth_token').get(
+                email=email
+            )
+        except UserModel.DoesNotExist:
+            unknown_email_cache.set(email, True)
+            return None
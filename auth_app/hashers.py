@@ -0,0 +1,49 @@
+"""
+Password hashing with a configurable work factor, off the event loop.
+
+``TunablePBKDF2PasswordHasher`` takes its iteration count from the
+``PASSWORD_HASH_ITERATIONS`` setting. Django rehashes a stored password
+whose iteration count differs on the next successful login, so raising or
+lowering the setting upgrades existing hashes transparently.
+
+The async login and registration views hash in a bounded thread pool
+(``run_in_hash_pool``). A burst of logins then occupies at most
+``PASSWORD_HASH_THREADS`` threads instead of one per request, and other
+requests keep getting CPU time. hashlib releases the GIL while hashing,
+so the pool threads run in parallel on several cores.
+"""
+
+import asyncio
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+
+
+class TunablePBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    """
+    PBKDF2-SHA256 with PASSWORD_HASH_ITERATIONS iterations (0 keeps Django's)
+    
+    The algorithm name is unchanged, hashes stay compatible with Django's
+    PBKDF2PasswordHasher.
+    """
+    
+    @property
+    def iterations(self):
+        return (getattr(settings, 'PASSWORD_HASH_ITERATIONS', 0)
+                or PBKDF2PasswordHasher.iterations)
+
+
+@functools.lru_cache(maxsize=None)
+def get_hash_pool():
+    """Process-wide pool sized by PASSWORD_HASH_THREADS (0 = CPU count)"""
+    threads = getattr(settings, 'PASSWORD_HASH_THREADS', 0) or os.cpu_count() or 1
+    return ThreadPoolExecutor(max_workers=threads, thread_name_prefix='password-hash')
+
+
+async def run_in_hash_pool(func, *args):
+    """Await func(*args) run in the hash pool, it must not use the database"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_hash_pool(), functools.partial(func, *args))
@@ -0,0 +1,108 @@
+import time
+
+from django.contrib.auth import authenticate, get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test import override_settings
+
+from rest_framework.authtoken.models import Token
+
+from auth_app.api.serializers import UserLoginSerializer
+from auth_app.backends import unknown_email_cache
+
+User = get_user_model()
+
+FAST_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
+
+class Command(BaseCommand):
+    """
+    Login throughput and queries per login, before and after EmailBackend
+    
+    Usage: python manage.py bench_login [--users 1000] [--logins 200] [--fast-hasher]
+    The previous path looked the user up by email, authenticated through
+    ModelBackend (a second user query) and fetched the token in a third
+    query. With the configured PBKDF2 hasher the password hash dominates,
+    --fast-hasher uses MD5 to show the database and Python overhead alone.
+    Benchmark users are created in a transaction that is rolled back.
+    """
+    help = "Benchmark the login path against the previous three-query login"
+    
+    PASSWORD = 'bench-pass-123'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=1000)
+        parser.add_argument('--logins', type=int, default=200)
+        parser.add_argument('--fast-hasher', action='store_true')
+    
+    def handle(self, *args, **options):
+        hashers = {'PASSWORD_HASHERS': FAST_HASHERS} if options['fast_hasher'] else {}
+        with override_settings(**hashers), transaction.atomic():
+            emails = self._seed(options['users'])
+            count = options['logins']
+            known = [emails[index % len(emails)] for index in range(count)]
+            # A burst of attempts with a few leaked addresses without account
+            unknown = [f'leaked-{index % 20}@example.com' for index in range(count)]
+            
+            for label, emails_used in [('valid credentials', known),
+                                       ('unknown emails', unknown)]:
+                unknown_email_cache.clear()
+                for path, login in [('previous', self._previous_login),
+                                    ('EmailBackend', self._login)]:
+                    rate, queries = self._measure(login, emails_used)
+                    self.stdout.write(
+                        f'{label}, {path}: {rate:.1f} logins/s, '
+                        f'{queries:.2f} queries per login'
+                    )
+            transaction.set_rollback(True)
+    
+    def _measure(self, login, emails):
+        queries = 0
+        
+        def count_query(execute, sql, params, many, context):
+            nonlocal queries
+            queries += 1
+            return execute(sql, params, many, context)
+        
+        with connection.execute_wrapper(count_query):
+            start = time.perf_counter()
+            for email in emails:
+                login(email)
+            elapsed = time.perf_counter() - start
+        return len(emails) / elapsed, queries / len(emails)
+    
+    def _login(self, email):
+        serializer = UserLoginSerializer(
+            data={'email': email, 'password': self.PASSWORD}
+        )
+        serializer.is_valid()
+    
+    @override_settings(
+        AUTHENTICATION_BACKENDS=['django.contrib.auth.backends.ModelBackend']
+    )
+    def _previous_login(self, email):
+        try:
+            username = User.objects.get(email=email).username
+        except User.DoesNotExist:
+            return
+        user = authenticate(username=username, password=self.PASSWORD)
+        if user is not None:
+            Token.objects.get_or_create(user=user)
+    
+    def _seed(self, count):
+        # One hash for every user, hashing per user would dominate the setup
+        users = [
+            User(username=f'login-bench-{index}@example.com',
+                 email=f'login-bench-{index}@example.com', fullname=f'Bench {index}')
+            for index in range(count)
+        ]
+        users[0].set_password(self.PASSWORD)
+        password = users[0].password
+        for user in users:
+            user.password = password
+        users = User.objects.bulk_create(users, batch_size=1000)
+        Token.objects.bulk_create(
+            [Token(key=Token.generate_key(), user=user) for user in users],
+            batch_size=1000
+        )
+        return [user.email for user in users]
@@ -0,0 +1,72 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.contrib.auth.hashers import get_hasher
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    """
+    Cost of the password hasher on this machine
+    
+    Usage: python manage.py bench_password_hash [--iterations 100000 600000 ...]
+           [--target-ms 100] [--threads 4]
+    Reports the time of one hash per iteration count, the logins per second
+    a single thread and --threads parallel threads sustain, and the
+    PASSWORD_HASH_ITERATIONS value closest to --target-ms per hash.
+    """
+    help = "Measure password hash cost to choose PASSWORD_HASH_ITERATIONS"
+    
+    PASSWORD = 'bench-pass-123'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, nargs='*')
+        parser.add_argument('--target-ms', type=float, default=100)
+        parser.add_argument('--threads', type=int, default=4)
+        parser.add_argument('--repeat', type=int, default=3)
+    
+    def handle(self, *args, **options):
+        hasher = get_hasher()
+        configured = hasher.iterations
+        counts = options['iterations'] or sorted(
+            {configured // 4, configured // 2, configured}
+        )
+        self.stdout.write(f'{hasher.algorithm}, configured iterations: {configured}')
+        
+        per_iteration = None
+        for iterations in counts:
+            elapsed = self._best_hash_time(hasher, iterations, options['repeat'])
+            parallel = self._parallel_rate(hasher, iterations, options['threads'])
+            per_iteration = elapsed / iterations
+            self.stdout.write(
+                f'{iterations} iterations: {elapsed * 1000:.1f} ms per hash, '
+                f'{1 / elapsed:.1f} logins/s on one thread, '
+                f'{parallel:.1f} logins/s on {options["threads"]} threads'
+            )
+        
+        suggested = int(options['target_ms'] / 1000 / per_iteration)
+        self.stdout.write(
+            f'~{options["target_ms"]:g} ms per hash: '
+            f'PASSWORD_HASH_ITERATIONS={suggested}'
+        )
+    
+    def _best_hash_time(self, hasher, iterations, repeat):
+        salt = hasher.salt()
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            hasher.encode(self.PASSWORD, salt, iterations)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        return best
+    
+    def _parallel_rate(self, hasher, iterations, threads):
+        """Hashes per second with threads hashing at once (hashlib releases the GIL)"""
+        salt = hasher.salt()
+        count = threads * 2
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            start = time.perf_counter()
+            list(pool.map(
+                lambda _: hasher.encode(self.PASSWORD, salt, iterations), range(count)
+            ))
+            return count / (time.perf_counter() - start)
@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models.functions import Lower
 from django.contrib.auth.models import AbstractUser
 
 # Create your models here.
@@ -18,6 +19,10 @@ class User(AbstractUser):
         verbose_name = "User"
         verbose_name_plural = "Users"
         ordering = ['email']
+        indexes = [
+            # Case-insensitive email prefix search of GET /api/email-check/
+            models.Index(Lower('email'), name='user_email_lower_idx'),
+        ]
     
     def __str__(self):
         return f"{self.fullname} ({self.email})"
\ No newline at end of file
@@ -0,0 +1,29 @@
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from rest_framework.authtoken.models import Token
+
+from auth_app.authentication import evict_token, evict_user_tokens
+from auth_app.backends import forget_unknown_email
+
+User = get_user_model()
+
+
+@receiver(post_delete, sender=Token)
+def evict_deleted_token(sender, instance, **kwargs):
+    """Token revoked (also runs when the user is deleted)"""
+    evict_token(instance.key)
+
+
+@receiver(post_save, sender=User)
+def evict_saved_user_tokens(sender, instance, created, **kwargs):
+    """is_active or profile data may have changed"""
+    if not created:
+        evict_user_tokens(instance.pk)
+
+
+@receiver(post_save, sender=User)
+def forget_saved_user_email(sender, instance, **kwargs):
+    """Registration or an email change may use a cached unknown email"""
+    forget_unknown_email(instance.email)
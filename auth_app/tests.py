@@ -1,3 +1,184 @@
-from django.test import TestCase
+from asgiref.sync import sync_to_async
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
 
-# Create your tests here.
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIRequestFactory, APITestCase
+
+from auth_app.api.views import AsyncLoginView, AsyncRegistrationView, LoginView
+from auth_app.authentication import token_cache
+from auth_app.backends import unknown_email_cache
+from core.cache import InvalidatedCache
+
+User = get_user_model()
+
+
+class CachedTokenAuthenticationTests(APITestCase):
+    """
+    Token lookups are cached and evicted on revocation
+    """
+    
+    def setUp(self):
+        token_cache.clear()
+        self.user = User.objects.create_user(
+            username='user@example.com', email='user@example.com',
+            fullname='User', password='secret-pass-123'
+        )
+        self.token = Token.objects.create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
+        self.url = reverse('tasks-assigned-to-me')
+    
+    def get(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.url)
+        token_queries = [
+            query for query in context.captured_queries
+            if 'authtoken_token' in query['sql']
+        ]
+        return response, len(token_queries)
+    
+    def test_token_lookup_is_cached(self):
+        response, queries = self.get()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(queries, 1)
+        response, queries = self.get()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(queries, 0)
+    
+    def test_deleted_token_is_rejected(self):
+        self.get()
+        self.token.delete()
+        response, _ = self.get()
+        self.assertEqual(response.status_code, 401)
+    
+    def test_inactive_user_is_rejected(self):
+        self.get()
+        self.user.is_active = False
+        self.user.save()
+        response, _ = self.get()
+        self.assertEqual(response.status_code, 401)
+    
+    def test_deleted_user_is_rejected(self):
+        self.get()
+        response = self.client.delete(reverse('user-delete', args=[self.user.id]))
+        self.assertEqual(response.status_code, 204)
+        response, _ = self.get()
+        self.assertEqual(response.status_code, 401)
+    
+    def test_shared_cache_sees_revocations_of_other_processes(self):
+        shared = InvalidatedCache('auth-token', cache_alias='default')
+        other_process = InvalidatedCache('auth-token', cache_alias='default')
+        shared.set(self.token.key, (self.user, self.token))
+        other_process.invalidate([self.token.key])
+        self.assertIsNone(shared.get(self.token.key))
+
+
+class LoginTests(APITestCase):
+    """
+    POST /api/login/ through EmailBackend
+    """
+    
+    def setUp(self):
+        unknown_email_cache.clear()
+        self.user = User.objects.create_user(
+            username='user@example.com', email='user@example.com',
+            fullname='User', password='secret-pass-123'
+        )
+        self.url = reverse('login')
+    
+    def login(self, email, password='secret-pass-123'):
+        return self.client.post(
+            self.url, {'email': email, 'password': password}, format='json'
+        )
+    
+    def test_user_and_token_in_one_query(self):
+        response = self.login('user@example.com')
+        self.assertEqual(response.status_code, 200)
+        token = Token.objects.get(user=self.user)
+        self.assertEqual(response.data['token'], token.key)
+        
+        with self.assertNumQueries(1):
+            response = self.login('user@example.com')
+        self.assertEqual(response.data['token'], token.key)
+        self.assertEqual(response.data['user_id'], self.user.id)
+    
+    def test_invalid_credentials(self):
+        self.assertEqual(self.login('user@example.com', 'wrong-pass').status_code, 400)
+        self.user.is_active = False
+        self.user.save()
+        self.assertEqual(self.login('user@example.com').status_code, 400)
+    
+    def test_unknown_emails_are_cached_until_registration(self):
+        self.assertEqual(self.login('new@example.com').status_code, 400)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.login('new@example.com').status_code, 400)
+        
+        response = self.client.post(reverse('registration'), {
+            'fullname': 'New', 'email': 'new@example.com',
+            'password': 'secret-pass-123', 'repeated_password': 'secret-pass-123',
+        }, format='json')
+        self.assertEqual(response.status_code, 201)
+        token = response.data['token']
+        response = self.login('new@example.com')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['token'], token)
+
+
+@override_settings(PASSWORD_HASH_ITERATIONS=1000)
+class PasswordHashingTests(APITestCase):
+    """
+    Configurable work factor, rehash on login and the async auth views
+    """
+    
+    def setUp(self):
+        unknown_email_cache.clear()
+        self.user = User.objects.create_user(
+            username='user@example.com', email='user@example.com',
+            fullname='User', password='secret-pass-123'
+        )
+        self.credentials = {'email': 'user@example.com', 'password': 'secret-pass-123'}
+    
+    def post(self, view, data):
+        request = APIRequestFactory().post('/', data, format='json')
+        return view.as_view()(request)
+    
+    def test_rehash_on_login(self):
+        self.assertTrue(self.user.password.startswith('pbkdf2_sha256$1000$'))
+        with self.settings(PASSWORD_HASH_ITERATIONS=2000):
+            response = self.client.post(
+                reverse('login'), self.credentials, format='json'
+            )
+        self.assertEqual(response.status_code, 200)
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.password.startswith('pbkdf2_sha256$2000$'))
+        self.assertTrue(self.user.check_password('secret-pass-123'))
+    
+    async def test_async_login(self):
+        expected = await sync_to_async(self.post)(LoginView, self.credentials)
+        with self.settings(PASSWORD_HASH_ITERATIONS=2000):
+            response = await self.post(AsyncLoginView, self.credentials)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, expected.data)
+        await self.user.arefresh_from_db()
+        self.assertTrue(self.user.password.startswith('pbkdf2_sha256$2000$'))
+        
+        for data in [{**self.credentials, 'password': 'wrong-pass'}, {'email': 'x'}]:
+            expected = await sync_to_async(self.post)(LoginView, data)
+            response = await self.post(AsyncLoginView, data)
+            self.assertEqual(response.status_code, 400)
+            self.assertEqual(response.data, expected.data)
+    
+    async def test_async_registration(self):
+        response = await self.post(AsyncRegistrationView, {
+            'fullname': 'New', 'email': 'new@EXAMPLE.com',
+            'password': 'secret-pass-123', 'repeated_password': 'secret-pass-123',
+        })
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data['email'], 'new@example.com')
+        response = await self.post(AsyncLoginView, {
+            'email': 'new@example.com', 'password': 'secret-pass-123'
+        })
+        self.assertEqual(response.status_code, 200)
@@ -1,17 +1,16 @@
 from rest_framework.permissions import BasePermission
 
+from boards_app.membership import BoardMembership
+
 class IsBoardMemberOrOwner(BasePermission):
     """
     Permission: Only board members or owner
     """
     
     def has_object_permission(self, request, view, obj):
-        # Board owner always has access
-        if obj.owner == request.user:
-            return True
-        
-        # Board members have access
-        return obj.members.filter(id=request.user.id).exists()
+        # Board owner and members have access
+        membership = BoardMembership.for_request(request)
+        return membership.is_member_or_owner(obj, request.user.id)
 
 class IsBoardOwner(BasePermission):
     """
@@ -19,5 +18,5 @@ class IsBoardOwner(BasePermission):
     """
     
     def has_object_permission(self, request, view, obj):
-        return obj.owner == request.user
+        return obj.owner_id == request.user.id
     
@@ -3,10 +3,15 @@ from django.contrib.auth import get_user_model
 from rest_framework import serializers
 
 from auth_app.api.serializers import UserSerializer
+from boards_app.members import add_members, existing_user_ids, set_members
 from boards_app.models import Board
+from core.fast_serializers import ValuesSerializer
 
 User = get_user_model()
 
+# Largest id a bigint primary key holds, larger values overflow the query
+MAX_ID = 2**63 - 1
+
 class BoardListSerializer(serializers.ModelSerializer):
     """
     Serializer for board list (GET /api/boards/)
@@ -15,19 +20,39 @@ class BoardListSerializer(serializers.ModelSerializer):
     ticket_count = serializers.IntegerField(read_only=True) 
     tasks_to_do_count = serializers.IntegerField(read_only=True)
     tasks_high_prio_count = serializers.IntegerField(read_only=True)
-    owner_id = serializers.IntegerField(source='owner.id', read_only=True)
+    owner_id = serializers.IntegerField(read_only=True)
     
     class Meta:
         model = Board
         fields = ['id', 'title', 'member_count', 'ticket_count', 'tasks_to_do_count', 
                  'tasks_high_prio_count', 'owner_id']
 
+class BoardListValuesSerializer(ValuesSerializer):
+    """
+    Fast read-only equivalent of BoardListSerializer for values() rows
+    
+    Expects a queryset annotated with Board.objects.with_counts().
+    """
+    value_fields = ['id', 'title', 'annotated_member_count', 'ticket_count',
+                    'tasks_to_do_count', 'tasks_high_prio_count', 'owner_id']
+    
+    def to_representation(self, row):
+        return {
+            'id': row['id'],
+            'title': row['title'],
+            'member_count': row['annotated_member_count'],
+            'ticket_count': row['ticket_count'],
+            'tasks_to_do_count': row['tasks_to_do_count'],
+            'tasks_high_prio_count': row['tasks_high_prio_count'],
+            'owner_id': row['owner_id'],
+        }
+
 class BoardDetailSerializer(serializers.ModelSerializer):
     """
     Serializer for board details (GET /api/boards/{id}/)
     """
     members = UserSerializer(many=True, read_only=True)
-    owner_id = serializers.IntegerField(source='owner.id', read_only=True)
+    owner_id = serializers.IntegerField(read_only=True)
     tasks = serializers.SerializerMethodField()
     
     class Meta:
@@ -35,17 +60,34 @@ class BoardDetailSerializer(serializers.ModelSerializer):
         fields = ['id', 'title', 'owner_id', 'members', 'tasks']
     
     def get_tasks(self, obj):
-        """Tasks with details for board"""
-        from tasks_app.api.serializers import TaskSerializer
-        tasks = obj.tasks.all()
-        return TaskSerializer(tasks, many=True).data
+        """Tasks with details for board, read as values() rows"""
+        from tasks_app.api.serializers import TaskValuesSerializer
+        task_serializer = self.context.get('task_serializer') or TaskValuesSerializer()
+        return task_serializer.serialize(obj.tasks.all())
+
+def update_board(instance, validated_data):
+    """
+    Save the title only if it changed, write only the member difference
+    (unknown member ids are ignored)
+    """
+    members_ids = validated_data.pop('members', None)
+    
+    title = validated_data.get('title', instance.title)
+    if title != instance.title:
+        instance.title = title
+        instance.save(update_fields=['title', 'updated_at'])
+    
+    if members_ids is not None:
+        set_members(instance, existing_user_ids(members_ids))
+    
+    return instance
 
 class BoardCreateUpdateSerializer(serializers.ModelSerializer):
     """
     Serializer for board creation and updating
     """
     members = serializers.ListField(
-        child=serializers.IntegerField(),
+        child=serializers.IntegerField(min_value=1, max_value=MAX_ID),
         write_only=True,
         required=False
     )
@@ -70,27 +112,15 @@ class BoardCreateUpdateSerializer(serializers.ModelSerializer):
         
         board = Board.objects.create(**validated_data)
         
-        # Add members
+        # Add members, unknown ids are ignored
         if members_ids:
-            members = User.objects.filter(id__in=members_ids)
-            board.members.set(members)
+            add_members(board, existing_user_ids(members_ids))
         
         return board
     
     def update(self, instance, validated_data):
         """Update board"""
-        members_ids = validated_data.pop('members', None)
-        
-        # Update title
-        instance.title = validated_data.get('title', instance.title)
-        instance.save()
-        
-        # Update members
-        if members_ids is not None:
-            members = User.objects.filter(id__in=members_ids)
-            instance.members.set(members)
-        
-        return instance
+        return update_board(instance, validated_data)
 
 
 class BoardUpdateSerializer(serializers.ModelSerializer):
@@ -98,7 +128,7 @@ class BoardUpdateSerializer(serializers.ModelSerializer):
     Serializer for board updates (PATCH/PUT) with complete user data
     """
     members = serializers.ListField(
-        child=serializers.IntegerField(),
+        child=serializers.IntegerField(min_value=1, max_value=MAX_ID),
         write_only=True,
         required=False
     )
@@ -111,15 +141,24 @@ class BoardUpdateSerializer(serializers.ModelSerializer):
     
     def update(self, instance, validated_data):
         """Update board"""
-        members_ids = validated_data.pop('members', None)
-        
-        # Update title
-        instance.title = validated_data.get('title', instance.title)
-        instance.save()
-        
-        # Update members
-        if members_ids is not None:
-            members = User.objects.filter(id__in=members_ids)
-            instance.members.set(members)
-        
-        return instance
+        return update_board(instance, validated_data)
+
+
+class BoardMembersSerializer(serializers.Serializer):
+    """
+    User ids for POST /api/boards/{id}/members/add/ and .../remove/
+    """
+    members = serializers.ListField(
+        child=serializers.IntegerField(min_value=1, max_value=MAX_ID),
+        allow_empty=False,
+        max_length=1000
+    )
+    
+    def validate_members(self, value):
+        if self.context.get('require_existing'):
+            unknown = set(value) - existing_user_ids(value)
+            if unknown:
+                raise serializers.ValidationError(
+                    f'Unknown user ids: {", ".join(map(str, sorted(unknown)))}'
+                )
+        return value
@@ -1,13 +1,19 @@
+from django.conf import settings
 from django.urls import path, include
 
 from rest_framework.routers import DefaultRouter
 
-from .views import BoardViewSet, EmailCheckView
+from .views import AsyncBoardViewSet, BoardEventsView, BoardViewSet, EmailCheckView
 
 router = DefaultRouter()
-router.register(r'boards', BoardViewSet, basename='boards')
+router.register(
+    r'boards',
+    AsyncBoardViewSet if settings.ASYNC_READ_VIEWS else BoardViewSet,
+    basename='boards'
+)
 
 urlpatterns = [
+    path('boards/<int:pk>/events/', BoardEventsView.as_view(), name='board-events'),
     path('', include(router.urls)),
     path('email-check/', EmailCheckView.as_view(), name='email-check'),
 ]
@@ -1,21 +1,51 @@
+import asyncio
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.db import models
 from django.core.exceptions import PermissionDenied
+from django.db.models import Prefetch, prefetch_related_objects
+from django.db.models.functions import Lower
+from django.http import JsonResponse, StreamingHttpResponse
 from django.shortcuts import get_object_or_404
+from django.views import View
 
-from rest_framework import status
+from rest_framework import exceptions, status
+from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.request import Request
 from rest_framework.response import Response
+from rest_framework.settings import api_settings
 from rest_framework.views import APIView
 from rest_framework.viewsets import ModelViewSet
 
-from auth_app.api.serializers import UserSerializer
+from auth_app.api.serializers import UserSerializer, UserValuesSerializer
+from core.async_views import AsyncViewSetMixin
+from core.conditional import make_etag, not_modified_response, set_etag
+from core.db import release_connections
+from core.events import format_event, get_broker
+from core.pagination import NewestFirstPagination
+from core.streaming import (
+    NDJSONRenderer,
+    aiter_row_chunks,
+    astream_object_with_rows,
+    get_stream_format,
+    iter_rows,
+    stream_object_with_rows
+)
+from boards_app.members import add_members, remove_members
+from boards_app.membership import BoardMembership
 from boards_app.models import Board
+from tasks_app import changes
+from tasks_app.api.serializers import CommentChangeSerializer, TaskValuesSerializer
+from tasks_app.models import Comment, Task
 from .serializers import (
     BoardListSerializer, 
+    BoardListValuesSerializer,
     BoardDetailSerializer, 
     BoardCreateUpdateSerializer,
-    BoardUpdateSerializer
+    BoardUpdateSerializer,
+    BoardMembersSerializer
 )
 from .permissions import IsBoardMemberOrOwner, IsBoardOwner
 
@@ -26,6 +56,9 @@ class BoardViewSet(ModelViewSet):
     ViewSet for Board CRUD operations
     """
     permission_classes = [IsAuthenticated]
+    pagination_class = NewestFirstPagination
+    renderer_classes = [*api_settings.DEFAULT_RENDERER_CLASSES, NDJSONRenderer]
+    max_changes = 1000
     
     def get_serializer_class(self):
         """Different serializer per action"""
@@ -39,7 +72,8 @@ class BoardViewSet(ModelViewSet):
     
     def get_permissions(self):
         """Different permissions per action"""
-        if self.action in ['retrieve', 'update', 'partial_update']:
+        if self.action in ['retrieve', 'changes', 'update', 'partial_update',
+                           'add_members', 'remove_members']:
             permission_classes = [IsAuthenticated, IsBoardMemberOrOwner]
         elif self.action == 'destroy':
             permission_classes = [IsAuthenticated, IsBoardOwner]
@@ -50,39 +84,288 @@ class BoardViewSet(ModelViewSet):
     
     def get_queryset(self):
         """Only boards user is allowed to see"""
-        #print(f"get_queryset called for user: {self.request.user}")  # Debug
-        user = self.request.user
-        return Board.objects.filter(
-            models.Q(owner=user) | models.Q(members=user)
-        ).distinct()
+        queryset = Board.objects.visible_to(self.request.user)
+        if self.action == 'list':
+            # Member count in the same query, task counters are stored
+            queryset = queryset.with_counts()
+        return queryset
+    
+    def list(self, request, *args, **kwargs):
+        """Board list built from values() rows"""
+        serializer = BoardListValuesSerializer()
+        boards = serializer.prepare(self.get_queryset(), 'created_at')
+        page = self.paginate_queryset(boards)
+        if page is not None:
+            return self.get_paginated_response(serializer.serialize_rows(page))
+        return Response(serializer.serialize_rows(boards))
+    
+    def retrieve(self, request, *args, **kwargs):
+        """
+        Board details, the task list is streamed with ?stream=1 and
+        limited to some task fields with ?task_fields=id,title
+        
+        Answers 304 from the board row alone when the client's ETag is
+        current. Task and comment writes bump Board.updated_at.
+        """
+        stream_format = get_stream_format(request)
+        task_serializer = TaskValuesSerializer.for_request(request, 'task_fields')
+        board = self.get_object()
+        etag = self._get_detail_etag(request, board, stream_format)
+        not_modified = not_modified_response(request, etag)
+        if not_modified is not None:
+            return not_modified
+        
+        prefetch_related_objects([board], self._get_members_prefetch())
+        serializer = BoardDetailSerializer(
+            board, context={'task_serializer': task_serializer}
+        )
+        if not stream_format:
+            return set_etag(Response(serializer.data), etag)
+        
+        serializer.fields.pop('tasks')
+        tasks = iter_rows(task_serializer.prepare(board.tasks.all()), task_serializer)
+        response = StreamingHttpResponse(
+            stream_object_with_rows(serializer.data, 'tasks', tasks),
+            content_type='application/json'
+        )
+        return set_etag(response, etag)
+    
+    def _get_members_prefetch(self):
+        """Members with only the columns UserSerializer outputs"""
+        return Prefetch(
+            'members', queryset=User.objects.only('id', 'email', 'fullname')
+        )
+    
+    def _get_detail_etag(self, request, board, stream_format):
+        return make_etag(
+            request, board.pk, board.updated_at.isoformat(),
+            board.ticket_count, stream_format
+        )
+    
+    @action(detail=True, methods=['get'])
+    def changes(self, request, pk=None):
+        """
+        GET /api/boards/{id}/changes/?since=<cursor>
+        Tasks and comments written after the cursor, deletes as ids
+        
+        since=0 returns the whole board. Clients pass the returned cursor
+        on the next call and repeat right away while has_more is true.
+        """
+        board = self.get_object()
+        since = request.query_params.get('since', '')
+        if not (since.isascii() and since.isdigit()):
+            return Response(
+                {'error': 'since must be a non-negative integer'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        changed, deleted, cursor, has_more = changes.changes_since(
+            board, int(since), self.max_changes
+        )
+        task_serializer = TaskValuesSerializer()
+        comments = Comment.objects.filter(
+            pk__in=changed['comment']
+        ).select_related('author')
+        return Response({
+            'cursor': cursor,
+            'has_more': has_more,
+            'tasks': task_serializer.serialize(
+                Task.objects.filter(pk__in=changed['task'])
+            ),
+            'comments': CommentChangeSerializer(comments, many=True).data,
+            'deleted_tasks': sorted(deleted['task']),
+            'deleted_comments': sorted(deleted['comment']),
+        })
+    
+    @action(detail=True, methods=['post'], url_path='members/add')
+    def add_members(self, request, pk=None):
+        """
+        POST /api/boards/{id}/members/add/ {"members": [user ids]}
+        Adds users without rewriting the member list, 400 for unknown ids
+        """
+        return self._change_members(request, add_members, require_existing=True)
+    
+    @action(detail=True, methods=['post'], url_path='members/remove')
+    def remove_members(self, request, pk=None):
+        """
+        POST /api/boards/{id}/members/remove/ {"members": [user ids]}
+        """
+        return self._change_members(request, remove_members, require_existing=False)
+    
+    def _change_members(self, request, change, require_existing):
+        board = self.get_object()
+        serializer = BoardMembersSerializer(
+            data=request.data, context={'require_existing': require_existing}
+        )
+        serializer.is_valid(raise_exception=True)
+        change(board, serializer.validated_data['members'])
+        return Response({'member_count': board.members.count()})
     
     def get_object(self):
         """Get object and return 403 instead of 404 if no permission"""
         pk = self.kwargs.get('pk')
         
-        # First check if board exists at all
-        try:
-            board = Board.objects.get(pk=pk)
-        except Board.DoesNotExist:
-            # Board doesn't exist - return 404
-            raise get_object_or_404(Board, pk=pk)
+        # First check if board exists at all - 404 otherwise
+        board = get_object_or_404(Board, pk=pk)
         
         # Board exists, check permissions  
-        user = self.request.user
-        if not (board.owner == user or board.members.filter(id=user.id).exists()):
+        membership = BoardMembership.for_request(self.request)
+        if not membership.is_member_or_owner(board, self.request.user.id):
             # Board exists but no permission - return 403
             raise PermissionDenied("You don't have permission to access this board")
         
         return board
 
+class AsyncBoardViewSet(AsyncViewSetMixin, BoardViewSet):
+    """
+    BoardViewSet with async list and retrieve, writes run the sync handlers
+    """
+    
+    async def list(self, request, *args, **kwargs):
+        serializer = BoardListValuesSerializer()
+        boards = serializer.prepare(self.get_queryset(), 'created_at')
+        page = await self.paginator.apaginate_queryset(boards, request, view=self)
+        if page is not None:
+            return self.get_paginated_response(serializer.serialize_rows(page))
+        return Response(serializer.serialize_rows([row async for row in boards]))
+    
+    async def retrieve(self, request, *args, **kwargs):
+        """Same output as BoardDetailSerializer, members and tasks read concurrently"""
+        stream_format = get_stream_format(request)
+        task_serializer = TaskValuesSerializer.for_request(request, 'task_fields')
+        board = await sync_to_async(self.get_object)()
+        etag = self._get_detail_etag(request, board, stream_format)
+        not_modified = not_modified_response(request, etag)
+        if not_modified is not None:
+            return not_modified
+        
+        data = {'id': board.id, 'title': board.title, 'owner_id': board.owner_id}
+        members = UserValuesSerializer().aserialize(board.members.all())
+        if stream_format:
+            data['members'] = await members
+            tasks = aiter_row_chunks(
+                task_serializer.prepare(board.tasks.all()), task_serializer
+            )
+            response = StreamingHttpResponse(
+                astream_object_with_rows(data, 'tasks', tasks),
+                content_type='application/json'
+            )
+            return set_etag(response, etag)
+        
+        data['members'], data['tasks'] = await asyncio.gather(
+            members, task_serializer.aserialize(board.tasks.all())
+        )
+        return set_etag(Response(data), etag)
+
+class BoardEventsView(View):
+    """
+    GET /api/boards/{id}/events/
+    Server-sent events of task and comment writes on a board
+    
+    Every event has the change log cursor as its id and the task or comment
+    id as data. Clients read the rows from /api/boards/{id}/changes/.
+    A "resync" event means events were missed, the client then catches up
+    with the changes endpoint and reconnects. Needs an ASGI server, idle
+    connections only hold a coroutine waiting on the broker.
+    """
+    
+    async def get(self, request, pk):
+        try:
+            await sync_to_async(self._check_access)(request, pk)
+        except exceptions.APIException as exc:
+            return JsonResponse({'detail': exc.detail}, status=exc.status_code)
+        
+        response = StreamingHttpResponse(
+            self._stream(pk, self._get_last_event_id(request)),
+            content_type='text/event-stream'
+        )
+        response['Cache-Control'] = 'no-cache'
+        # Keep reverse proxies from buffering the stream
+        response['X-Accel-Buffering'] = 'no'
+        return response
+    
+    def _check_access(self, request, pk):
+        """Token authentication and board membership, like the API views"""
+        authenticators = [
+            authentication()
+            for authentication in api_settings.DEFAULT_AUTHENTICATION_CLASSES
+        ]
+        try:
+            user = Request(request, authenticators=authenticators).user
+            if not user.is_authenticated:
+                raise exceptions.NotAuthenticated()
+            
+            board = Board.objects.filter(pk=pk).only('id', 'owner_id').first()
+            if board is None:
+                raise exceptions.NotFound()
+            if not BoardMembership().is_member_or_owner(board, user.id):
+                raise exceptions.PermissionDenied(
+                    "You don't have permission to access this board"
+                )
+        finally:
+            release_connections()
+    
+    def _get_last_event_id(self, request):
+        """Cursor of the last event an automatically reconnecting client saw"""
+        last_event_id = request.headers.get('Last-Event-ID', '')
+        if last_event_id.isascii() and last_event_id.isdigit():
+            return int(last_event_id)
+        return None
+    
+    def _get_missed_events(self, board_id, cursor, limit):
+        try:
+            return changes.events_after(board_id, cursor, limit)
+        finally:
+            release_connections()
+    
+    async def _stream(self, board_id, cursor):
+        options = getattr(settings, 'EVENT_STREAM', {})
+        heartbeat = options.get('HEARTBEAT', 15)
+        broker = get_broker()
+        with broker.subscribe(changes.board_channel(board_id)) as subscription:
+            yield b'retry: 3000\n\n'
+            if cursor is not None:
+                missed, complete = await sync_to_async(self._get_missed_events)(
+                    board_id, cursor, subscription.max_pending
+                )
+                for event in missed:
+                    yield format_event(event['name'], event['data'], event['id'])
+                    cursor = event['id']
+                if not complete:
+                    yield format_event('resync', {'cursor': cursor}, cursor)
+                    return
+            
+            while not subscription.overflowed:
+                event = await subscription.get(timeout=heartbeat)
+                if event is None:
+                    yield b': keep-alive\n\n'
+                elif cursor is None or event['id'] > cursor:
+                    yield format_event(event['name'], event['data'], event['id'])
+                    cursor = event['id']
+            yield format_event('resync', {'cursor': cursor}, cursor)
+
 class EmailCheckView(APIView):
     """
     GET /api/email-check/?email=example@mail.com
     Checks if email exists
+    
+    GET /api/email-check/?prefix=exa[&limit=10]
+    Users whose email starts with prefix (case-insensitive), for autocomplete
+    
+    POST /api/email-check/ {"emails": ["a@mail.com", "b@mail.com"]}
+    Checks many emails at once: {"found": [users], "missing": [emails]}
     """
     permission_classes = [IsAuthenticated]
+    # Shorter prefixes match too many users to be useful
+    MIN_PREFIX_LENGTH = 3
+    DEFAULT_PREFIX_LIMIT = 10
+    MAX_PREFIX_LIMIT = 50
+    MAX_BATCH_SIZE = 100
     
     def get(self, request):
+        if 'prefix' in request.query_params:
+            return self._search_prefix(request)
+        
         email = request.query_params.get('email')
         
         if not email:
@@ -115,4 +398,57 @@ class EmailCheckView(APIView):
             {'error': 'Email not found'}, 
             status=status.HTTP_404_NOT_FOUND
         )
+    
+    def post(self, request):
+        emails = request.data.get('emails') if isinstance(request.data, dict) else None
+        if (not isinstance(emails, list) or len(emails) > self.MAX_BATCH_SIZE
+                or not all(isinstance(email, str) for email in emails)):
+            return Response(
+                {'error': f'emails must be a list of at most '
+                          f'{self.MAX_BATCH_SIZE} strings'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        emails = list(dict.fromkeys(emails))
+        users = {user.email: user for user in User.objects.filter(email__in=emails)}
+        return Response({
+            'found': UserSerializer(
+                [users[email] for email in emails if email in users], many=True
+            ).data,
+            'missing': [email for email in emails if email not in users],
+        }, status=status.HTTP_200_OK)
+    
+    def _search_prefix(self, request):
+        """
+        Range query on lower(email), served by the user_email_lower_idx index
+        (LIKE 'prefix%' can not use it on every database)
+        
+        SQLite's lower() only folds ASCII, non-ASCII prefixes fall back to
+        an unindexed case-insensitive LIKE.
+        """
+        prefix = request.query_params['prefix'].strip()
+        if len(prefix) < self.MIN_PREFIX_LENGTH:
+            return Response(
+                {'error': f'prefix must have at least '
+                          f'{self.MIN_PREFIX_LENGTH} characters'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        try:
+            limit = int(request.query_params.get('limit', self.DEFAULT_PREFIX_LIMIT))
+        except ValueError:
+            limit = self.DEFAULT_PREFIX_LIMIT
+        limit = max(1, min(limit, self.MAX_PREFIX_LIMIT))
+        
+        users = User.objects.annotate(email_lower=Lower('email'))
+        if prefix.isascii():
+            prefix = prefix.lower()
+            # Smallest string greater than every string starting with prefix
+            upper_bound = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+            users = users.filter(email_lower__gte=prefix, email_lower__lt=upper_bound)
+        else:
+            users = users.filter(email__istartswith=prefix)
+        users = users.order_by('email_lower')[:limit]
+        return Response(
+            UserSerializer(users, many=True).data, status=status.HTTP_200_OK
+        )
 
@@ -3,4 +3,8 @@ from django.apps import AppConfig
 
 class BoardsAppConfig(AppConfig):
     name = 'boards_app'
-    verbose_name = 'Boards'
\ No newline at end of file
+    verbose_name = 'Boards'
+    
+    def ready(self):
+        # Register membership cache invalidation
+        from . import signals  # noqa: F401
@@ -0,0 +1,80 @@
+import time
+from io import BytesIO
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Count
+from django.test import override_settings
+
+from boards_app.api.serializers import BoardDetailSerializer
+from boards_app.models import Board
+from core.parsers import JSONParser
+from core.renderers import JSONRenderer, orjson
+from tasks_app.api.serializers import CommentSerializer
+from tasks_app.models import Comment
+
+
+class Command(BaseCommand):
+    """
+    Compare the stdlib and orjson backends on real response payloads
+    
+    Usage: python manage.py bench_json [--board ID] [--repeat 20]
+    Uses the board with the most tasks unless --board is given.
+    """
+    help = "Benchmark JSON rendering and parsing of board detail and comments"
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--board', type=int)
+        parser.add_argument('--repeat', type=int, default=20)
+    
+    def handle(self, *args, **options):
+        if orjson is None:
+            raise CommandError('orjson is not installed, nothing to compare.')
+        
+        board = self._get_board(options['board'])
+        comments = Comment.objects.filter(task__board=board).select_related('author')
+        payloads = [
+            ('board detail', BoardDetailSerializer(board).data),
+            ('comments', CommentSerializer(comments, many=True).data),
+        ]
+        
+        for name, payload in payloads:
+            stdlib = self._measure(payload, 'stdlib', options['repeat'])
+            fast = self._measure(payload, 'auto', options['repeat'])
+            same = stdlib['content'] == fast['content']
+            identical = 'identical' if same else 'DIFFERENT'
+            self.stdout.write(
+                f"{name} ({len(stdlib['content'])} bytes, output {identical}): "
+                f"render stdlib {stdlib['render'] * 1000:.2f} ms / "
+                f"orjson {fast['render'] * 1000:.2f} ms, "
+                f"parse stdlib {stdlib['parse'] * 1000:.2f} ms / "
+                f"orjson {fast['parse'] * 1000:.2f} ms"
+            )
+    
+    def _get_board(self, board_id):
+        boards = Board.objects.all()
+        if board_id is not None:
+            boards = boards.filter(pk=board_id)
+        board = boards.annotate(
+            task_total=Count('tasks')
+        ).order_by('-task_total').first()
+        if board is None:
+            raise CommandError('No board found.')
+        return board
+    
+    def _measure(self, payload, backend, repeat):
+        """Best render and parse times with the given JSON_BACKEND"""
+        render_times, parse_times = [], []
+        with override_settings(JSON_BACKEND=backend):
+            renderer, parser = JSONRenderer(), JSONParser()
+            for _ in range(repeat):
+                start = time.perf_counter()
+                content = renderer.render(payload)
+                rendered = time.perf_counter()
+                parser.parse(BytesIO(content))
+                render_times.append(rendered - start)
+                parse_times.append(time.perf_counter() - rendered)
+        return {
+            'render': min(render_times),
+            'parse': min(parse_times),
+            'content': content,
+        }
@@ -0,0 +1,111 @@
+import asyncio
+import time
+from urllib.parse import urlsplit
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Count
+
+from rest_framework.authtoken.models import Token
+
+from boards_app.models import Board
+
+
+class Command(BaseCommand):
+    """
+    Load test of the read endpoints against a running server
+    
+    Usage: python manage.py load_test_reads --url http://127.0.0.1:8000
+           [--concurrency 50] [--duration 10]
+    Run it once against a server started with ASYNC_READ_VIEWS=0 and once
+    with ASYNC_READ_VIEWS=1 to compare the sync and async views. The server
+    must use the same database: the largest board, its owner's token and
+    its most commented task are picked from it.
+    """
+    help = "Measure throughput and latency percentiles of the read endpoints"
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--url', default='http://127.0.0.1:8000')
+        parser.add_argument('--concurrency', type=int, default=50)
+        parser.add_argument('--duration', type=float, default=10)
+    
+    def handle(self, *args, **options):
+        split = urlsplit(options['url'])
+        self.host, self.port = split.hostname, split.port or 80
+        board = Board.objects.annotate(
+            task_total=Count('tasks')
+        ).order_by('-task_total').first()
+        if board is None:
+            raise CommandError('No board found, seed data first.')
+        task = board.tasks.order_by('-comments_count').first()
+        self.token = Token.objects.get_or_create(user=board.owner)[0].key
+        
+        paths = [
+            '/api/tasks/assigned-to-me/?page_size=50',
+            '/api/tasks/reviewing/?page_size=50',
+            '/api/boards/',
+            f'/api/boards/{board.id}/',
+        ]
+        if task is not None:
+            paths.append(f'/api/tasks/{task.id}/comments/')
+        
+        self.stdout.write(
+            f"{options['concurrency']} connections, "
+            f"{options['duration']:g} s per endpoint"
+        )
+        for path in paths:
+            latencies, errors, elapsed = asyncio.run(
+                self._run(path, options['concurrency'], options['duration'])
+            )
+            self._report(path, latencies, errors, elapsed)
+    
+    async def _run(self, path, concurrency, duration):
+        latencies, errors = [], []
+        deadline = time.perf_counter() + duration
+        start = time.perf_counter()
+        await asyncio.gather(*(
+            self._client(path, deadline, latencies, errors)
+            for _ in range(concurrency)
+        ))
+        return latencies, errors, time.perf_counter() - start
+    
+    async def _client(self, path, deadline, latencies, errors):
+        """One keep-alive connection sending requests until the deadline"""
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        request = (
+            f'GET {path} HTTP/1.1\r\nHost: {self.host}\r\n'
+            f'Authorization: Token {self.token}\r\n\r\n'
+        ).encode()
+        try:
+            while time.perf_counter() < deadline:
+                started = time.perf_counter()
+                writer.write(request)
+                status = await self._read_response(reader)
+                latencies.append(time.perf_counter() - started)
+                if status != 200:
+                    errors.append(status)
+        finally:
+            writer.close()
+    
+    async def _read_response(self, reader):
+        head = await reader.readuntil(b'\r\n\r\n')
+        lines = head.decode('latin-1').split('\r\n')
+        headers = dict(
+            line.lower().split(': ', 1) for line in lines[1:] if ': ' in line
+        )
+        if 'content-length' not in headers:
+            raise CommandError(f'Response without Content-Length: {lines[0]}')
+        await reader.readexactly(int(headers['content-length']))
+        return int(lines[0].split()[1])
+    
+    def _report(self, path, latencies, errors, elapsed):
+        latencies.sort()
+        
+        def percentile(value):
+            index = min(len(latencies) - 1, int(len(latencies) * value / 100))
+            return latencies[index] * 1000
+        
+        self.stdout.write(
+            f'{path}: {len(latencies) / elapsed:.0f} req/s, '
+            f'p50 {percentile(50):.1f} ms, p95 {percentile(95):.1f} ms, '
+            f'p99 {percentile(99):.1f} ms, {len(errors)} errors'
+        )
@@ -0,0 +1,66 @@
+"""
+Board member writes by user id.
+
+``board.members.set(users)`` needs the user rows and rewrites the member
+list through the related manager. The functions here work on ids only:
+one ``values_list`` query validates them, one ``bulk_create`` with
+``ignore_conflicts`` adds and one DELETE removes. They send the same
+``m2m_changed`` signals as ``board.members.add/remove``, so the receivers
+in ``boards_app.signals`` and ``tasks_app.signals`` (membership cache,
+``Board.updated_at``, dashboard summaries) run as usual.
+"""
+
+from django.contrib.auth import get_user_model
+from django.db import router, transaction
+from django.db.models.signals import m2m_changed
+
+from boards_app.models import Board
+
+User = get_user_model()
+Membership = Board.members.through
+
+
+def existing_user_ids(user_ids):
+    """The ids of user_ids that belong to a user"""
+    return set(User.objects.filter(id__in=set(user_ids)).values_list('id', flat=True))
+
+
+def _send(board, action, user_ids):
+    m2m_changed.send(
+        sender=Membership, instance=board, action=action, reverse=False,
+        model=User, pk_set=set(user_ids), using=router.db_for_write(Membership),
+    )
+
+
+def add_members(board, user_ids):
+    """Add existing users by id, members already on the board are skipped"""
+    user_ids = set(user_ids)
+    if not user_ids:
+        return
+    with transaction.atomic():
+        _send(board, 'pre_add', user_ids)
+        Membership.objects.bulk_create([
+            Membership(board_id=board.pk, user_id=user_id) for user_id in user_ids
+        ], ignore_conflicts=True)
+        _send(board, 'post_add', user_ids)
+
+
+def remove_members(board, user_ids):
+    user_ids = set(user_ids)
+    if not user_ids:
+        return
+    with transaction.atomic():
+        _send(board, 'pre_remove', user_ids)
+        Membership.objects.filter(board_id=board.pk, user_id__in=user_ids).delete()
+        _send(board, 'post_remove', user_ids)
+
+
+def set_members(board, user_ids):
+    """Replace the members, only the difference to the stored ids is written"""
+    user_ids = set(user_ids)
+    current = set(
+        Membership.objects.filter(board_id=board.pk).values_list('user_id', flat=True)
+    )
+    with transaction.atomic():
+        remove_members(board, current - user_ids)
+        add_members(board, user_ids - current)
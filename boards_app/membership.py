@@ -0,0 +1,164 @@
+"""
+Board membership resolution shared by permissions, views and serializers.
+
+A board's owner and member ids are resolved in three steps: a memo on the
+current request, a cross-request cache and finally one query on the
+members through table. The cross-request cache is Django's cache
+framework when ``BOARD_MEMBERSHIP_CACHE['CACHE_ALIAS']`` is set, so an
+invalidation reaches every process. Without it a process-local LRU cache
+keeps entries for ``LOCAL_TIMEOUT`` seconds only: other processes do not
+see its invalidations, a removed member keeps access at most that long.
+Signal handlers in ``boards_app.signals`` invalidate cached entries when
+``Board.owner`` or ``Board.members`` change.
+"""
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+from boards_app.models import Board
+from core.cache import LRUCache
+
+
+class MembershipCache:
+    """
+    Cross-request cache of board_id -> (owner_id, frozenset(member_ids))
+    """
+    key_prefix = 'board-membership'
+    
+    def __init__(self, max_size=10000, timeout=300, cache_alias=None, local_timeout=5):
+        self.timeout = timeout
+        self.cache_alias = cache_alias
+        self._local = LRUCache(max_size=max_size, timeout=local_timeout)
+    
+    @classmethod
+    def from_settings(cls):
+        """Build the cache from the BOARD_MEMBERSHIP_CACHE setting"""
+        options = getattr(settings, 'BOARD_MEMBERSHIP_CACHE', {})
+        return cls(
+            max_size=options.get('MAX_SIZE', 10000),
+            timeout=options.get('TIMEOUT', 300),
+            cache_alias=options.get('CACHE_ALIAS'),
+            local_timeout=options.get('LOCAL_TIMEOUT', 5),
+        )
+    
+    @property
+    def shared(self):
+        """Optional Django cache shared between processes"""
+        if self.cache_alias is None:
+            return None
+        return caches[self.cache_alias]
+    
+    def get(self, board_id):
+        if self.shared is not None:
+            return self.shared.get(self._key(board_id))
+        return self._local.get(board_id)
+    
+    def set(self, board_id, entry):
+        if self.shared is not None:
+            self.shared.set(self._key(board_id), entry, self.timeout)
+        else:
+            self._local.set(board_id, entry)
+    
+    def invalidate(self, board_id):
+        """Drop the entry now and again once the transaction commits"""
+        self._delete(board_id)
+        transaction.on_commit(lambda: self._delete(board_id))
+    
+    def clear(self):
+        """Drop the process-local entries (tests), the shared cache is left alone"""
+        self._local.clear()
+    
+    def _delete(self, board_id):
+        if self.shared is not None:
+            self.shared.delete(self._key(board_id))
+        else:
+            self._local.delete(board_id)
+    
+    def _key(self, board_id):
+        return f'{self.key_prefix}:{board_id}'
+
+
+membership_cache = MembershipCache.from_settings()
+
+
+class BoardMembership:
+    """
+    Memoized (owner_id, member_ids) lookup per board
+    """
+    request_attribute = '_board_membership'
+    
+    def __init__(self, cache=None):
+        self.cache = cache if cache is not None else membership_cache
+        self._boards = {}
+    
+    @classmethod
+    def for_request(cls, request):
+        """Return the membership cache bound to this request"""
+        if request is None:
+            return cls()
+        
+        membership = getattr(request, cls.request_attribute, None)
+        if membership is None:
+            membership = cls()
+            setattr(request, cls.request_attribute, membership)
+        return membership
+    
+    def resolve(self, board):
+        """Owner id and frozenset of member ids of the board"""
+        if board.pk not in self._boards:
+            entry = self.cache.get(board.pk)
+            if entry is None:
+                entry = (board.owner_id, self._load_member_ids(board))
+                self.cache.set(board.pk, entry)
+            self._boards[board.pk] = entry
+        return self._boards[board.pk]
+    
+    def prefetch(self, boards):
+        """Resolve many boards with at most one through-table query"""
+        missing = {}
+        for board in boards:
+            if board.pk in self._boards:
+                continue
+            entry = self.cache.get(board.pk)
+            if entry is None:
+                missing[board.pk] = board
+            else:
+                self._boards[board.pk] = entry
+        
+        if not missing:
+            return
+        
+        member_ids = {board_id: set() for board_id in missing}
+        rows = Board.members.through.objects.filter(
+            board_id__in=missing
+        ).values_list('board_id', 'user_id')
+        for board_id, user_id in rows:
+            member_ids[board_id].add(user_id)
+        
+        for board_id, board in missing.items():
+            entry = (board.owner_id, frozenset(member_ids[board_id]))
+            self.cache.set(board_id, entry)
+            self._boards[board_id] = entry
+    
+    def member_ids(self, board):
+        """Ids of all users with access to the board, owner included"""
+        owner_id, member_ids = self.resolve(board)
+        return member_ids | {owner_id}
+    
+    def is_member_or_owner(self, board, user_id):
+        """Check whether the user is the owner or a member of the board"""
+        owner_id, member_ids = self.resolve(board)
+        return user_id == owner_id or user_id in member_ids
+    
+    def _load_member_ids(self, board):
+        """Member ids from prefetched members or a single through-table query"""
+        prefetched = getattr(board, '_prefetched_objects_cache', {})
+        if 'members' in prefetched:
+            return frozenset(member.id for member in prefetched['members'])
+        
+        return frozenset(
+            Board.members.through.objects.filter(
+                board_id=board.pk
+            ).values_list('user_id', flat=True)
+        )
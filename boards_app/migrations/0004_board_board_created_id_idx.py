@@ -0,0 +1,17 @@
+# Generated by Django 6.0.2 on 2026-10-18 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards_app', '0003_alter_board_created_at_alter_board_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='board',
+            index=models.Index(fields=['-created_at', '-id'], name='board_created_id_idx'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 6.0.2 on 2026-10-18 10:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards_app', '0004_board_board_created_id_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='board',
+            name='ticket_count',
+            field=models.IntegerField(default=0, editable=False, verbose_name='Ticket Count'),
+        ),
+        migrations.AddField(
+            model_name='board',
+            name='tasks_to_do_count',
+            field=models.IntegerField(default=0, editable=False, verbose_name='To-Do Tasks'),
+        ),
+        migrations.AddField(
+            model_name='board',
+            name='tasks_high_prio_count',
+            field=models.IntegerField(default=0, editable=False, verbose_name='High-Priority Tasks'),
+        ),
+    ]
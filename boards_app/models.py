@@ -1,11 +1,33 @@
 from django.db import models
+from django.db.models import OuterRef, Q
 from django.contrib.auth import get_user_model
 
+from core.db import count_subquery
+
 # Create your models here.
 
 
 User = get_user_model()
 
+class BoardQuerySet(models.QuerySet):
+    """
+    QuerySet with helpers for board list endpoints
+    """
+    
+    def visible_to(self, user):
+        """Boards owned by the user or where the user is a member"""
+        member_board_ids = Board.members.through.objects.filter(
+            user_id=user.id
+        ).values('board_id')
+        return self.filter(Q(owner=user) | Q(id__in=member_board_ids))
+    
+    def with_counts(self):
+        """Annotate the member count (task counters are stored columns)"""
+        members = Board.members.through.objects.filter(board_id=OuterRef('pk'))
+        return self.annotate(
+            annotated_member_count=count_subquery(members, 'board_id'),
+        )
+
 class Board(models.Model):
     """
     Board Model for Kanban boards
@@ -23,33 +45,35 @@ class Board(models.Model):
         blank=True,
         verbose_name="Members"
     )
+    # Denormalized task counters, maintained by tasks_app.counters
+    ticket_count = models.IntegerField(
+        default=0, editable=False, verbose_name="Ticket Count"
+    )
+    tasks_to_do_count = models.IntegerField(
+        default=0, editable=False, verbose_name="To-Do Tasks"
+    )
+    tasks_high_prio_count = models.IntegerField(
+        default=0, editable=False, verbose_name="High-Priority Tasks"
+    )
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="Created At")
     updated_at = models.DateTimeField(auto_now=True, verbose_name="Updated At")
     
+    objects = BoardQuerySet.as_manager()
+    
     class Meta:
         verbose_name = "Board"
         verbose_name_plural = "Boards"
         ordering = ['-created_at']
+        indexes = [
+            # Keyset pagination of the board list
+            models.Index(fields=['-created_at', '-id'], name='board_created_id_idx'),
+        ]
     
     def __str__(self):
         return self.title
     
     @property
     def member_count(self):
-        """Number of members"""
-        return self.members.count()
-    
-    @property
-    def ticket_count(self):
-        """Total number of tasks"""
-        return self.tasks.count()
-    
-    @property
-    def tasks_to_do_count(self):
-        """Number of to-do tasks"""
-        return self.tasks.filter(status='to-do').count()
-    
-    @property
-    def tasks_high_prio_count(self):
-        """Number of high-priority tasks"""
-        return self.tasks.filter(priority='high').count()
+        """Number of members (annotated by with_counts() if present)"""
+        value = getattr(self, 'annotated_member_count', None)
+        return value if value is not None else self.members.count()
@@ -0,0 +1,64 @@
+from django.contrib.auth import get_user_model
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+from django.utils import timezone
+
+from boards_app.membership import membership_cache
+from boards_app.models import Board
+
+User = get_user_model()
+
+
+def touch_boards(boards):
+    """Bump updated_at, the member list is part of the board detail"""
+    boards.update(updated_at=timezone.now())
+
+
+@receiver(m2m_changed, sender=Board.members.through)
+def invalidate_membership_on_members_change(sender, instance, action, reverse,
+                                            pk_set, **kwargs):
+    """Members were added, removed or cleared"""
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    
+    if not reverse:
+        membership_cache.invalidate(instance.pk)
+        touch_boards(Board.objects.filter(pk=instance.pk))
+    elif pk_set:
+        # user.board_memberships.add/remove(...): pk_set holds board ids
+        for board_id in pk_set:
+            membership_cache.invalidate(board_id)
+        touch_boards(Board.objects.filter(pk__in=pk_set))
+    else:
+        # user.board_memberships.clear(): boards read in pre_clear
+        for board_id in instance.__dict__.pop('_cleared_board_ids', ()):
+            membership_cache.invalidate(board_id)
+
+
+@receiver(m2m_changed, sender=Board.members.through)
+def touch_boards_before_reverse_clear(sender, instance, action, reverse, **kwargs):
+    """Boards are only known before user.board_memberships.clear() runs"""
+    if action == 'pre_clear' and reverse:
+        board_ids = list(
+            Board.objects.filter(members=instance).values_list('id', flat=True)
+        )
+        instance._cleared_board_ids = board_ids
+        touch_boards(Board.objects.filter(pk__in=board_ids))
+
+
+@receiver(post_save, sender=Board)
+@receiver(post_delete, sender=Board)
+def invalidate_membership_on_board_change(sender, instance, **kwargs):
+    """The owner may have changed or the board is gone"""
+    membership_cache.invalidate(instance.pk)
+
+
+@receiver(pre_delete, sender=User)
+def invalidate_membership_on_user_delete(sender, instance, **kwargs):
+    """Cascading deletes of membership rows do not send m2m_changed"""
+    board_ids = list(Board.members.through.objects.filter(
+        user_id=instance.pk
+    ).values_list('board_id', flat=True))
+    for board_id in board_ids:
+        membership_cache.invalidate(board_id)
+    touch_boards(Board.objects.filter(pk__in=board_ids))
@@ -1,3 +1,677 @@
-from django.test import TestCase
+import asyncio
+import json
+from unittest.mock import patch
 
-# Create your tests here.
+from asgiref.sync import sync_to_async
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from rest_framework.authtoken.models import Token
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIRequestFactory, APITestCase, force_authenticate
+
+from boards_app.membership import BoardMembership, MembershipCache, membership_cache
+from boards_app.api.serializers import BoardListSerializer, BoardListValuesSerializer
+from boards_app.api.views import AsyncBoardViewSet, BoardEventsView, BoardViewSet
+from boards_app.models import Board
+from core.events import InMemoryBroker, get_broker
+from tasks_app.models import Task
+
+User = get_user_model()
+
+
+class BoardTestMixin:
+    """
+    Shared fixtures for board API tests
+    """
+    
+    def setUp(self):
+        super().setUp()
+        # Process-global, board ids are reused once a test rolls back
+        membership_cache.clear()
+        self.addCleanup(membership_cache.clear)
+    
+    def create_user(self, email):
+        return User.objects.create_user(
+            username=email, email=email, fullname=email.split('@')[0],
+            password='secret-pass-123'
+        )
+    
+    def create_board(self, owner, title='Board', members=(), tasks=()):
+        board = Board.objects.create(title=title, owner=owner)
+        board.members.set(members)
+        for status, priority in tasks:
+            Task.objects.create(
+                board=board, title='Task', status=status,
+                priority=priority, created_by=owner
+            )
+        return board
+    
+    def count_queries(self, url):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(context.captured_queries), response
+
+
+class BoardListTests(BoardTestMixin, APITestCase):
+    """
+    GET /api/boards/
+    """
+    
+    def setUp(self):
+        super().setUp()
+        self.user = self.create_user('owner@example.com')
+        self.member = self.create_user('member@example.com')
+        self.client.force_authenticate(self.user)
+    
+    def test_counts_are_annotated(self):
+        self.create_board(
+            self.user, members=[self.member],
+            tasks=[('to-do', 'high'), ('to-do', 'low'), ('done', 'high')]
+        )
+        response = self.client.get(reverse('boards-list'))
+        board = response.data[0]
+        self.assertEqual(board['member_count'], 1)
+        self.assertEqual(board['ticket_count'], 3)
+        self.assertEqual(board['tasks_to_do_count'], 2)
+        self.assertEqual(board['tasks_high_prio_count'], 2)
+        self.assertEqual(board['owner_id'], self.user.id)
+    
+    def test_member_boards_are_listed_once(self):
+        other = self.create_user('other@example.com')
+        self.create_board(other, members=[self.user, self.member])
+        response = self.client.get(reverse('boards-list'))
+        self.assertEqual(len(response.data), 1)
+        self.assertEqual(response.data[0]['member_count'], 2)
+    
+    def test_query_count_does_not_grow_with_boards(self):
+        self.create_board(self.user, members=[self.member], tasks=[('to-do', 'high')])
+        baseline, _ = self.count_queries(reverse('boards-list'))
+        for index in range(10):
+            self.create_board(
+                self.user, title=f'Board {index}', members=[self.member],
+                tasks=[('to-do', 'high'), ('review', 'low')]
+            )
+        queries, response = self.count_queries(reverse('boards-list'))
+        self.assertEqual(len(response.data), 11)
+        self.assertEqual(queries, baseline)
+
+
+class BoardDetailTests(BoardTestMixin, APITestCase):
+    """
+    GET /api/boards/{id}/
+    """
+    
+    def setUp(self):
+        super().setUp()
+        self.user = self.create_user('owner@example.com')
+        self.member = self.create_user('member@example.com')
+        self.client.force_authenticate(self.user)
+    
+    def add_tasks(self, board, count):
+        for index in range(count):
+            task = Task.objects.create(
+                board=board, title=f'Task {index}', created_by=self.user,
+                assignee=self.member, reviewer=self.user
+            )
+            task.comments.create(author=self.member, content='Hello')
+    
+    def test_tasks_include_users_and_comment_counts(self):
+        board = self.create_board(self.user, members=[self.member])
+        self.add_tasks(board, 1)
+        response = self.client.get(reverse('boards-detail', args=[board.id]))
+        task = response.data['tasks'][0]
+        self.assertEqual(task['assignee']['email'], self.member.email)
+        self.assertEqual(task['reviewer']['id'], self.user.id)
+        self.assertEqual(task['comments_count'], 1)
+    
+    def test_query_count_does_not_grow_with_tasks(self):
+        board = self.create_board(self.user, members=[self.member])
+        self.add_tasks(board, 1)
+        url = reverse('boards-detail', args=[board.id])
+        membership_cache.clear()
+        baseline, _ = self.count_queries(url)
+        self.add_tasks(board, 10)
+        membership_cache.clear()
+        queries, response = self.count_queries(url)
+        self.assertEqual(len(response.data['tasks']), 11)
+        self.assertEqual(queries, baseline)
+    
+    def test_task_fields(self):
+        board = self.create_board(self.user, members=[self.member])
+        self.add_tasks(board, 2)
+        url = reverse('boards-detail', args=[board.id])
+        response = self.client.get(url + '?task_fields=id,assignee')
+        self.assertEqual(set(response.data['tasks'][0]), {'id', 'assignee'})
+        self.assertEqual(response.data['members'][0]['email'], self.member.email)
+        streamed = self.client.get(url + '?task_fields=id,assignee&stream=1')
+        body = b''.join(streamed.streaming_content)
+        self.assertEqual(json.loads(body), response.data)
+        response = self.client.get(url + '?task_fields=nope')
+        self.assertEqual(response.status_code, 400)
+    
+    def test_stream_with_accept_header(self):
+        board = self.create_board(self.user, members=[self.member])
+        self.add_tasks(board, 2)
+        url = reverse('boards-detail', args=[board.id])
+        response = self.client.get(url)
+        streamed = self.client.get(url, HTTP_ACCEPT='application/x-ndjson')
+        self.assertEqual(streamed.status_code, 200)
+        self.assertTrue(streamed.streaming)
+        body = b''.join(streamed.streaming_content)
+        self.assertEqual(json.loads(body), response.data)
+
+
+class BoardConditionalGetTests(BoardTestMixin, APITestCase):
+    """
+    GET /api/boards/{id}/ with If-None-Match
+    """
+    
+    def setUp(self):
+        super().setUp()
+        self.user = self.create_user('owner@example.com')
+        self.member = self.create_user('member@example.com')
+        self.client.force_authenticate(self.user)
+        self.board = self.create_board(self.user, tasks=[('to-do', 'low')])
+        self.url = reverse('boards-detail', args=[self.board.id])
+    
+    def get(self, etag):
+        return self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+    
+    def assertChanged(self, etag):
+        response = self.get(etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+        return response['ETag']
+    
+    def test_unchanged_board_is_not_modified(self):
+        etag = self.client.get(self.url)['ETag']
+        self.get(etag)  # membership cache is warm
+        with CaptureQueriesContext(connection) as context:
+            response = self.get(etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], etag)
+        self.assertEqual(len(context.captured_queries), 1)
+    
+    def test_child_writes_change_the_etag(self):
+        etag = self.client.get(self.url)['ETag']
+        task = Task.objects.create(
+            board=self.board, title='New', created_by=self.user
+        )
+        etag = self.assertChanged(etag)
+        task.title = 'Renamed'
+        task.save()
+        etag = self.assertChanged(etag)
+        comment = task.comments.create(author=self.user, content='Hello')
+        etag = self.assertChanged(etag)
+        comment.delete()
+        etag = self.assertChanged(etag)
+        self.board.members.add(self.member)
+        etag = self.assertChanged(etag)
+        task.delete()
+        self.assertChanged(etag)
+    
+    def test_representation_is_part_of_the_etag(self):
+        etag = self.client.get(self.url)['ETag']
+        response = self.client.get(
+            f'{self.url}?stream=1', HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, 200)
+    
+    def test_permission_is_checked_first(self):
+        etag = self.client.get(self.url)['ETag']
+        self.client.force_authenticate(self.create_user('other@example.com'))
+        self.assertEqual(self.get(etag).status_code, 403)
+
+
+class MembershipCacheTests(BoardTestMixin, APITestCase):
+    """
+    Cross-request membership cache and its invalidation
+    """
+    
+    def setUp(self):
+        super().setUp()
+        self.owner = self.create_user('owner@example.com')
+        self.member = self.create_user('member@example.com')
+        self.board = self.create_board(self.owner)
+    
+    def resolve(self):
+        board = Board.objects.get(pk=self.board.pk)
+        return BoardMembership().resolve(board)
+    
+    def test_second_lookup_is_served_from_cache(self):
+        self.resolve()
+        with self.assertNumQueries(1):  # only the board itself
+            self.assertEqual(self.resolve(), (self.owner.id, frozenset()))
+    
+    def test_member_changes_invalidate(self):
+        self.resolve()
+        self.board.members.add(self.member)
+        self.assertEqual(self.resolve()[1], frozenset([self.member.id]))
+        self.member.board_memberships.remove(self.board)
+        self.assertEqual(self.resolve()[1], frozenset())
+    
+    def test_owner_change_invalidates(self):
+        self.resolve()
+        self.board.owner = self.member
+        self.board.save()
+        self.assertEqual(self.resolve()[0], self.member.id)
+    
+    def test_user_delete_invalidates(self):
+        self.board.members.add(self.member)
+        self.resolve()
+        self.member.delete()
+        self.assertEqual(self.resolve()[1], frozenset())
+    
+    def test_reverse_clear_invalidates_only_its_boards(self):
+        self.board.members.add(self.member)
+        self.resolve()
+        cache.set('unrelated', 1)
+        self.addCleanup(cache.delete, 'unrelated')
+        self.member.board_memberships.clear()
+        self.assertEqual(self.resolve()[1], frozenset())
+        self.assertEqual(cache.get('unrelated'), 1)
+    
+    def test_shared_cache_sees_invalidations_of_other_processes(self):
+        shared = MembershipCache(cache_alias='default')
+        other_process = MembershipCache(cache_alias='default')
+        shared.set(self.board.pk, (self.owner.id, frozenset([self.member.id])))
+        other_process.invalidate(self.board.pk)
+        self.assertIsNone(shared.get(self.board.pk))
+
+
+class BoardListValuesSerializerTests(BoardTestMixin, APITestCase):
+    """
+    BoardListValuesSerializer renders the same JSON as BoardListSerializer
+    """
+    
+    def test_parity_with_board_list_serializer(self):
+        owner = self.create_user('owner@example.com')
+        member = self.create_user('member@example.com')
+        self.create_board(owner, title='Bøard', members=[member],
+                          tasks=[('to-do', 'high'), ('done', 'low')])
+        self.create_board(owner, title='Empty')
+        
+        boards = Board.objects.with_counts()
+        expected = JSONRenderer().render(BoardListSerializer(boards, many=True).data)
+        actual = JSONRenderer().render(BoardListValuesSerializer().serialize(boards))
+        self.assertEqual(actual, expected)
+
+
+class BoardChangesTests(BoardTestMixin, APITestCase):
+    """
+    GET /api/boards/{id}/changes/?since=<cursor>
+    """
+    
+    def setUp(self):
+        super().setUp()
+        self.user = self.create_user('owner@example.com')
+        self.client.force_authenticate(self.user)
+        self.board = self.create_board(self.user, tasks=[('to-do', 'low')])
+        self.url = reverse('boards-changes', args=[self.board.id])
+    
+    def changes(self, since):
+        response = self.client.get(f'{self.url}?since={since}')
+        self.assertEqual(response.status_code, 200)
+        return response.data
+    
+    def test_full_sync_then_deltas(self):
+        first = self.changes(0)
+        self.assertEqual(len(first['tasks']), 1)
+        self.assertFalse(first['has_more'])
+        
+        task = Task.objects.create(board=self.board, title='New', created_by=self.user)
+        comment = task.comments.create(author=self.user, content='Hello')
+        delta = self.changes(first['cursor'])
+        self.assertEqual([t['id'] for t in delta['tasks']], [task.id])
+        self.assertEqual(delta['tasks'][0]['comments_count'], 1)
+        self.assertEqual(delta['comments'][0]['task_id'], task.id)
+        
+        task_id, comment_id = task.id, comment.id
+        comment.delete()
+        task.delete()
+        delta = self.changes(delta['cursor'])
+        self.assertEqual(delta['tasks'], [])
+        self.assertEqual(delta['deleted_tasks'], [task_id])
+        self.assertEqual(delta['deleted_comments'], [comment_id])
+        self.assertEqual(self.changes(delta['cursor'])['tasks'], [])
+    
+    def test_bulk_writes_are_logged(self):
+        cursor = self.changes(0)['cursor']
+        response = self.client.post(reverse('tasks-bulk'), [
+            {'board': self.board.id, 'title': 'Bulk', 'status': 'to-do',
+             'priority': 'low'},
+        ], format='json')
+        self.assertEqual(response.status_code, 201)
+        delta = self.changes(cursor)
+        self.assertEqual(delta['tasks'][0]['id'], response.data['results'][0]['id'])
+    
+    def test_pages_are_limited(self):
+        for index in range(3):
+            Task.objects.create(
+                board=self.board, title=str(index), created_by=self.user
+            )
+        with patch.object(BoardViewSet, 'max_changes', 2):
+            first = self.changes(0)
+            self.assertTrue(first['has_more'])
+            second = self.changes(first['cursor'])
+        self.assertFalse(second['has_more'])
+        self.assertEqual(len(first['tasks']) + len(second['tasks']), 4)
+    
+    def test_owner_delete_with_tasks(self):
+        other_owner = self.create_user('other@example.com')
+        other_board = self.create_board(other_owner, members=[self.user])
+        task = Task.objects.create(
+            board=self.board, title='Task', created_by=self.user, assignee=self.user
+        )
+        task.comments.create(author=self.user, content='Hello')
+        kept = Task.objects.create(
+            board=other_board, title='Kept', created_by=other_owner, assignee=self.user
+        )
+        kept.comments.create(author=self.user, content='Bye')
+        self.client.force_authenticate(other_owner)
+        cursor = self.client.get(
+            reverse('boards-changes', args=[other_board.id]) + '?since=0'
+        ).data['cursor']
+        
+        self.user.delete()
+        connection.check_constraints()
+        self.assertFalse(Board.objects.filter(pk=self.board.pk).exists())
+        delta = self.client.get(
+            reverse('boards-changes', args=[other_board.id]) + f'?since={cursor}'
+        ).data
+        self.assertEqual([t['id'] for t in delta['tasks']], [kept.id])
+        self.assertEqual(len(delta['deleted_comments']), 1)
+    
+    def test_invalid_cursor_and_outsiders(self):
+        self.assertEqual(self.client.get(f'{self.url}?since=-1').status_code, 400)
+        self.assertEqual(self.client.get(f'{self.url}?since=%C2%B2').status_code, 400)
+        self.client.force_authenticate(self.create_user('other@example.com'))
+        self.assertEqual(self.client.get(f'{self.url}?since=0').status_code, 403)
+
+
+class EventBrokerTests(SimpleTestCase):
+    """
+    In-memory pub/sub behind the board event stream
+    """
+    
+    async def test_publish_from_another_thread(self):
+        broker = InMemoryBroker()
+        with broker.subscribe('board:1') as subscription:
+            await sync_to_async(broker.publish, thread_sensitive=False)(
+                'board:1', [{'id': 1}, {'id': 2}]
+            )
+            self.assertEqual(await subscription.get(timeout=1), {'id': 1})
+            self.assertEqual(await subscription.get(timeout=1), {'id': 2})
+            self.assertIsNone(await subscription.get(timeout=0.01))
+        self.assertEqual(broker.subscriber_count('board:1'), 0)
+    
+    async def test_slow_subscriber_overflows(self):
+        broker = InMemoryBroker(max_pending=2)
+        with broker.subscribe('board:1') as subscription:
+            broker.publish('board:1', [{'id': 1}, {'id': 2}, {'id': 3}])
+            await asyncio.sleep(0)
+            self.assertTrue(subscription.overflowed)
+
+
+class BoardEventsTests(BoardTestMixin, TestCase):
+    """
+    GET /api/boards/{id}/events/
+    """
+    
+    def setUp(self):
+        super().setUp()
+        get_broker.cache_clear()
+        self.user = self.create_user('owner@example.com')
+        self.board = self.create_board(self.user)
+        self.url = reverse('board-events', args=[self.board.id])
+        self.headers = {
+            'Authorization': f'Token {Token.objects.create(user=self.user).key}'
+        }
+    
+    def create_task(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            return Task.objects.create(
+                board=self.board, title='Task', created_by=self.user
+            )
+    
+    async def read_event(self, stream):
+        return await asyncio.wait_for(anext(stream), timeout=2)
+    
+    async def disconnect(self, stream):
+        """The ASGI handler cancels the response task when the client leaves"""
+        pending = asyncio.ensure_future(anext(stream))
+        await asyncio.sleep(0.01)
+        pending.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await pending
+    
+    async def test_task_writes_are_pushed(self):
+        response = await self.async_client.get(self.url, headers=self.headers)
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        stream = aiter(response.streaming_content)
+        self.assertEqual(await self.read_event(stream), b'retry: 3000\n\n')
+        
+        task = await sync_to_async(self.create_task)()
+        event = await self.read_event(stream)
+        self.assertIn(b'event: task.created\n', event)
+        self.assertIn(b'"id":%d' % task.id, event.replace(b' ', b''))
+        await self.disconnect(stream)
+        self.assertEqual(get_broker().subscriber_count(f'board:{self.board.id}'), 0)
+    
+    async def test_reconnect_replays_missed_events(self):
+        first = await sync_to_async(self.create_task)()
+        cursor = await self.board.changes.alast()
+        second = await sync_to_async(self.create_task)()
+        response = await self.async_client.get(
+            self.url, headers={**self.headers, 'Last-Event-ID': str(cursor.id)}
+        )
+        stream = aiter(response.streaming_content)
+        await self.read_event(stream)
+        event = await self.read_event(stream)
+        self.assertIn(b'"id":%d' % second.id, event.replace(b' ', b''))
+        self.assertNotIn(b'"id":%d' % first.id, event.replace(b' ', b''))
+        await self.disconnect(stream)
+    
+    def test_invalid_last_event_id_is_ignored(self):
+        view = BoardEventsView()
+        for value, expected in [('12', 12), ('\u00b2', None), ('-1', None)]:
+            request = APIRequestFactory().get(self.url, HTTP_LAST_EVENT_ID=value)
+            self.assertEqual(view._get_last_event_id(request), expected)
+    
+    async def test_authentication_and_membership(self):
+        response = await self.async_client.get(self.url)
+        self.assertEqual(response.status_code, 401)
+        
+        other = await sync_to_async(self.create_user)('other@example.com')
+        token = await Token.objects.acreate(user=other)
+        response = await self.async_client.get(
+            self.url, headers={'Authorization': f'Token {token.key}'}
+        )
+        self.assertEqual(response.status_code, 403)
+
+
+class AsyncBoardViewSetTests(BoardTestMixin, TestCase):
+    """
+    AsyncBoardViewSet returns the same list and detail as BoardViewSet
+    """
+    
+    def setUp(self):
+        super().setUp()
+        self.user = self.create_user('owner@example.com')
+        member = self.create_user('member@example.com')
+        self.board = self.create_board(
+            self.user, members=[member], tasks=[('to-do', 'high'), ('done', 'low')]
+        )
+        self.create_board(self.user, title='Second')
+    
+    def build_request(self, path, **headers):
+        request = APIRequestFactory().get(path, **headers)
+        force_authenticate(request, self.user)
+        return request
+    
+    async def get_both(self, actions, path, **kwargs):
+        sync_response = await sync_to_async(BoardViewSet.as_view(actions))(
+            self.build_request(path), **kwargs
+        )
+        response = await AsyncBoardViewSet.as_view(actions)(
+            self.build_request(path), **kwargs
+        )
+        if response.streaming:
+            expected = await sync_to_async(b''.join)(sync_response.streaming_content)
+            content = b''.join([chunk async for chunk in response.streaming_content])
+            return expected, content
+        return sync_response.render().content, response.render().content
+    
+    async def test_list(self):
+        for path in ['/', '/?page_size=1', '/?page_size=1&page=2']:
+            expected, content = await self.get_both({'get': 'list'}, path)
+            self.assertEqual(content, expected)
+    
+    async def test_retrieve(self):
+        for path in ['/', '/?stream=1']:
+            expected, content = await self.get_both(
+                {'get': 'retrieve'}, path, pk=self.board.id
+            )
+            self.assertEqual(content, expected)
+    
+    async def test_retrieve_not_modified(self):
+        view = AsyncBoardViewSet.as_view({'get': 'retrieve'})
+        response = await view(self.build_request('/'), pk=self.board.id)
+        request = self.build_request('/', HTTP_IF_NONE_MATCH=response['ETag'])
+        response = await view(request, pk=self.board.id)
+        self.assertEqual(response.status_code, 304)
+
+
+class EmailCheckTests(BoardTestMixin, APITestCase):
+    """
+    Batch and prefix lookups of /api/email-check/
+    """
+    
+    def setUp(self):
+        super().setUp()
+        self.user = self.create_user('anna@example.com')
+        self.other = self.create_user('Anton@Example.com')
+        self.create_user('bert@example.com')
+        self.client.force_authenticate(self.user)
+        self.url = reverse('email-check')
+    
+    def test_batch(self):
+        emails = ['bert@example.com', 'nobody@example.com', 'anna@example.com',
+                  'bert@example.com']
+        with self.assertNumQueries(1):
+            response = self.client.post(self.url, {'emails': emails}, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [user['email'] for user in response.data['found']],
+            ['bert@example.com', 'anna@example.com']
+        )
+        self.assertEqual(response.data['missing'], ['nobody@example.com'])
+        
+        for data in [{'emails': 'anna@example.com'}, {'emails': [1]},
+                     {'emails': ['a@example.com'] * 101}]:
+            response = self.client.post(self.url, data, format='json')
+            self.assertEqual(response.status_code, 400)
+    
+    def test_prefix(self):
+        response = self.client.get(self.url, {'prefix': 'AN'})
+        self.assertEqual(response.status_code, 400)
+        
+        response = self.client.get(self.url, {'prefix': 'ANt'})
+        self.assertEqual([user['id'] for user in response.data], [self.other.id])
+        response = self.client.get(self.url, {'prefix': 'ann', 'limit': 1})
+        self.assertEqual(
+            [user['email'] for user in response.data], ['anna@example.com']
+        )
+        self.assertEqual(self.client.get(self.url, {'prefix': 'xyz'}).data, [])
+    
+    def test_non_ascii_prefix(self):
+        umlaut = self.create_user('Über@example.com')
+        response = self.client.get(self.url, {'prefix': 'Übe'})
+        self.assertEqual([user['id'] for user in response.data], [umlaut.id])
+        for prefix in ['ann\U0010ffff', 'ann\ud7ff']:
+            response = self.client.get(self.url, {'prefix': prefix})
+            self.assertEqual((response.status_code, response.data), (200, []))
+    
+    def test_single_email(self):
+        response = self.client.get(self.url, {'email': 'bert@example.com'})
+        self.assertEqual(response.data['email'], 'bert@example.com')
+        self.assertEqual(
+            self.client.get(self.url, {'email': 'nobody@example.com'}).status_code, 404
+        )
+
+
+class BoardMembersTests(BoardTestMixin, APITestCase):
+    """
+    Member add/remove endpoints and member diffs of board updates
+    """
+    
+    def setUp(self):
+        super().setUp()
+        self.user = self.create_user('owner@example.com')
+        self.member = self.create_user('member@example.com')
+        self.other = self.create_user('other@example.com')
+        self.board = self.create_board(self.user, members=[self.member])
+        self.client.force_authenticate(self.user)
+    
+    def member_ids(self):
+        return set(self.board.members.values_list('id', flat=True))
+    
+    def test_add_and_remove(self):
+        url = reverse('boards-add-members', args=[self.board.id])
+        response = self.client.post(
+            url, {'members': [self.member.id, self.other.id]}, format='json'
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['member_count'], 2)
+        self.assertEqual(self.member_ids(), {self.member.id, self.other.id})
+        
+        response = self.client.post(
+            url, {'members': [self.other.id, 12345]}, format='json'
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('12345', str(response.data['members']))
+        detail = reverse('boards-detail', args=[self.board.id])
+        for user_id in [0, 10**30]:
+            response = self.client.post(url, {'members': [user_id]}, format='json')
+            self.assertEqual(response.status_code, 400)
+            response = self.client.patch(detail, {'members': [user_id]}, format='json')
+            self.assertEqual(response.status_code, 400)
+        
+        # The membership cache was invalidated, the new member has access
+        self.client.force_authenticate(self.other)
+        self.assertEqual(self.client.get(detail).status_code, 200)
+        
+        response = self.client.post(
+            reverse('boards-remove-members', args=[self.board.id]),
+            {'members': [self.other.id]}, format='json'
+        )
+        self.assertEqual(response.data['member_count'], 1)
+        self.assertEqual(self.client.get(detail).status_code, 403)
+    
+    def test_update_writes_only_changes(self):
+        url = reverse('boards-detail', args=[self.board.id])
+        updated_at = Board.objects.get(pk=self.board.pk).updated_at
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.patch(
+                url, {'title': 'Board', 'members': [self.member.id]}, format='json'
+            )
+        self.assertEqual(response.status_code, 200)
+        writes = [
+            query['sql'] for query in context.captured_queries
+            if query['sql'].startswith(('INSERT', 'UPDATE', 'DELETE'))
+        ]
+        self.assertEqual(writes, [])
+        self.assertEqual(Board.objects.get(pk=self.board.pk).updated_at, updated_at)
+        
+        response = self.client.patch(
+            url, {'members': [self.other.id, 12345]}, format='json'
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.member_ids(), {self.other.id})
+        self.assertGreater(Board.objects.get(pk=self.board.pk).updated_at, updated_at)
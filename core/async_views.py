@@ -0,0 +1,56 @@
+"""
+Async dispatch for DRF views and viewsets.
+
+DRF dispatches synchronously. The classes here make ``dispatch`` a
+coroutine: authentication, permission and throttle checks (sync DRF code)
+run in one ``sync_to_async`` call, then the handler is awaited. Handlers
+that are still sync run through ``sync_to_async`` as well, so a view only
+needs async versions of the handlers that benefit (the read endpoints).
+"""
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+
+
+class AsyncDispatchMixin:
+    """
+    Coroutine dispatch for APIView subclasses, mix in before the view class
+    """
+    # Tells Django's View.as_view() to mark the view as a coroutine
+    view_is_async = True
+    
+    async def dispatch(self, request, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+        
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+            handler = self.get_handler(request)
+            if iscoroutinefunction(handler):
+                response = await handler(request, *args, **kwargs)
+            else:
+                response = await sync_to_async(handler)(request, *args, **kwargs)
+        except Exception as exc:
+            response = self.handle_exception(exc)
+        
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+    
+    def get_handler(self, request):
+        method = request.method.lower()
+        if method not in self.http_method_names:
+            return self.http_method_not_allowed
+        return getattr(self, method, self.http_method_not_allowed)
+
+
+class AsyncViewSetMixin(AsyncDispatchMixin):
+    """
+    Async dispatch for viewsets, mix in before the viewset class
+    """
+    
+    @classmethod
+    def as_view(cls, actions=None, **initkwargs):
+        # ViewSetMixin.as_view() bypasses View.as_view(), mark it here
+        return markcoroutinefunction(super().as_view(actions, **initkwargs))
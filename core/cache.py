@@ -0,0 +1,114 @@
+"""
+Small in-process caches shared by the apps.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+from django.core.cache import caches
+from django.db import transaction
+
+
+class LRUCache:
+    """
+    Thread-safe LRU cache with a size bound and a per-entry TTL
+    """
+    
+    def __init__(self, max_size=1024, timeout=300):
+        self.max_size = max_size
+        self.timeout = timeout
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key, default=None):
+        """Cached value, or default if missing or expired"""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+            
+            value, expires_at = item
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            
+            self._data.move_to_end(key)
+            return value
+    
+    def set(self, key, value):
+        """Store value and evict the least recently used entries"""
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + self.timeout)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+    
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+    
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+    
+    def __len__(self):
+        return len(self._data)
+
+
+class InvalidatedCache:
+    """
+    Cache whose entries are dropped by signal handlers on writes
+    
+    With cache_alias the entries live in that Django cache for timeout
+    seconds, shared by all processes, so an invalidation reaches every
+    process. Without it they are kept in a process-local LRU for
+    local_timeout seconds only: other processes do not see invalidations,
+    a stale entry is served at most that long.
+    """
+    
+    def __init__(self, key_prefix, max_size=10000, timeout=300, cache_alias=None,
+                 local_timeout=5):
+        self.key_prefix = key_prefix
+        self.timeout = timeout
+        self.cache_alias = cache_alias
+        self._local = LRUCache(max_size=max_size, timeout=local_timeout)
+    
+    @property
+    def shared(self):
+        """Django cache shared between processes, None without cache_alias"""
+        if self.cache_alias is None:
+            return None
+        return caches[self.cache_alias]
+    
+    def get(self, key):
+        if self.shared is not None:
+            return self.shared.get(self._key(key))
+        return self._local.get(key)
+    
+    def set(self, key, value):
+        if self.shared is not None:
+            self.shared.set(self._key(key), value, self.timeout)
+        else:
+            self._local.set(key, value)
+    
+    def invalidate(self, keys):
+        """Drop the entries now and again once the transaction commits"""
+        keys = set(keys)
+        if keys:
+            self._delete(keys)
+            transaction.on_commit(lambda: self._delete(keys))
+    
+    def clear(self):
+        """Drop the process-local entries (tests), the shared cache is left alone"""
+        self._local.clear()
+    
+    def _delete(self, keys):
+        if self.shared is not None:
+            self.shared.delete_many([self._key(key) for key in keys])
+        else:
+            for key in keys:
+                self._local.delete(key)
+    
+    def _key(self, key):
+        return f'{self.key_prefix}:{key}'
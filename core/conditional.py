@@ -0,0 +1,41 @@
+"""
+Conditional GET helpers (ETag / If-None-Match).
+
+Views compute a cheap validator (a stored timestamp, a count) before
+loading or serializing anything and return ``304 Not Modified`` when the
+client's copy is still current.
+"""
+
+import hashlib
+
+from django.utils.cache import get_conditional_response
+
+
+def make_etag(request, *parts):
+    """
+    Weak ETag from validator parts
+    
+    The query string is part of the tag because it selects the
+    representation (pagination cursor, page size, streaming format).
+    """
+    parts = (*parts, request.GET.urlencode())
+    digest = hashlib.md5(
+        '|'.join(str(part) for part in parts).encode(),
+        usedforsecurity=False
+    ).hexdigest()
+    return f'W/"{digest}"'
+
+
+def not_modified_response(request, etag):
+    """304 response if the client already has this ETag, else None"""
+    response = get_conditional_response(request, etag=etag)
+    if response is not None:
+        response['ETag'] = etag
+    return response
+
+
+def set_etag(response, etag):
+    """Attach the validator, clients must revalidate before reusing it"""
+    response['ETag'] = etag
+    response['Cache-Control'] = 'private, no-cache'
+    return response
@@ -0,0 +1,35 @@
+"""
+Query expression helpers shared by the apps.
+"""
+
+from django.db import connections
+from django.db.models import Count, Subquery
+from django.db.models.functions import Coalesce
+
+
+def count_subquery(queryset, group_field):
+    """
+    Correlated COUNT subquery over queryset, 0 when there are no rows
+    
+    queryset must already be filtered on an OuterRef through group_field.
+    """
+    counts = (
+        queryset.order_by()
+        .values(group_field)
+        .annotate(count=Count('*'))
+        .values('count')
+    )
+    return Coalesce(Subquery(counts), 0)
+
+
+def release_connections():
+    """
+    Close this thread's database connections unless a transaction is open
+    
+    For ORM calls of long-lived async responses (event streams): their
+    request thread lives as long as the response and would keep an idle
+    database connection open just as long.
+    """
+    for connection in connections.all(initialized_only=True):
+        if not connection.in_atomic_block:
+            connection.close()
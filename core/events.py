@@ -0,0 +1,130 @@
+"""
+Publish/subscribe of server-sent events.
+
+Writers publish from synchronous code with ``publish_on_commit``,
+subscribers are coroutines on the ASGI event loop that wait for the
+next event. The broker class is configured with ``EVENT_STREAM['BROKER']``.
+Any class with the ``subscribe`` / ``unsubscribe`` / ``publish`` methods
+of ``InMemoryBroker`` can replace it, for example one backed by a pub/sub
+server so that several worker processes share events.
+"""
+
+import asyncio
+import threading
+from collections import defaultdict
+from functools import lru_cache
+
+from django.conf import settings
+from django.db import transaction
+from django.utils.module_loading import import_string
+
+from core.streaming import encode_json
+
+
+class Subscription:
+    """
+    Pending events of one connected client
+    
+    Events are queued on the subscriber's event loop. A client that falls
+    more than max_pending events behind is marked as overflowed and has
+    to catch up some other way (the stream tells it to resync).
+    """
+    
+    def __init__(self, broker, channel, max_pending):
+        self.broker = broker
+        self.channel = channel
+        self.max_pending = max_pending
+        self.overflowed = False
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue()
+    
+    def deliver(self, events):
+        """Queue a list of events, safe to call from any thread"""
+        try:
+            self._loop.call_soon_threadsafe(self._push, events)
+        except RuntimeError:
+            # The subscriber's event loop is closed
+            self.close()
+    
+    def _push(self, events):
+        for event in events:
+            if self._queue.qsize() >= self.max_pending:
+                self.overflowed = True
+                return
+            self._queue.put_nowait(event)
+    
+    async def get(self, timeout=None):
+        """Next event, None if none arrives within timeout seconds"""
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+    
+    def close(self):
+        self.broker.unsubscribe(self)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class InMemoryBroker:
+    """
+    Fan-out to the subscriptions of the current process
+    """
+    
+    def __init__(self, max_pending=100):
+        self.max_pending = max_pending
+        self._channels = defaultdict(set)
+        self._lock = threading.Lock()
+    
+    def subscribe(self, channel):
+        """Subscribe from the event loop that will consume the events"""
+        subscription = Subscription(self, channel, self.max_pending)
+        with self._lock:
+            self._channels[channel].add(subscription)
+        return subscription
+    
+    def unsubscribe(self, subscription):
+        with self._lock:
+            subscribers = self._channels.get(subscription.channel)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._channels[subscription.channel]
+    
+    def publish(self, channel, events):
+        """Deliver a list of events to every subscriber of channel"""
+        with self._lock:
+            subscribers = list(self._channels.get(channel, ()))
+        for subscription in subscribers:
+            subscription.deliver(events)
+    
+    def subscriber_count(self, channel):
+        with self._lock:
+            return len(self._channels.get(channel, ()))
+
+
+@lru_cache(maxsize=None)
+def get_broker():
+    """Process-wide broker built from the EVENT_STREAM setting"""
+    options = getattr(settings, 'EVENT_STREAM', {})
+    broker_class = import_string(
+        options.get('BROKER', 'core.events.InMemoryBroker')
+    )
+    return broker_class(max_pending=options.get('MAX_PENDING', 100))
+
+
+def publish_on_commit(channel, events):
+    """Publish once the current transaction commits, rolled back writes never do"""
+    transaction.on_commit(lambda: get_broker().publish(channel, events))
+
+
+def format_event(name, data, event_id=None):
+    """One event in text/event-stream format"""
+    event = b'event: %s\ndata: %s\n\n' % (name.encode(), encode_json(data))
+    if event_id is None:
+        return event
+    return b'id: %d\n' % event_id + event
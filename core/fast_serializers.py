@@ -0,0 +1,101 @@
+"""
+Read-only serializers for hot list endpoints.
+
+DRF's ModelSerializer builds model instances and runs every field's
+``to_representation`` per row. The serializers here read plain
+``QuerySet.values()`` rows and build the output dicts by hand instead.
+Each one mirrors a DRF serializer and must produce identical JSON; the
+parity tests of the apps compare both.
+
+Serializers that describe their output fields in ``get_sparse_fields()``
+also render sparse fieldsets (``?fields=id,title``): only the requested
+keys are returned and only their columns are selected.
+"""
+
+from abc import ABC, abstractmethod
+from operator import itemgetter
+
+from rest_framework.exceptions import ValidationError
+
+
+class ValuesSerializer(ABC):
+    """
+    Base class: value_fields are the lookups passed to QuerySet.values()
+    
+    fields limits the output to these keys of get_sparse_fields().
+    """
+    value_fields = ()
+    fields = None
+    
+    def __init__(self, fields=None):
+        if fields is not None:
+            self.fields = list(fields)
+            sparse_fields = self.get_sparse_fields()
+            readers = [(name, sparse_fields[name][1]) for name in self.fields]
+            self.to_representation = lambda row: {
+                name: read(row) for name, read in readers
+            }
+    
+    @classmethod
+    def for_request(cls, request, param='fields'):
+        """
+        Serializer limited to the comma separated fields of ?<param>=,
+        all fields without it, ValidationError (400) for unknown names
+        """
+        value = request.query_params.get(param, '')
+        names = list(dict.fromkeys(
+            name.strip() for name in value.split(',') if name.strip()
+        ))
+        if not names:
+            return cls()
+        known = cls().get_sparse_fields()
+        unknown = [name for name in names if name not in known]
+        if unknown:
+            raise ValidationError({param: (
+                f'Unknown fields: {", ".join(unknown)}. Choose from {", ".join(known)}.'
+            )})
+        return cls(fields=names)
+    
+    def get_sparse_fields(self):
+        """Output key -> (values() lookups, function reading the value from a row)"""
+        return {}
+    
+    def get_value_fields(self):
+        if self.fields is None:
+            return list(self.value_fields)
+        sparse_fields = self.get_sparse_fields()
+        return [lookup for name in self.fields for lookup in sparse_fields[name][0]]
+    
+    def prepare(self, queryset, *extra_fields):
+        """Values queryset with the columns to_representation() reads"""
+        fields = dict.fromkeys([*self.get_value_fields(), *extra_fields])
+        return queryset.values(*fields)
+    
+    @abstractmethod
+    def to_representation(self, row):
+        """Output dict of one values() row"""
+    
+    def serialize(self, queryset):
+        """List of output dicts for the queryset"""
+        to_representation = self.to_representation
+        return [to_representation(row) for row in self.prepare(queryset)]
+    
+    async def aserialize(self, queryset):
+        """serialize() for async views"""
+        to_representation = self.to_representation
+        return [to_representation(row) async for row in self.prepare(queryset)]
+    
+    def serialize_rows(self, rows):
+        """List of output dicts for rows already read with prepare()"""
+        to_representation = self.to_representation
+        return [to_representation(row) for row in rows]
+
+
+def column(lookup):
+    """Sparse field reading one column unchanged"""
+    return [lookup], itemgetter(lookup)
+
+
+def iso_date(value):
+    """Same output as DRF's DateField with the default ISO 8601 format"""
+    return value.isoformat() if value is not None else None
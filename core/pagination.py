@@ -0,0 +1,235 @@
+"""
+Keyset (cursor) pagination shared by the list endpoints.
+
+Pagination is opt-in: responses stay plain lists unless the client sends
+``?page_size=`` or ``?cursor=``. Pages are selected with a
+``(created_at, id)`` comparison (or another ordering field, see
+``KeysetPagination.order_by``) instead of OFFSET, so every page costs
+the same as the first one. Ranked results (search) have no such order and
+use ``RankedPagination`` with page numbers instead.
+"""
+
+import base64
+import binascii
+
+from django.db import models
+from django.db.models import F, Q
+from django.utils.dateparse import parse_date, parse_datetime
+
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class SizedPagination(BasePagination):
+    """
+    Base class: page size from ?page_size=, clamped to max_page_size
+    """
+    page_size_query_param = 'page_size'
+    page_size = 50
+    max_page_size = 200
+    
+    def get_page_size(self, request):
+        """Page size from the query string, clamped to max_page_size"""
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if size <= 0:
+            return self.page_size
+        return min(size, self.max_page_size)
+
+
+class KeysetPagination(SizedPagination):
+    """
+    Forward-only keyset pagination on (ordering_field, id)
+    
+    The ordering field must be a date or datetime field. NULL values of a
+    nullable ordering field come last in both directions.
+    """
+    ordering_field = 'created_at'
+    descending = True
+    cursor_query_param = 'cursor'
+    invalid_cursor_message = 'Invalid cursor'
+    
+    def paginate_queryset(self, queryset, request, view=None):
+        """Return one page, or None if the client did not ask for pages"""
+        if not self.is_requested(request):
+            return None
+        return self.set_page(list(self.get_page_queryset(queryset, request)))
+    
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """paginate_queryset() for async views"""
+        if not self.is_requested(request):
+            return None
+        page_queryset = self.get_page_queryset(queryset, request)
+        return self.set_page([row async for row in page_queryset])
+    
+    def order_by(self, ordering):
+        """Page by another field than the class default, e.g. '-due_date'"""
+        self.descending = ordering.startswith('-')
+        self.ordering_field = ordering.lstrip('-')
+    
+    def get_page_queryset(self, queryset, request):
+        """The page plus one row that tells whether there is a next page"""
+        self.request = request
+        self.size = self.get_page_size(request)
+        self.field = self.get_field(queryset.model)
+        position = self.decode_cursor(request)
+        
+        queryset = queryset.order_by(*self.get_ordering(queryset.model))
+        if position is not None:
+            queryset = queryset.filter(self.get_position_filter(*position))
+        return queryset[:self.size + 1]
+    
+    def set_page(self, rows):
+        self.page = rows[:self.size]
+        self.has_next = len(rows) > self.size
+        return self.page
+    
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_next_link(),
+            'results': data,
+        })
+    
+    def is_requested(self, request):
+        """Pagination is only applied on explicit request"""
+        params = request.query_params
+        return (self.cursor_query_param in params
+                or self.page_size_query_param in params)
+    
+    def get_field(self, model):
+        return model._meta.get_field(self.ordering_field)
+    
+    def get_ordering(self, model):
+        """order_by() arguments for the paginated model"""
+        name = self.ordering_field
+        if self.get_field(model).null:
+            field = F(name)
+            if self.descending:
+                return (field.desc(nulls_last=True), '-id')
+            return (field.asc(nulls_last=True), 'id')
+        if self.descending:
+            return (f'-{name}', '-id')
+        return (name, 'id')
+    
+    def get_position_filter(self, value, pk):
+        """Rows strictly after the (value, id) position"""
+        name = self.ordering_field
+        after = 'lt' if self.descending else 'gt'
+        if value is None:
+            # Only NULLs are left
+            return Q(**{f'{name}__isnull': True, f'id__{after}': pk})
+        position = (Q(**{f'{name}__{after}': value})
+                    | Q(**{name: value, f'id__{after}': pk}))
+        if self.field.null:
+            position |= Q(**{f'{name}__isnull': True})
+        return position
+    
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        last = self.page[-1]
+        url = self.request.build_absolute_uri()
+        return replace_query_param(
+            url, self.cursor_query_param, self.encode_cursor(last)
+        )
+    
+    def encode_cursor(self, obj):
+        """Encode the position of the given row (instance or values() dict)"""
+        if isinstance(obj, dict):
+            value, pk = obj[self.ordering_field], obj['id']
+        else:
+            value, pk = getattr(obj, self.ordering_field), obj.pk
+        raw = f'{value.isoformat() if value is not None else ""}|{pk}'
+        return base64.urlsafe_b64encode(raw.encode('ascii')).decode('ascii')
+    
+    def decode_cursor(self, request):
+        """Decode the cursor parameter into (value, id)"""
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        
+        try:
+            raw = base64.urlsafe_b64decode(encoded.encode('ascii')).decode('ascii')
+            text, pk = raw.rsplit('|', 1)
+            value = self.parse_value(text)
+            pk = int(pk)
+        except (binascii.Error, UnicodeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+        
+        if value is None and not (text == '' and self.field.null):
+            raise NotFound(self.invalid_cursor_message)
+        return value, pk
+    
+    def parse_value(self, text):
+        """Ordering field value from its cursor text, None if invalid"""
+        if text == '':
+            return None
+        if isinstance(self.field, models.DateTimeField):
+            return parse_datetime(text)
+        return parse_date(text)
+
+
+class NewestFirstPagination(KeysetPagination):
+    """
+    Keyset pagination for lists ordered by -created_at (boards, tasks)
+    """
+    descending = True
+
+
+class OldestFirstPagination(KeysetPagination):
+    """
+    Keyset pagination for lists ordered by created_at (comments)
+    """
+    descending = False
+
+
+class RankedPagination(SizedPagination):
+    """
+    Page number pagination of ranked results, always applied
+    
+    The view fetches the window from get_window() (one row more than the
+    page) and hands the rows to set_page(). OFFSET gets slower with every
+    page, so clients can page at most max_page deep.
+    """
+    page_query_param = 'page'
+    page_size = 20
+    max_page_size = 100
+    max_page = 50
+    invalid_page_message = 'Invalid page'
+    
+    def get_window(self, request):
+        """(offset, limit) of the requested page plus one row"""
+        self.request = request
+        self.size = self.get_page_size(request)
+        self.number = self.get_page_number(request)
+        return (self.number - 1) * self.size, self.size + 1
+    
+    def get_page_number(self, request):
+        try:
+            number = int(request.query_params.get(self.page_query_param, 1))
+        except ValueError:
+            raise NotFound(self.invalid_page_message)
+        if not 1 <= number <= self.max_page:
+            raise NotFound(self.invalid_page_message)
+        return number
+    
+    def set_page(self, rows):
+        self.page = rows[:self.size]
+        self.has_next = len(rows) > self.size and self.number < self.max_page
+        return self.page
+    
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_next_link(),
+            'results': data,
+        })
+    
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.page_query_param, self.number + 1)
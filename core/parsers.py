@@ -0,0 +1,32 @@
+"""
+JSON parser with a pluggable decoding backend (see core.renderers).
+"""
+
+from django.conf import settings
+
+from rest_framework import parsers
+from rest_framework.exceptions import ParseError
+
+from core.renderers import JSONRenderer, get_json_backend, orjson
+
+
+class JSONParser(parsers.JSONParser):
+    """
+    Drop-in replacement for rest_framework.parsers.JSONParser
+    """
+    renderer_class = JSONRenderer
+    
+    def parse(self, stream, media_type=None, parser_context=None):
+        if get_json_backend() != 'orjson':
+            return super().parse(stream, media_type, parser_context)
+        
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+        
+        try:
+            content = stream.read()
+            if encoding.lower().replace('-', '') != 'utf8':
+                content = content.decode(encoding)
+            return orjson.loads(content)
+        except (ValueError, UnicodeDecodeError) as exc:
+            raise ParseError('JSON parse error - %s' % str(exc))
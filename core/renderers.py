@@ -0,0 +1,65 @@
+"""
+JSON renderer with a pluggable encoding backend.
+
+Uses orjson when it is installed (and JSON_BACKEND is not 'stdlib'),
+otherwise DRF's stdlib-json implementation. Both produce identical
+output: types orjson does not handle the same way as DRF (datetime,
+date, time, Decimal, lazy strings, ...) are passed through to DRF's
+JSONEncoder, and anything orjson refuses falls back to stdlib.
+"""
+
+from django.conf import settings
+
+from rest_framework import renderers
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def get_json_backend():
+    """'orjson' or 'stdlib' according to JSON_BACKEND and what is installed"""
+    backend = getattr(settings, 'JSON_BACKEND', 'auto')
+    if backend == 'stdlib' or orjson is None:
+        return 'stdlib'
+    return 'orjson'
+
+
+class JSONRenderer(renderers.JSONRenderer):
+    """
+    Drop-in replacement for rest_framework.renderers.JSONRenderer
+    """
+    
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if not self._can_use_orjson(accepted_media_type, renderer_context):
+            return super().render(data, accepted_media_type, renderer_context)
+        
+        if data is None:
+            return b''
+        
+        try:
+            ret = orjson.dumps(data, default=self._default, option=self._options)
+        except TypeError:
+            # e.g. integers beyond 64 bit: let stdlib json decide
+            return super().render(data, accepted_media_type, renderer_context)
+        
+        # Same escaping of line/paragraph separators as DRF
+        return (ret.replace(b'\xe2\x80\xa8', b'\\u2028')
+                .replace(b'\xe2\x80\xa9', b'\\u2029'))
+    
+    def _can_use_orjson(self, accepted_media_type, renderer_context):
+        """orjson only covers DRF's default compact, unicode output"""
+        if get_json_backend() != 'orjson':
+            return False
+        if not (self.compact and not self.ensure_ascii):
+            return False
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        return indent is None
+    
+    @property
+    def _options(self):
+        return orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+    
+    def _default(self, obj):
+        return self.encoder_class().default(obj)
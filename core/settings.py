@@ -63,19 +63,93 @@ MIDDLEWARE = [
 # REST Framework Configuration
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework.authentication.TokenAuthentication",
+        "auth_app.authentication.CachedTokenAuthentication",
     ],
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticated",
     ],
     "DEFAULT_RENDERER_CLASSES": [
-        "rest_framework.renderers.JSONRenderer",
+        "core.renderers.JSONRenderer",
     ],
     "DEFAULT_PARSER_CLASSES": [
-        "rest_framework.parsers.JSONParser",
+        "core.parsers.JSONParser",
     ],
 }
 
+# JSON encoding backend of core.renderers / core.parsers:
+# "auto" uses orjson when installed, "stdlib" forces the json module
+JSON_BACKEND = config('JSON_BACKEND', default='auto')
+
+# Cross-request cache of board owner/member ids used by permission checks.
+# CACHE_ALIAS optionally names a Django cache shared between processes,
+# entries live TIMEOUT seconds there. Without it entries are kept in
+# process for LOCAL_TIMEOUT seconds, other processes miss invalidations.
+BOARD_MEMBERSHIP_CACHE = {
+    "MAX_SIZE": config('BOARD_MEMBERSHIP_CACHE_SIZE', default=10000, cast=int),
+    "TIMEOUT": config('BOARD_MEMBERSHIP_CACHE_TIMEOUT', default=300, cast=int),
+    "CACHE_ALIAS": config('BOARD_MEMBERSHIP_CACHE_ALIAS', default=None),
+    "LOCAL_TIMEOUT": config(
+        'BOARD_MEMBERSHIP_CACHE_LOCAL_TIMEOUT', default=5, cast=int
+    ),
+}
+
+# Cache of token -> user lookups for CachedTokenAuthentication. With
+# CACHE_ALIAS (a Django cache shared between processes) entries live TIMEOUT
+# seconds and revocations reach every process. Without it entries are kept
+# in process for LOCAL_TIMEOUT seconds: a deleted token or deactivated user
+# keeps authenticating in other processes for at most that long.
+TOKEN_AUTH_CACHE = {
+    "MAX_SIZE": config('TOKEN_AUTH_CACHE_SIZE', default=10000, cast=int),
+    "TIMEOUT": config('TOKEN_AUTH_CACHE_TIMEOUT', default=60, cast=int),
+    "CACHE_ALIAS": config('TOKEN_AUTH_CACHE_ALIAS', default=None),
+    "LOCAL_TIMEOUT": config('TOKEN_AUTH_CACHE_LOCAL_TIMEOUT', default=5, cast=int),
+}
+
+# In-process cache of emails without an account for EmailBackend, failed
+# logins with them skip the user query for TIMEOUT seconds. Registrations
+# handled by another process are only seen after the timeout.
+LOGIN_UNKNOWN_EMAIL_CACHE = {
+    "MAX_SIZE": config('LOGIN_UNKNOWN_EMAIL_CACHE_SIZE', default=10000, cast=int),
+    "TIMEOUT": config('LOGIN_UNKNOWN_EMAIL_CACHE_TIMEOUT', default=30, cast=int),
+}
+
+# Serve the read endpoints (task lists, comments, board list and detail)
+# with their async view counterparts. Only useful under an ASGI server.
+ASYNC_READ_VIEWS = config('ASYNC_READ_VIEWS', default=False, cast=bool)
+
+# Serve login and registration with async views that hash passwords in a
+# thread pool (auth_app.hashers). Only useful under an ASGI server.
+ASYNC_AUTH_VIEWS = config('ASYNC_AUTH_VIEWS', default=False, cast=bool)
+
+# Full-text task search (tasks_app.search). BACKEND is "auto" (SQLite FTS5
+# on SQLite, an unindexed substring scan elsewhere) or a dotted class path.
+TASK_SEARCH = {
+    "BACKEND": config('TASK_SEARCH_BACKEND', default='auto'),
+}
+
+# Per-user cache of GET /api/summary/ (tasks_app.summary), dropped when a
+# task, title or member of one of the user's boards changes. With
+# CACHE_ALIAS (a Django cache shared between processes) entries live TIMEOUT
+# seconds and every process sees the invalidations. Without it entries are
+# kept in process for LOCAL_TIMEOUT seconds, so a summary missing a write
+# handled by another process is served for at most that long.
+SUMMARY_CACHE = {
+    "MAX_SIZE": config('SUMMARY_CACHE_SIZE', default=10000, cast=int),
+    "TIMEOUT": config('SUMMARY_CACHE_TIMEOUT', default=300, cast=int),
+    "CACHE_ALIAS": config('SUMMARY_CACHE_ALIAS', default=None),
+    "LOCAL_TIMEOUT": config('SUMMARY_CACHE_LOCAL_TIMEOUT', default=5, cast=int),
+}
+
+# Server-sent board events (core.events). BROKER is the dotted path of the
+# pub/sub backend, the in-memory broker only reaches clients of its process.
+# MAX_PENDING events may queue up per client before it has to resync,
+# HEARTBEAT is the keep-alive interval in seconds.
+EVENT_STREAM = {
+    "BROKER": config('EVENT_STREAM_BROKER', default='core.events.InMemoryBroker'),
+    "MAX_PENDING": config('EVENT_STREAM_MAX_PENDING', default=100, cast=int),
+    "HEARTBEAT": config('EVENT_STREAM_HEARTBEAT', default=15, cast=int),
+}
+
 ROOT_URLCONF = "core.urls"
 
 TEMPLATES = [
@@ -147,6 +221,10 @@ WSGI_APPLICATION = "core.wsgi.application"
 
 # Database
 # https://docs.djangoproject.com/en/6.0/ref/settings/#databases
+# The board change feed (tasks_app.changes) uses the BoardChange id as its
+# cursor and relies on ids committing in order. SQLite has a single writer,
+# so that holds. With concurrent writers (PostgreSQL, MySQL) a lower id can
+# commit after a client read a higher one, and the client skips that row.
 
 DATABASES = {
     "default": {
@@ -197,3 +275,22 @@ STATIC_URL = "static/"
 
 # Custom User Model if desired.
 AUTH_USER_MODEL = 'auth_app.User'
+
+# Email login with the API token loaded in the same query (auth_app.backends)
+AUTHENTICATION_BACKENDS = ['auth_app.backends.EmailBackend']
+
+# Password hashing (auth_app.hashers). PASSWORD_HASH_ITERATIONS is the
+# PBKDF2 work factor, 0 keeps Django's default; measure it on the deployment
+# hardware with `python manage.py bench_password_hash`. Stored hashes with
+# another work factor are rehashed on the next successful login.
+# PASSWORD_HASH_THREADS sizes the hash pool of the async views (0 = CPUs).
+PASSWORD_HASH_ITERATIONS = config('PASSWORD_HASH_ITERATIONS', default=0, cast=int)
+PASSWORD_HASH_THREADS = config('PASSWORD_HASH_THREADS', default=0, cast=int)
+
+PASSWORD_HASHERS = [
+    "auth_app.hashers.TunablePBKDF2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    "django.contrib.auth.hashers.Argon2PasswordHasher",
+    "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
+    "django.contrib.auth.hashers.ScryptPasswordHasher",
+]
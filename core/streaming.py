@@ -0,0 +1,162 @@
+"""
+Streaming JSON / NDJSON responses for large list endpoints.
+
+Streaming is opt-in with ``?stream=1`` (JSON array), ``?stream=ndjson``
+or an ``Accept: application/x-ndjson`` header. Rows are read with
+``QuerySet.iterator(chunk_size=...)`` and serialized one by one, so
+memory stays flat regardless of the result size. The ``a``-prefixed
+variants do the same with ``QuerySet.aiterator()`` for async views.
+"""
+
+from django.http import StreamingHttpResponse
+
+from rest_framework.renderers import BaseRenderer
+from rest_framework.settings import api_settings
+
+NDJSON_MEDIA_TYPE = 'application/x-ndjson'
+STREAM_CHUNK_SIZE = 500
+
+
+class NDJSONRenderer(BaseRenderer):
+    """
+    Renders lists as newline-delimited JSON (one item per line)
+    
+    Only used for non-streamed responses that were negotiated as NDJSON,
+    e.g. paginated pages or error messages.
+    """
+    media_type = NDJSON_MEDIA_TYPE
+    format = 'ndjson'
+    charset = None
+    
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        items = data if isinstance(data, list) else [data]
+        return b''.join(encode_json(item) + b'\n' for item in items)
+
+
+def encode_json(data):
+    """Encode with the configured default JSON renderer"""
+    renderer = api_settings.DEFAULT_RENDERER_CLASSES[0]()
+    return renderer.render(data)
+
+
+def get_stream_format(request):
+    """'json', 'ndjson' or None if the client did not ask for streaming"""
+    stream = request.query_params.get('stream', '').lower()
+    if stream == 'ndjson':
+        return 'ndjson'
+    if stream in ('1', 'true', 'json'):
+        return 'json'
+    if NDJSON_MEDIA_TYPE in request.META.get('HTTP_ACCEPT', ''):
+        return 'ndjson'
+    return None
+
+
+def iter_rows(queryset, serializer, chunk_size=STREAM_CHUNK_SIZE):
+    """Serialized rows, read from the database in chunks"""
+    for obj in queryset.iterator(chunk_size=chunk_size):
+        yield serializer.to_representation(obj)
+
+
+def iter_json_array(rows, chunk_size=STREAM_CHUNK_SIZE):
+    """Encode rows as one JSON array, yielding about chunk_size rows at a time"""
+    buffer = [b'[']
+    for index, row in enumerate(rows):
+        if index:
+            buffer.append(b',')
+        buffer.append(encode_json(row))
+        if len(buffer) >= chunk_size * 2:
+            yield b''.join(buffer)
+            buffer = []
+    buffer.append(b']')
+    yield b''.join(buffer)
+
+
+def iter_ndjson(rows, chunk_size=STREAM_CHUNK_SIZE):
+    """Encode rows as newline-delimited JSON"""
+    buffer = []
+    for row in rows:
+        buffer.append(encode_json(row) + b'\n')
+        if len(buffer) >= chunk_size:
+            yield b''.join(buffer)
+            buffer = []
+    if buffer:
+        yield b''.join(buffer)
+
+
+def stream_queryset(queryset, serializer, stream_format):
+    """StreamingHttpResponse with the serialized queryset"""
+    rows = iter_rows(queryset, serializer)
+    if stream_format == 'ndjson':
+        return StreamingHttpResponse(iter_ndjson(rows), content_type=NDJSON_MEDIA_TYPE)
+    return StreamingHttpResponse(iter_json_array(rows), content_type='application/json')
+
+
+def stream_object_with_rows(head, key, rows):
+    """
+    Stream a JSON object whose (last) key holds a large list
+    
+    head is the already serialized object without key, rows is an
+    iterable of serialized list items.
+    """
+    yield object_prefix(head, key)
+    yield from iter_json_array(rows)
+    yield b'}'
+
+
+def object_prefix(head, key):
+    """The encoded object head up to and including '"key":'"""
+    head = dict(head)
+    head.pop(key, None)
+    prefix = encode_json(head)[:-1]
+    separator = b',' if head else b''
+    return prefix + separator + encode_json(key) + b':'
+
+
+async def aiter_row_chunks(queryset, serializer, chunk_size=STREAM_CHUNK_SIZE):
+    """Lists of up to chunk_size serialized rows, read with aiterator()"""
+    to_representation = serializer.to_representation
+    chunk = []
+    async for obj in queryset.aiterator(chunk_size=chunk_size):
+        chunk.append(to_representation(obj))
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+async def aiter_json_array(row_chunks):
+    """Encode async row chunks as one JSON array"""
+    separator = b'['
+    async for rows in row_chunks:
+        yield separator + b','.join(encode_json(row) for row in rows)
+        separator = b','
+    yield b']' if separator == b',' else b'[]'
+
+
+async def aiter_ndjson(row_chunks):
+    """Encode async row chunks as newline-delimited JSON"""
+    async for rows in row_chunks:
+        yield b''.join(encode_json(row) + b'\n' for row in rows)
+
+
+def astream_queryset(queryset, serializer, stream_format):
+    """stream_queryset() for async views"""
+    row_chunks = aiter_row_chunks(queryset, serializer)
+    if stream_format == 'ndjson':
+        return StreamingHttpResponse(
+            aiter_ndjson(row_chunks), content_type=NDJSON_MEDIA_TYPE
+        )
+    return StreamingHttpResponse(
+        aiter_json_array(row_chunks), content_type='application/json'
+    )
+
+
+async def astream_object_with_rows(head, key, row_chunks):
+    """stream_object_with_rows() over async row chunks"""
+    yield object_prefix(head, key)
+    async for part in aiter_json_array(row_chunks):
+        yield part
+    yield b'}'
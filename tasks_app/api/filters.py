@@ -0,0 +1,111 @@
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+
+from rest_framework.exceptions import ValidationError
+
+from tasks_app.models import Task
+
+
+class TaskListFilter:
+    """
+    Query parameter filters and ordering of the "my tasks" list views
+    
+    ?status=to-do,review  ?priority=high  ?board=3,7
+    ?due_after=2026-01-01  ?due_before=2026-01-31  (inclusive)
+    ?overdue=true|false  (due before today and not done)
+    ?ordering=created_at|-created_at|due_date|-due_date
+    
+    Lists are comma separated. All filters become one WHERE clause, invalid
+    values raise a ValidationError (400) listing every invalid parameter.
+    """
+    CHOICE_FILTERS = {
+        'status': [value for value, _ in Task.STATUS_CHOICES],
+        'priority': [value for value, _ in Task.PRIORITY_CHOICES],
+    }
+    DATE_FILTERS = {'due_after': 'due_date__gte', 'due_before': 'due_date__lte'}
+    BOOLEAN_VALUES = {'true': True, '1': True, 'false': False, '0': False}
+    ORDERING_FIELDS = ('created_at', 'due_date')
+    DEFAULT_ORDERING = '-created_at'
+    # Largest id a bigint primary key holds, larger values overflow the query
+    MAX_ID = 2**63 - 1
+    
+    def __init__(self, params):
+        self.params = params
+        self.errors = {}
+        self.conditions = self._parse_conditions()
+        self.ordering = self._parse_ordering()
+        if self.errors:
+            raise ValidationError(self.errors)
+    
+    def filter_queryset(self, queryset):
+        return queryset.filter(*self.conditions)
+    
+    def _parse_conditions(self):
+        conditions = []
+        for param, choices in self.CHOICE_FILTERS.items():
+            values = self._get_list(param)
+            if values is None:
+                continue
+            if all(value in choices for value in values):
+                conditions.append(Q(**{f'{param}__in': values}))
+            else:
+                self.errors[param] = f'Choose from {", ".join(choices)}.'
+        
+        board_ids = self._get_list('board')
+        if board_ids is not None:
+            board_ids = self._parse_ids(board_ids)
+            if board_ids is not None:
+                conditions.append(Q(board_id__in=board_ids))
+            else:
+                self.errors['board'] = 'Expected comma separated board ids.'
+        
+        for param, lookup in self.DATE_FILTERS.items():
+            if param in self.params:
+                due_date = self._parse_date(self.params[param])
+                if due_date is not None:
+                    conditions.append(Q(**{lookup: due_date}))
+                else:
+                    self.errors[param] = 'Expected a YYYY-MM-DD date.'
+        
+        if 'overdue' in self.params:
+            overdue = self.BOOLEAN_VALUES.get(self.params['overdue'].lower())
+            if overdue is None:
+                self.errors['overdue'] = 'Expected true or false.'
+            else:
+                condition = Q(due_date__lt=timezone.localdate()) & ~Q(status='done')
+                conditions.append(condition if overdue else ~condition)
+        return conditions
+    
+    def _parse_ordering(self):
+        ordering = self.params.get('ordering', self.DEFAULT_ORDERING)
+        if ordering.lstrip('-') not in self.ORDERING_FIELDS:
+            self.errors['ordering'] = (
+                f'Choose from {", ".join(self.ORDERING_FIELDS)}, '
+                'prefix - for descending.'
+            )
+        return ordering
+    
+    def _get_list(self, param):
+        """Comma separated values, None if the parameter is missing or empty"""
+        values = [
+            value.strip() for value in self.params.get(param, '').split(',')
+            if value.strip()
+        ]
+        return values or None
+    
+    def _parse_date(self, value):
+        try:
+            return parse_date(value)
+        except ValueError:
+            return None
+    
+    def _parse_ids(self, values):
+        """Integer ids, None if one is not a number or out of the id range"""
+        try:
+            ids = [int(value) for value in values]
+        except ValueError:
+            return None
+        if all(1 <= id_ <= self.MAX_ID for id_ in ids):
+            return ids
+        return None
@@ -1,19 +1,16 @@
 from rest_framework.permissions import BasePermission
 
+from boards_app.membership import BoardMembership
+
 class IsTaskBoardMember(BasePermission):
     """
     Permission: Only board members of the task
     """
     
     def has_object_permission(self, request, view, obj):
-        board = obj.board
-        
-        # Board owner always has access
-        if board.owner == request.user:
-            return True
-        
-        # Board members have access
-        return board.members.filter(id=request.user.id).exists()
+        # Board owner and members have access
+        membership = BoardMembership.for_request(request)
+        return membership.is_member_or_owner(obj.board, request.user.id)
 
 class IsTaskCreatorOrBoardOwner(BasePermission):
     """
@@ -22,11 +19,11 @@ class IsTaskCreatorOrBoardOwner(BasePermission):
     
     def has_object_permission(self, request, view, obj):
         # Task creator has access
-        if obj.created_by == request.user:
+        if obj.created_by_id == request.user.id:
             return True
         
         # Board owner has access
-        return obj.board.owner == request.user
+        return obj.board.owner_id == request.user.id
 
 class IsCommentAuthor(BasePermission):
     """
@@ -34,5 +31,5 @@ class IsCommentAuthor(BasePermission):
     """
     
     def has_object_permission(self, request, view, obj):
-        return obj.author == request.user
+        return obj.author_id == request.user.id
     
@@ -2,11 +2,16 @@ from django.contrib.auth import get_user_model
 
 from rest_framework import serializers
 
-from auth_app.api.serializers import UserSerializer
+from auth_app.api.serializers import UserSerializer, UserValuesSerializer
+from boards_app.membership import BoardMembership
+from core.fast_serializers import ValuesSerializer, column, iso_date
 from tasks_app.models import Task, Comment
 
 User = get_user_model()
 
+# Largest id a bigint primary key holds, larger values overflow the query
+MAX_ID = 2**63 - 1
+
 class TaskSerializer(serializers.ModelSerializer):
     """
     Serializer for task display
@@ -20,6 +25,53 @@ class TaskSerializer(serializers.ModelSerializer):
         fields = ['id', 'board', 'title', 'description', 'status', 'priority',
                  'assignee', 'reviewer', 'due_date', 'comments_count']
 
+class TaskValuesSerializer(ValuesSerializer):
+    """
+    Fast read-only equivalent of TaskSerializer for values() rows
+    """
+    value_fields = ['id', 'board_id', 'title', 'description', 'status', 'priority',
+                    'due_date', 'comments_count']
+    assignee = UserValuesSerializer(prefix='assignee__')
+    reviewer = UserValuesSerializer(prefix='reviewer__')
+    
+    def get_value_fields(self):
+        if self.fields is not None:
+            return super().get_value_fields()
+        return (self.value_fields + self.assignee.get_value_fields()
+                + self.reviewer.get_value_fields())
+    
+    def get_sparse_fields(self):
+        return {
+            'id': column('id'),
+            'board': column('board_id'),
+            'title': column('title'),
+            'description': column('description'),
+            'status': column('status'),
+            'priority': column('priority'),
+            'assignee': (
+                self.assignee.get_value_fields(), self.assignee.to_representation
+            ),
+            'reviewer': (
+                self.reviewer.get_value_fields(), self.reviewer.to_representation
+            ),
+            'due_date': (['due_date'], lambda row: iso_date(row['due_date'])),
+            'comments_count': column('comments_count'),
+        }
+    
+    def to_representation(self, row):
+        return {
+            'id': row['id'],
+            'board': row['board_id'],
+            'title': row['title'],
+            'description': row['description'],
+            'status': row['status'],
+            'priority': row['priority'],
+            'assignee': self.assignee.to_representation(row),
+            'reviewer': self.reviewer.to_representation(row),
+            'due_date': iso_date(row['due_date']),
+            'comments_count': row['comments_count'],
+        }
+
 class TaskCreateUpdateSerializer(serializers.ModelSerializer):
     """
     Serializer for task creation and updating
@@ -49,43 +101,38 @@ class TaskCreateUpdateSerializer(serializers.ModelSerializer):
                 {'board': 'Board is required for validation.'}
             )
         
-        # Validate assignee
-        assignee_id = attrs.get('assignee_id')
-        if assignee_id:
-            try:
-                assignee = User.objects.get(id=assignee_id)
-                if not (board.members.filter(id=assignee.id).exists() or board.owner == assignee):
-                    raise serializers.ValidationError(
-                        {'assignee_id': 'Assignee must be a member of the board.'}
-                    )
-                attrs['assignee'] = assignee
-            except User.DoesNotExist:
-                raise serializers.ValidationError(
-                    {'assignee_id': 'Assignee does not exist.'}
-                )
-        
-        # Validate reviewer
-        reviewer_id = attrs.get('reviewer_id')
-        if reviewer_id:
-            try:
-                reviewer = User.objects.get(id=reviewer_id)
-                if not (board.members.filter(id=reviewer.id).exists() or board.owner == reviewer):
-                    raise serializers.ValidationError(
-                        {'reviewer_id': 'Reviewer must be a member of the board.'}
-                    )
-                attrs['reviewer'] = reviewer
-            except User.DoesNotExist:
-                raise serializers.ValidationError(
-                    {'reviewer_id': 'Reviewer does not exist.'}
-                )
+        # Validate assignee and reviewer against the board's member ids
+        membership = BoardMembership.for_request(self.context.get('request'))
+        self._validate_board_user(attrs, 'assignee_id', 'Assignee', board, membership)
+        self._validate_board_user(attrs, 'reviewer_id', 'Reviewer', board, membership)
         
         return attrs
     
+    def _validate_board_user(self, attrs, field, label, board, membership):
+        """User must exist and be a member or the owner of the board"""
+        user_id = attrs.get(field)
+        if not user_id or membership.is_member_or_owner(board, user_id):
+            return
+        
+        # Only on the error path: tell missing users and non-members apart
+        if not User.objects.filter(id=user_id).exists():
+            raise serializers.ValidationError(
+                {field: f'{label} does not exist.'}
+            )
+        raise serializers.ValidationError(
+            {field: f'{label} must be a member of the board.'}
+        )
+    
+    def _pop_empty_user_ids(self, validated_data):
+        """Empty assignee/reviewer ids leave the current value untouched"""
+        for field in ('assignee_id', 'reviewer_id'):
+            if not validated_data.get(field):
+                validated_data.pop(field, None)
+    
     def create(self, validated_data):
         """Create task"""
-        # Set assignee and reviewer from IDs
-        validated_data.pop('assignee_id', None)
-        validated_data.pop('reviewer_id', None)
+        # Assignee and reviewer are set from their validated IDs
+        self._pop_empty_user_ids(validated_data)
         
         # Created_by setzen
         validated_data['created_by'] = self.context['request'].user
@@ -96,8 +143,7 @@ class TaskCreateUpdateSerializer(serializers.ModelSerializer):
         """Update task"""
         # Board ID cannot be changed
         validated_data.pop('board', None)
-        validated_data.pop('assignee_id', None)
-        validated_data.pop('reviewer_id', None)
+        self._pop_empty_user_ids(validated_data)
         
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
@@ -119,4 +165,42 @@ class CommentSerializer(serializers.ModelSerializer):
         """Create comment"""
         validated_data['author'] = self.context['request'].user
         return Comment.objects.create(**validated_data)
+
+
+class CommentChangeSerializer(CommentSerializer):
+    """
+    Comment in the board change feed, clients need the task it belongs to
+    """
+    task_id = serializers.IntegerField(read_only=True)
+    
+    class Meta(CommentSerializer.Meta):
+        fields = CommentSerializer.Meta.fields + ['task_id']
+
+
+class TaskBulkCreateSerializer(serializers.ModelSerializer):
+    """
+    Field validation of one item of POST /api/tasks/bulk/
+    
+    Boards, users and membership are checked set-based by the view.
+    """
+    board = serializers.IntegerField(min_value=1, max_value=MAX_ID)
+    assignee_id = serializers.IntegerField(
+        min_value=1, max_value=MAX_ID, required=False, allow_null=True
+    )
+    reviewer_id = serializers.IntegerField(
+        min_value=1, max_value=MAX_ID, required=False, allow_null=True
+    )
+    
+    class Meta:
+        model = Task
+        fields = ['board', 'title', 'description', 'status', 'priority',
+                 'assignee_id', 'reviewer_id', 'due_date']
+
+class TaskBulkUpdateSerializer(TaskBulkCreateSerializer):
+    """
+    Field validation of one item of PATCH /api/tasks/bulk/
+    """
+    id = serializers.IntegerField(min_value=1, max_value=MAX_ID)
     
+    class Meta(TaskBulkCreateSerializer.Meta):
+        fields = ['id'] + TaskBulkCreateSerializer.Meta.fields
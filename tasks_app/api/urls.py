@@ -1,18 +1,40 @@
+from django.conf import settings
 from django.urls import path
 from .views import (
+    AsyncTaskAssignedToMeView,
+    AsyncTaskCommentsView,
+    AsyncTaskReviewingView,
     TaskAssignedToMeView,
     TaskReviewingView, 
+    TaskSearchView,
+    SummaryView,
+    TaskCountsView,
     TaskCreateView,
+    TaskBulkView,
     TaskDetailView,
     TaskCommentsView,
     CommentDetailView
 )
 
+if settings.ASYNC_READ_VIEWS:
+    assigned_view, reviewing_view, comments_view = (
+        AsyncTaskAssignedToMeView, AsyncTaskReviewingView, AsyncTaskCommentsView
+    )
+else:
+    assigned_view, reviewing_view, comments_view = (
+        TaskAssignedToMeView, TaskReviewingView, TaskCommentsView
+    )
+
 urlpatterns = [
-    path('tasks/assigned-to-me/', TaskAssignedToMeView.as_view(), name='tasks-assigned-to-me'),
-    path('tasks/reviewing/', TaskReviewingView.as_view(), name='tasks-reviewing'),
+    path('tasks/assigned-to-me/', assigned_view.as_view(), name='tasks-assigned-to-me'),
+    path('tasks/reviewing/', reviewing_view.as_view(), name='tasks-reviewing'),
+    path('tasks/counts/', TaskCountsView.as_view(), name='tasks-counts'),
+    path('tasks/search/', TaskSearchView.as_view(), name='tasks-search'),
+    path('summary/', SummaryView.as_view(), name='summary'),
     path('tasks/', TaskCreateView.as_view(), name='tasks-create'),
+    path('tasks/bulk/', TaskBulkView.as_view(), name='tasks-bulk'),
     path('tasks/<int:task_id>/', TaskDetailView.as_view(), name='tasks-detail'),
-    path('tasks/<int:task_id>/comments/', TaskCommentsView.as_view(), name='task-comments'),
+    path('tasks/<int:task_id>/comments/', comments_view.as_view(),
+         name='task-comments'),
     path('tasks/<int:task_id>/comments/<int:comment_id>/', CommentDetailView.as_view(), name='comment-detail'),
 ]
@@ -1,15 +1,45 @@
-from django.db import models
+from asgiref.sync import sync_to_async
+from django.contrib.auth import get_user_model
+from django.db import models, transaction
 from django.shortcuts import get_object_or_404
+from django.utils import timezone
 
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
+from rest_framework.settings import api_settings
 from rest_framework.views import APIView
 from rest_framework.viewsets import ModelViewSet
 
+from boards_app.membership import BoardMembership
+from boards_app.models import Board
+from core.async_views import AsyncDispatchMixin
+from core.conditional import make_etag, not_modified_response, set_etag
+from core.pagination import (
+    NewestFirstPagination,
+    OldestFirstPagination,
+    RankedPagination
+)
+from core.streaming import (
+    NDJSONRenderer,
+    astream_queryset,
+    get_stream_format,
+    stream_queryset
+)
+from tasks_app import changes, counters, search, summary
 from tasks_app.models import Task, Comment
+from .filters import TaskListFilter
 from .permissions import IsTaskBoardMember, IsTaskCreatorOrBoardOwner, IsCommentAuthor
-from .serializers import TaskSerializer, TaskCreateUpdateSerializer, CommentSerializer
+from .serializers import (
+    TaskSerializer,
+    TaskValuesSerializer,
+    TaskCreateUpdateSerializer,
+    TaskBulkCreateSerializer,
+    TaskBulkUpdateSerializer,
+    CommentSerializer
+)
+
+User = get_user_model()
 
 
 class TaskBaseView(APIView):
@@ -20,7 +50,7 @@ class TaskBaseView(APIView):
     
     def get_task_or_404(self, task_id):
         """Get task object and check board permission"""
-        task = get_object_or_404(Task, id=task_id)
+        task = get_object_or_404(Task.objects.select_related('board'), id=task_id)
         
         # Check if user has access to the board
         if not self.check_board_permission(self.request.user, task.board):
@@ -31,8 +61,12 @@ class TaskBaseView(APIView):
     
     def check_board_permission(self, user, board):
         """Check board permission"""
-        return (board.owner == user or 
-                board.members.filter(id=user.id).exists())
+        membership = BoardMembership.for_request(self.request)
+        return membership.is_member_or_owner(board, user.id)
+    
+    def get_display_task(self, task):
+        """Reload a saved task with everything TaskSerializer needs"""
+        return Task.objects.for_display().get(pk=task.pk)
     
     def get_permission_error(self):
         """Standard permission error"""
@@ -41,29 +75,115 @@ class TaskBaseView(APIView):
             status=status.HTTP_403_FORBIDDEN
         )
 
-class TaskAssignedToMeView(APIView):
+class TaskListBaseView(APIView):
     """
-    GET /api/tasks/assigned-to-me/
-    Tasks assigned to me
+    Base class for the "my tasks" list views with filters and ordering
+    (see TaskListFilter), opt-in keyset pagination, opt-in streaming
+    (?stream=1, ?stream=ndjson) and sparse fieldsets (?fields=id,title)
     """
     permission_classes = [IsAuthenticated]
+    pagination_class = NewestFirstPagination
+    renderer_classes = [*api_settings.DEFAULT_RENDERER_CLASSES, NDJSONRenderer]
+    # Task field holding the requesting user
+    user_field = 'assignee'
+    
+    def get_queryset(self):
+        return Task.objects.filter(**{self.user_field: self.request.user})
+    
+    def get_filtered_tasks(self, serializer):
+        """Filtered and ordered values() rows, and a paginator in the same order"""
+        task_filter = TaskListFilter(self.request.query_params)
+        tasks = task_filter.filter_queryset(self.get_queryset())
+        paginator = self.pagination_class()
+        paginator.order_by(task_filter.ordering)
+        # The paginator reads the cursor columns even if the fields omit them
+        tasks = serializer.prepare(tasks, 'id', paginator.ordering_field).order_by(
+            *paginator.get_ordering(Task)
+        )
+        return tasks, paginator
     
     def get(self, request):
-        tasks = Task.objects.filter(assignee=request.user)
-        serializer = TaskSerializer(tasks, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        serializer = TaskValuesSerializer.for_request(request)
+        tasks, paginator = self.get_filtered_tasks(serializer)
+        page = paginator.paginate_queryset(tasks, request, view=self)
+        if page is not None:
+            return paginator.get_paginated_response(serializer.serialize_rows(page))
+        
+        stream_format = get_stream_format(request)
+        if stream_format:
+            return stream_queryset(tasks, serializer, stream_format)
+        
+        return Response(serializer.serialize_rows(tasks), status=status.HTTP_200_OK)
 
-class TaskReviewingView(APIView):
+class TaskAssignedToMeView(TaskListBaseView):
+    """
+    GET /api/tasks/assigned-to-me/
+    Tasks assigned to me
+    """
+    user_field = 'assignee'
+
+class TaskReviewingView(TaskListBaseView):
     """
     GET /api/tasks/reviewing/
     Tasks I should review
     """
+    user_field = 'reviewer'
+
+class TaskSearchView(APIView):
+    """
+    GET /api/tasks/search/?q=<words>[&page=2][&page_size=20][&fields=id,title]
+    Tasks of my boards matching all words in title, description or
+    comments, best match first
+    """
     permission_classes = [IsAuthenticated]
+    pagination_class = RankedPagination
     
     def get(self, request):
-        tasks = Task.objects.filter(reviewer=request.user)
-        serializer = TaskSerializer(tasks, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        query = request.query_params.get('q', '')
+        if not search.parse_words(query):
+            return Response(
+                {'error': 'q must contain at least one word'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        serializer = TaskValuesSerializer.for_request(request)
+        paginator = self.pagination_class()
+        offset, limit = paginator.get_window(request)
+        boards = Board.objects.visible_to(request.user)
+        task_ids = paginator.set_page(
+            search.get_search_backend().search(query, boards, offset, limit)
+        )
+        
+        rows = serializer.prepare(Task.objects.filter(id__in=task_ids), 'id')
+        rows_by_id = {row['id']: row for row in rows}
+        # Keep the rank order, skip tasks deleted since the index was read
+        results = serializer.serialize_rows(
+            rows_by_id[task_id] for task_id in task_ids if task_id in rows_by_id
+        )
+        return paginator.get_paginated_response(results)
+
+class SummaryView(APIView):
+    """
+    GET /api/summary/
+    Task counters of my boards: totals by status and priority, urgent,
+    overdue, assigned to me, reviewing and the nearest due date, overall
+    and per board
+    """
+    permission_classes = [IsAuthenticated]
+    
+    def get(self, request):
+        return Response(summary.get_summary(request.user))
+
+class TaskCountsView(APIView):
+    """
+    GET /api/tasks/counts/
+    Number of tasks assigned to me and to review, per status, and my
+    overdue tasks
+    """
+    permission_classes = [IsAuthenticated]
+    
+    def get(self, request):
+        return Response(counters.user_task_counts(request.user))
 
 class TaskCreateView(TaskBaseView):
     """
@@ -80,7 +200,6 @@ class TaskCreateView(TaskBaseView):
             )
         
         # Check if board exists - return 404 if not found
-        from boards_app.models import Board
         try:
             board = Board.objects.get(id=board_id)
         except Board.DoesNotExist:
@@ -103,7 +222,7 @@ class TaskCreateView(TaskBaseView):
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
         
         task = serializer.save()
-        response_serializer = TaskSerializer(task)
+        response_serializer = TaskSerializer(self.get_display_task(task))
         return Response(response_serializer.data, status=status.HTTP_201_CREATED)
 
 class TaskDetailView(TaskBaseView):
@@ -129,7 +248,7 @@ class TaskDetailView(TaskBaseView):
         )
         if serializer.is_valid():
             updated_task = serializer.save()
-            response_serializer = TaskSerializer(updated_task)
+            response_serializer = TaskSerializer(self.get_display_task(updated_task))
             return Response(response_serializer.data, status=status.HTTP_200_OK)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
     
@@ -147,7 +266,219 @@ class TaskDetailView(TaskBaseView):
     
     def _check_delete_permission(self, user, task):
         """Check delete permission"""
-        return (task.created_by == user or task.board.owner == user)
+        return (task.created_by_id == user.id or task.board.owner_id == user.id)
+
+class TaskBulkView(TaskBaseView):
+    """
+    POST/PATCH /api/tasks/bulk/[?atomic=true]
+    Create or update many tasks with set-based validation
+    
+    Items that fail validation are reported in "errors" by list index and
+    the valid ones are written, unless atomic mode is requested.
+    """
+    MAX_ITEMS = 5000
+    USER_FIELDS = (('assignee_id', 'Assignee'), ('reviewer_id', 'Reviewer'))
+    
+    def post(self, request):
+        items = self._get_items(request)
+        if isinstance(items, Response):
+            return items
+        
+        valid, errors = self._validate_fields(items, TaskBulkCreateSerializer)
+        boards = Board.objects.in_bulk({data['board'] for _, data in valid})
+        membership = BoardMembership.for_request(request)
+        membership.prefetch(boards.values())
+        
+        tasks = []
+        for index, data in valid:
+            board = boards.get(data['board'])
+            item_errors = self._check_board(board, membership)
+            if not item_errors:
+                data['board'] = board
+                item_errors = self._check_users(data, board, membership)
+            if item_errors:
+                errors.append(self._item_error(index, item_errors, data))
+                continue
+            tasks.append(self._build_task(data, request.user))
+        
+        self._add_missing_user_errors(errors)
+        return self._write(
+            request, errors, tasks, self._create_tasks, status.HTTP_201_CREATED
+        )
+    
+    def patch(self, request):
+        items = self._get_items(request)
+        if isinstance(items, Response):
+            return items
+        
+        valid, errors = self._validate_fields(
+            items, TaskBulkUpdateSerializer, partial=True
+        )
+        tasks_by_id = Task.objects.select_related('board').in_bulk(
+            {data['id'] for _, data in valid if 'id' in data}
+        )
+        membership = BoardMembership.for_request(request)
+        membership.prefetch(task.board for task in tasks_by_id.values())
+        
+        tasks, fields, seen_ids = [], {'updated_at'}, set()
+        for index, data in valid:
+            if 'id' not in data:
+                errors.append(
+                    self._item_error(index, {'id': 'This field is required.'})
+                )
+                continue
+            task_id = data.pop('id')
+            if task_id in seen_ids:
+                errors.append(self._item_error(index, {'id': 'Duplicate task id.'}))
+                continue
+            seen_ids.add(task_id)
+            task = tasks_by_id.get(task_id)
+            if task is None:
+                errors.append(self._item_error(index, {'id': 'Task not found.'}))
+                continue
+            
+            # Board cannot be changed
+            data.pop('board', None)
+            item_errors = (self._check_board(task.board, membership)
+                           or self._check_users(data, task.board, membership))
+            if item_errors:
+                errors.append(self._item_error(index, item_errors, data))
+                continue
+            
+            for attr, value in data.items():
+                setattr(task, attr, value)
+            fields.update(data)
+            tasks.append(task)
+        
+        self._add_missing_user_errors(errors)
+        return self._write(
+            request, errors, tasks,
+            lambda tasks: self._update_tasks(tasks, sorted(fields)),
+            status.HTTP_200_OK
+        )
+    
+    def _get_items(self, request):
+        """Request body must be a non-empty list of at most MAX_ITEMS"""
+        items = request.data
+        if not isinstance(items, list) or not items:
+            return Response(
+                {'error': 'Expected a non-empty list of tasks'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if len(items) > self.MAX_ITEMS:
+            return Response(
+                {'error': f'At most {self.MAX_ITEMS} tasks per request'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        return items
+    
+    def _validate_fields(self, items, serializer_class, partial=False):
+        """Field validation per item, no database access"""
+        valid, errors = [], []
+        for index, item in enumerate(items):
+            serializer = serializer_class(data=item, partial=partial)
+            if serializer.is_valid():
+                valid.append((index, dict(serializer.validated_data)))
+            else:
+                errors.append(self._item_error(index, serializer.errors))
+        return valid, errors
+    
+    def _check_board(self, board, membership):
+        """Board must exist and the requesting user must have access"""
+        if board is None:
+            return {'board': 'Board not found.'}
+        if not membership.is_member_or_owner(board, self.request.user.id):
+            return {'board': 'No permission for this board.'}
+        return None
+    
+    def _check_users(self, data, board, membership):
+        """Assignee and reviewer must be members of the board"""
+        errors = {}
+        for field, label in self.USER_FIELDS:
+            user_id = data.get(field)
+            if not user_id:
+                # Empty ids leave the current value untouched
+                data.pop(field, None)
+            elif not membership.is_member_or_owner(board, user_id):
+                errors[field] = f'{label} must be a member of the board.'
+        return errors
+    
+    def _add_missing_user_errors(self, errors):
+        """Tell missing users and non-members apart with one query"""
+        user_ids = {
+            error['data'][field]
+            for error in errors
+            for field, _ in self.USER_FIELDS
+            if field in error['errors'] and field in error['data']
+        }
+        existing = set(
+            User.objects.filter(id__in=user_ids).values_list('id', flat=True)
+        )
+        for error in errors:
+            data = error.pop('data')
+            for field, label in self.USER_FIELDS:
+                if field in error['errors'] and data.get(field) not in existing:
+                    error['errors'][field] = f'{label} does not exist.'
+    
+    def _item_error(self, index, item_errors, data=None):
+        """Error entry, data holds the validated item until user ids are checked"""
+        return {'index': index, 'errors': item_errors, 'data': data or {}}
+    
+    def _build_task(self, data, user):
+        data['created_by'] = user
+        return Task(**data)
+    
+    def _create_tasks(self, tasks):
+        """Insert tasks, update the board counters, change log and search index"""
+        created = Task.objects.bulk_create(tasks)
+        counters.apply_board_deltas_many(counters.tasks_created_deltas(created))
+        counters.apply_user_deltas(counters.tasks_user_deltas(created, created=True))
+        changes.tasks_written(created, 'created')
+        search.tasks_written(created, created=True)
+        summary.tasks_written(created)
+        return created
+    
+    def _update_tasks(self, tasks, fields):
+        """
+        Write changed fields, update the board counters, change log and
+        search index
+        """
+        now = timezone.now()
+        for task in tasks:
+            task.updated_at = now
+        
+        Task.lock_tracked_values(tasks)
+        Task.objects.bulk_update(tasks, fields)
+        counters.apply_board_deltas_many(counters.tasks_changed_deltas(tasks))
+        counters.apply_user_deltas(counters.tasks_user_deltas(tasks))
+        changes.tasks_written(tasks, 'updated')
+        search.tasks_written(tasks)
+        summary.tasks_written(tasks)
+        for task in tasks:
+            task.remember_tracked_values()
+        return tasks
+    
+    def _write(self, request, errors, tasks, writer, success_status):
+        """Write valid tasks in one transaction and build the response"""
+        errors.sort(key=lambda error: error['index'])
+        atomic = request.query_params.get('atomic', '').lower() in ('1', 'true')
+        if errors and (atomic or not tasks):
+            return Response(
+                {'results': [], 'errors': errors},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        with transaction.atomic():
+            written = writer(tasks)
+        
+        display = Task.objects.for_display().in_bulk([task.pk for task in written])
+        results = TaskSerializer(
+            [display[task.pk] for task in written], many=True
+        ).data
+        return Response(
+            {'results': results, 'errors': errors},
+            status=status.HTTP_207_MULTI_STATUS if errors else success_status
+        )
 
 class TaskCommentsView(TaskBaseView):
     """
@@ -160,11 +491,34 @@ class TaskCommentsView(TaskBaseView):
         if task is None:  # No board permission
             return self.get_permission_error()
         
-        return self._get_comments_response(task)
+        etag = self._get_comments_etag(request, task)
+        not_modified = not_modified_response(request, etag)
+        if not_modified is not None:
+            return not_modified
+        
+        return set_etag(self._get_comments_response(request, task), etag)
     
-    def _get_comments_response(self, task):
+    def _get_comments_etag(self, request, task):
+        """Validator from count and newest created_at in one aggregate query"""
+        state = task.comments.order_by().aggregate(**self._get_comments_state())
+        return self._make_comments_etag(request, task, state)
+    
+    def _get_comments_state(self):
+        """Aggregates of the comments validator"""
+        return {'count': models.Count('id'), 'last_created': models.Max('created_at')}
+    
+    def _make_comments_etag(self, request, task, state):
+        return make_etag(request, task.pk, state['count'], state['last_created'])
+    
+    def _get_comments_response(self, request, task):
         """Get comments and create response"""
-        comments = task.comments.all()
+        comments = task.comments.select_related('author')
+        paginator = OldestFirstPagination()
+        page = paginator.paginate_queryset(comments, request, view=self)
+        if page is not None:
+            serializer = CommentSerializer(page, many=True)
+            return paginator.get_paginated_response(serializer.data)
+        
         serializer = CommentSerializer(comments, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
     
@@ -216,4 +570,61 @@ class CommentDetailView(APIView):
     
     def _check_author_permission(self, user, comment):
         """Check if user is the author"""
-        return comment.author == user
\ No newline at end of file
+        return comment.author == user
+
+
+class AsyncTaskListMixin(AsyncDispatchMixin):
+    """
+    Async get() of the TaskListBaseView subclasses
+    """
+    async def get(self, request):
+        serializer = TaskValuesSerializer.for_request(request)
+        tasks, paginator = self.get_filtered_tasks(serializer)
+        page = await paginator.apaginate_queryset(tasks, request, view=self)
+        if page is not None:
+            return paginator.get_paginated_response(serializer.serialize_rows(page))
+        
+        stream_format = get_stream_format(request)
+        if stream_format:
+            return astream_queryset(tasks, serializer, stream_format)
+        
+        rows = [row async for row in tasks]
+        return Response(serializer.serialize_rows(rows), status=status.HTTP_200_OK)
+
+class AsyncTaskAssignedToMeView(AsyncTaskListMixin, TaskAssignedToMeView):
+    """
+    Async counterpart of TaskAssignedToMeView
+    """
+
+class AsyncTaskReviewingView(AsyncTaskListMixin, TaskReviewingView):
+    """
+    Async counterpart of TaskReviewingView
+    """
+
+class AsyncTaskCommentsView(AsyncDispatchMixin, TaskCommentsView):
+    """
+    Async counterpart of TaskCommentsView, POST runs the sync handler
+    """
+    async def get(self, request, task_id):
+        task = await sync_to_async(self.get_task_or_404)(task_id)
+        
+        if task is None:  # No board permission
+            return self.get_permission_error()
+        
+        state = await task.comments.order_by().aaggregate(**self._get_comments_state())
+        etag = self._make_comments_etag(request, task, state)
+        not_modified = not_modified_response(request, etag)
+        if not_modified is not None:
+            return not_modified
+        
+        comments = task.comments.select_related('author')
+        paginator = OldestFirstPagination()
+        page = await paginator.apaginate_queryset(comments, request, view=self)
+        if page is not None:
+            serializer = CommentSerializer(page, many=True)
+            return set_etag(paginator.get_paginated_response(serializer.data), etag)
+        
+        serializer = CommentSerializer(
+            [comment async for comment in comments], many=True
+        )
+        return set_etag(Response(serializer.data, status=status.HTTP_200_OK), etag)
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class TasksAppConfig(AppConfig):
     name = 'tasks_app'
     verbose_name = 'Tasks'
+    
+    def ready(self):
+        # Register counter, change log and search index maintenance
+        from . import signals  # noqa: F401
@@ -0,0 +1,226 @@
+"""
+Maintenance of the denormalized task and comment counters.
+
+``Board.ticket_count``, ``Board.tasks_to_do_count``,
+``Board.tasks_high_prio_count`` and ``Task.comments_count`` are updated
+with ``F()`` expressions in the same transaction as the write that
+changes them. The signal handlers in ``tasks_app.signals`` cover
+single-object writes, bulk writes apply the collected deltas themselves.
+``manage.py rebuild_counters`` recomputes and verifies all counters.
+
+``UserTaskCounter`` rows count the tasks each user is assignee or reviewer
+of per status. They follow the same writes; board deletes subtract the
+board's tasks in one grouped query before the cascade. Overdue counts
+depend on the date and are computed live by ``user_task_counts``.
+
+The same UPDATEs bump ``Board.updated_at`` (and ``Task.updated_at`` for
+comments), so every task or comment change moves the board's conditional
+GET validator.
+"""
+
+from collections import Counter, defaultdict
+
+from django.db.models import Count, F, OuterRef
+from django.utils import timezone
+
+from boards_app.models import Board
+from core.db import count_subquery
+from tasks_app.models import Comment, Task, UserTaskCounter
+
+USER_ROLES = [role for role, _ in UserTaskCounter.ROLE_CHOICES]
+
+
+def board_counter_deltas(status, priority, sign=1):
+    """Board counter contributions of a task with status and priority"""
+    return Counter({
+        'ticket_count': sign,
+        'tasks_to_do_count': sign if status == 'to-do' else 0,
+        'tasks_high_prio_count': sign if priority == 'high' else 0,
+    })
+
+
+def apply_board_deltas(board_id, deltas):
+    """Add deltas to the counters of one board and touch it in one UPDATE"""
+    changes = {
+        field: F(field) + delta
+        for field, delta in deltas.items()
+        if delta
+    }
+    Board.objects.filter(pk=board_id).update(updated_at=timezone.now(), **changes)
+
+
+def apply_board_deltas_many(deltas_by_board):
+    """Apply {board_id: deltas} collected by a bulk write"""
+    for board_id, deltas in deltas_by_board.items():
+        apply_board_deltas(board_id, deltas)
+
+
+def tasks_created_deltas(tasks):
+    """Board deltas of tasks inserted with bulk_create"""
+    deltas_by_board = defaultdict(Counter)
+    for task in tasks:
+        deltas_by_board[task.board_id].update(
+            board_counter_deltas(task.status, task.priority)
+        )
+    return deltas_by_board
+
+
+def tasks_changed_deltas(tasks):
+    """Board deltas of tasks changed with bulk_update (uses loaded values)"""
+    deltas_by_board = defaultdict(Counter)
+    for task in tasks:
+        old = task.get_loaded_values()
+        deltas = deltas_by_board[task.board_id]
+        deltas.update(board_counter_deltas(task.status, task.priority))
+        deltas.subtract(board_counter_deltas(
+            old.get('status', task.status), old.get('priority', task.priority)
+        ))
+    return deltas_by_board
+
+
+def user_counter_deltas(task, values=None, sign=1):
+    """
+    {(user_id, role, status): delta} of a task, values overrides the
+    instance's assignee_id, reviewer_id and status (e.g. loaded values)
+    """
+    values = values or {}
+    status = values.get('status', task.status)
+    deltas = Counter()
+    for role in USER_ROLES:
+        user_id = values.get(f'{role}_id', getattr(task, f'{role}_id'))
+        if user_id is not None:
+            deltas[(user_id, role, status)] += sign
+    return deltas
+
+
+def apply_user_deltas(deltas):
+    """Add deltas to the per-user counters, missing rows are created at 0"""
+    deltas = {key: delta for key, delta in deltas.items() if delta}
+    UserTaskCounter.objects.bulk_create([
+        UserTaskCounter(user_id=user_id, role=role, status=status)
+        for (user_id, role, status), delta in deltas.items()
+        if delta > 0
+    ], ignore_conflicts=True)
+    for (user_id, role, status), delta in deltas.items():
+        UserTaskCounter.objects.filter(
+            user_id=user_id, role=role, status=status
+        ).update(count=F('count') + delta)
+
+
+def tasks_user_deltas(tasks, created=False):
+    """Per-user deltas of tasks written with bulk_create or bulk_update"""
+    deltas = Counter()
+    for task in tasks:
+        deltas.update(user_counter_deltas(task))
+        if not created:
+            deltas.subtract(user_counter_deltas(task, task.get_loaded_values()))
+    return deltas
+
+
+def board_deleted(board):
+    """Subtract the board's tasks from the per-user counters before the cascade"""
+    totals = user_counter_totals(Task.objects.filter(board=board))
+    apply_user_deltas({key: -count for key, count in totals.items()})
+
+
+def task_created(task):
+    apply_board_deltas(
+        task.board_id, board_counter_deltas(task.status, task.priority)
+    )
+    apply_user_deltas(user_counter_deltas(task))
+
+
+def task_deleted(task):
+    """Use the stored values, unsaved changes on the instance don't count"""
+    loaded = task.get_loaded_values()
+    apply_board_deltas(task.board_id, board_counter_deltas(
+        loaded.get('status', task.status),
+        loaded.get('priority', task.priority),
+        sign=-1,
+    ))
+    apply_user_deltas(user_counter_deltas(task, loaded, sign=-1))
+
+
+def task_changed(task, old_values):
+    """Status, priority, assignee or reviewer of an existing task may have changed"""
+    deltas = board_counter_deltas(task.status, task.priority)
+    deltas.subtract(board_counter_deltas(
+        old_values.get('status', task.status),
+        old_values.get('priority', task.priority),
+    ))
+    apply_board_deltas(task.board_id, deltas)
+    
+    user_deltas = user_counter_deltas(task)
+    user_deltas.subtract(user_counter_deltas(task, old_values))
+    apply_user_deltas(user_deltas)
+
+
+def user_task_counts(user):
+    """Assigned and reviewing counts of the user per status, plus live overdue"""
+    statuses = [status for status, _ in Task.STATUS_CHOICES]
+    by_role = {role: dict.fromkeys(statuses, 0) for role in USER_ROLES}
+    rows = UserTaskCounter.objects.filter(user=user).values_list(
+        'role', 'status', 'count'
+    )
+    for role, status, count in rows:
+        by_role[role][status] = count
+    overdue = Task.objects.filter(
+        assignee=user, due_date__lt=timezone.localdate()
+    ).exclude(status='done')
+    return {
+        'assigned_count': sum(by_role['assignee'].values()),
+        'reviewing_count': sum(by_role['reviewer'].values()),
+        'overdue_count': overdue.count(),
+        'assigned_by_status': by_role['assignee'],
+        'reviewing_by_status': by_role['reviewer'],
+    }
+
+
+def apply_comment_delta(task_id, delta):
+    """Add delta to the comment counter of a task, touch task and board"""
+    now = timezone.now()
+    Task.objects.filter(pk=task_id).update(
+        comments_count=F('comments_count') + delta, updated_at=now
+    )
+    Board.objects.filter(tasks=task_id).update(updated_at=now)
+
+
+def comment_created(comment):
+    apply_comment_delta(comment.task_id, 1)
+
+
+def comment_deleted(comment):
+    apply_comment_delta(comment.task_id, -1)
+
+
+def board_counter_expressions():
+    """Expressions computing the board counters from the task table"""
+    tasks = Task.objects.filter(board_id=OuterRef('pk'))
+    return {
+        'ticket_count': count_subquery(tasks, 'board_id'),
+        'tasks_to_do_count': count_subquery(
+            tasks.filter(status='to-do'), 'board_id'
+        ),
+        'tasks_high_prio_count': count_subquery(
+            tasks.filter(priority='high'), 'board_id'
+        ),
+    }
+
+
+def task_counter_expressions():
+    """Expressions computing the task counters from the comment table"""
+    comments = Comment.objects.filter(task_id=OuterRef('pk'))
+    return {'comments_count': count_subquery(comments, 'task_id')}
+
+
+def user_counter_totals(tasks=None):
+    """{(user_id, role, status): count} of tasks (all by default) from the task table"""
+    totals = {}
+    tasks = (Task.objects.all() if tasks is None else tasks).order_by()
+    for role in USER_ROLES:
+        rows = tasks.filter(**{f'{role}__isnull': False}).values_list(
+            f'{role}_id', 'status'
+        ).annotate(count=Count('id'))
+        for user_id, status, count in rows:
+            totals[(user_id, role, status)] = count
+    return totals
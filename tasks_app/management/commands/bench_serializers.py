@@ -0,0 +1,94 @@
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from rest_framework.renderers import JSONRenderer
+
+from boards_app.api.serializers import BoardListSerializer, BoardListValuesSerializer
+from boards_app.models import Board
+from tasks_app.api.serializers import TaskSerializer, TaskValuesSerializer
+from tasks_app.models import Task
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    """
+    Compare DRF serializers with the values() serializers on large lists
+    
+    Usage: python manage.py bench_serializers [--rows 10000] [--repeat 3]
+    The benchmark rows are created in a transaction that is rolled back.
+    """
+    help = "Microbenchmark of DRF serializers vs values() serializers"
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=10000)
+        parser.add_argument('--repeat', type=int, default=3)
+    
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            self._seed(options['rows'])
+            tasks = Task.objects.filter(title__startswith='Serializer Bench Task')
+            boards = Board.objects.filter(
+                title__startswith='Serializer Bench Board'
+            ).with_counts()
+            
+            self._compare(
+                'tasks', options['repeat'],
+                lambda: TaskSerializer(tasks.for_display(), many=True).data,
+                lambda: TaskValuesSerializer().serialize(tasks),
+            )
+            self._compare(
+                'boards', options['repeat'],
+                lambda: BoardListSerializer(boards, many=True).data,
+                lambda: BoardListValuesSerializer().serialize(boards),
+            )
+            transaction.set_rollback(True)
+    
+    def _compare(self, name, repeat, drf, fast):
+        drf_time, drf_json = self._measure(drf, repeat)
+        fast_time, fast_json = self._measure(fast, repeat)
+        identical = 'identical' if drf_json == fast_json else 'DIFFERENT'
+        self.stdout.write(
+            f'{name}: DRF {drf_time * 1000:.1f} ms, values {fast_time * 1000:.1f} ms, '
+            f'speedup {drf_time / fast_time:.1f}x, JSON {identical}'
+        )
+    
+    def _measure(self, build, repeat):
+        """Best time of query + serialization + rendering"""
+        renderer = JSONRenderer()
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            content = renderer.render(build())
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        return best, content
+    
+    def _seed(self, rows):
+        users = User.objects.bulk_create([
+            User(
+                username=f'serializer-bench-{index}@example.com',
+                email=f'serializer-bench-{index}@example.com',
+                fullname=f'Bench User {index}',
+            )
+            for index in range(10)
+        ])
+        boards = Board.objects.bulk_create([
+            Board(
+                title=f'Serializer Bench Board {index}',
+                owner=users[index % len(users)],
+            )
+            for index in range(max(rows // 50, 1))
+        ])
+        Task.objects.bulk_create([
+            Task(
+                board=boards[index % len(boards)],
+                title=f'Serializer Bench Task {index}',
+                description='Lorem ipsum ' * 10, assignee=users[index % len(users)],
+                reviewer=users[(index + 1) % len(users)], created_by=users[0],
+            )
+            for index in range(rows)
+        ], batch_size=1000)
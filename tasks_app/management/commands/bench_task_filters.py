@@ -0,0 +1,108 @@
+import random
+import time
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test import override_settings
+from django.utils import timezone
+
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from boards_app.models import Board
+from tasks_app.api.views import TaskAssignedToMeView
+from tasks_app.models import Task
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    """
+    Bytes and latency of filtered assigned-to-me requests vs the full list
+    
+    Usage: python manage.py bench_task_filters [--tasks 20000] [--repeat 5]
+    Without server-side filters the client downloads the full list and
+    filters it itself, every row compares against that. The benchmark
+    user and tasks are created in a transaction that is rolled back.
+    """
+    help = "Benchmark the task list filters against downloading every task"
+    
+    BOARDS = 20
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--tasks', type=int, default=20000)
+        parser.add_argument('--repeat', type=int, default=5)
+    
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            user, boards = self._seed(options['tasks'])
+            today = timezone.localdate()
+            queries = [
+                '',
+                'status=review',
+                'status=to-do,in-progress&priority=high',
+                f'board={boards[0].id}',
+                f'board={boards[0].id}&status=to-do&ordering=due_date',
+                'overdue=true',
+                f'due_after={today}&due_before={today + timedelta(days=7)}',
+                'priority=high&ordering=due_date&page_size=50',
+            ]
+            
+            full_bytes, full_time = None, None
+            for query in queries:
+                rows, size, elapsed = self._measure(user, query, options['repeat'])
+                if full_bytes is None:
+                    full_bytes, full_time = size, elapsed
+                self.stdout.write(
+                    f'?{query or "(no filters)"}: {rows} rows, {size / 1024:.0f} KiB '
+                    f'({100 * size / full_bytes:.1f}% of full), '
+                    f'{elapsed * 1000:.1f} ms ({full_time / elapsed:.1f}x faster)'
+                )
+            transaction.set_rollback(True)
+    
+    @override_settings(ALLOWED_HOSTS=['testserver'])
+    def _measure(self, user, query, repeat):
+        """Row count, body size and best time of request + rendering"""
+        view = TaskAssignedToMeView.as_view()
+        best = None
+        for _ in range(repeat):
+            request = APIRequestFactory().get(f'/api/tasks/assigned-to-me/?{query}')
+            force_authenticate(request, user)
+            start = time.perf_counter()
+            response = view(request)
+            response.render()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        data = response.data
+        rows = len(data['results'] if isinstance(data, dict) else data)
+        return rows, len(response.content), best
+    
+    def _seed(self, count):
+        user = User.objects.create(
+            username='filter-bench@example.com', email='filter-bench@example.com',
+            fullname='Filter Bench',
+        )
+        boards = Board.objects.bulk_create([
+            Board(title=f'Filter Bench Board {index}', owner=user)
+            for index in range(self.BOARDS)
+        ])
+        
+        statuses = [choice for choice, _ in Task.STATUS_CHOICES]
+        priorities = [choice for choice, _ in Task.PRIORITY_CHOICES]
+        today = timezone.localdate()
+        Task.objects.bulk_create([
+            Task(
+                board=random.choice(boards), title=f'Filter Bench Task {index}',
+                description='Lorem ipsum ' * 10, status=random.choice(statuses),
+                priority=random.choice(priorities), assignee=user, created_by=user,
+                due_date=(today + timedelta(days=random.randint(-60, 120))
+                          if random.random() < 0.8 else None),
+            )
+            for index in range(count)
+        ], batch_size=1000)
+        
+        with connection.cursor() as cursor:
+            # Refresh planner statistics for the new rows
+            cursor.execute('ANALYZE')
+        return user, boards
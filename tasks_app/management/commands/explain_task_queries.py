@@ -0,0 +1,140 @@
+import random
+from datetime import date
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import F
+
+from boards_app.models import Board
+from tasks_app.models import Comment, Task
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    """
+    Seed a large task table and check the endpoint query plans with EXPLAIN
+    
+    The seeded rows are bulk inserted, bypassing the counters, the search
+    index and the change log, so they are rolled back after the EXPLAIN.
+    
+    Usage: python manage.py explain_task_queries --seed 1000000
+    """
+    help = "Check with EXPLAIN that the task endpoint queries use their index"
+    
+    BATCH_SIZE = 10000
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--seed', type=int, default=0,
+            help='Number of benchmark tasks to create first (e.g. 1000000)'
+        )
+        parser.add_argument('--users', type=int, default=100)
+        parser.add_argument('--boards', type=int, default=1000)
+    
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            if options['seed']:
+                self._seed(options['seed'], options['users'], options['boards'])
+            failures = self._explain()
+            transaction.set_rollback(True)
+        
+        if failures:
+            raise CommandError(f'{failures} queries do not use their index.')
+    
+    def _explain(self):
+        """Print the plan of every query and return how many miss their index"""
+        task = Task.objects.order_by('-id').first()
+        if task is None:
+            raise CommandError('No tasks found, run with --seed first.')
+        
+        failures = 0
+        for name, expected_index, queryset in self._get_queries(task):
+            plan = queryset.explain()
+            uses_index = self._uses_index(plan, expected_index)
+            failures += not uses_index
+            
+            style = self.style.SUCCESS if uses_index else self.style.ERROR
+            label = 'index' if uses_index else 'OTHER PLAN'
+            self.stdout.write(
+                style(f'[{label}] {name} (expected {expected_index})')
+            )
+            self.stdout.write(f'    {plan}')
+        return failures
+    
+    def _get_queries(self, task):
+        """Querysets as issued by the task and board endpoints"""
+        tasks = Task.objects.all()
+        return [
+            ('assigned-to-me', 'task_assignee_created_idx',
+             tasks.filter(assignee_id=task.assignee_id)
+             .order_by('-created_at', '-id')[:50]),
+            ('reviewing', 'task_reviewer_created_idx',
+             tasks.filter(reviewer_id=task.reviewer_id)
+             .order_by('-created_at', '-id')[:50]),
+            ('assigned-to-me ?status=review', 'task_assignee_created_idx',
+             tasks.filter(assignee_id=task.assignee_id, status__in=['review'])
+             .order_by('-created_at', '-id')[:50]),
+            ('assigned-to-me ?ordering=due_date', 'task_assignee_due_idx',
+             tasks.filter(assignee_id=task.assignee_id)
+             .order_by(F('due_date').asc(nulls_last=True), 'id')[:50]),
+            ('reviewing ?due_after=&due_before=', 'task_reviewer_due_idx',
+             tasks.filter(reviewer_id=task.reviewer_id, due_date__range=(
+                 date(2026, 1, 1), date(2026, 1, 31)
+             )).order_by('-created_at', '-id')),
+            ('board detail tasks', 'task_board_created_idx',
+             tasks.filter(board_id=task.board_id).order_by('-created_at', '-id')),
+            ('board to-do count', 'task_board_status_idx',
+             tasks.filter(board_id=task.board_id, status='to-do')
+             .order_by().values('id')),
+            ('board high-prio count', 'task_board_priority_idx',
+             tasks.filter(board_id=task.board_id, priority='high')
+             .order_by().values('id')),
+            ('task comments', 'comment_task_created_idx',
+             Comment.objects.filter(task_id=task.id).order_by('created_at', 'id')),
+        ]
+    
+    def _uses_index(self, plan, expected_index):
+        """
+        The plan names the expected index and scans no table sequentially
+        (SQLite 'USING INDEX <name>', PostgreSQL 'Index Scan using <name>')
+        """
+        return expected_index in plan and 'seq scan' not in plan.lower()
+    
+    def _seed(self, count, user_count, board_count):
+        """Bulk insert benchmark users, boards and tasks"""
+        users = User.objects.bulk_create([
+            User(
+                username=f'bench-{index}@example.com',
+                email=f'bench-{index}@example.com',
+                fullname=f'Bench User {index}',
+            )
+            for index in range(user_count)
+        ])
+        boards = Board.objects.bulk_create([
+            Board(title=f'Bench Board {index}', owner=random.choice(users))
+            for index in range(board_count)
+        ])
+        
+        statuses = [choice for choice, _ in Task.STATUS_CHOICES]
+        priorities = [choice for choice, _ in Task.PRIORITY_CHOICES]
+        for start in range(0, count, self.BATCH_SIZE):
+            batch = min(self.BATCH_SIZE, count - start)
+            Task.objects.bulk_create([
+                Task(
+                    board=random.choice(boards),
+                    title=f'Bench Task {start + index}',
+                    status=random.choice(statuses),
+                    priority=random.choice(priorities),
+                    assignee=random.choice(users),
+                    reviewer=random.choice(users),
+                    created_by=random.choice(users),
+                )
+                for index in range(batch)
+            ])
+            self.stdout.write(f'Seeded {start + batch}/{count} tasks')
+        
+        with connection.cursor() as cursor:
+            # Refresh planner statistics for the new rows
+            cursor.execute('ANALYZE')
@@ -0,0 +1,87 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import F, Q
+
+from boards_app.models import Board
+from tasks_app.counters import (
+    board_counter_expressions, task_counter_expressions, user_counter_totals
+)
+from tasks_app.models import Task, UserTaskCounter
+
+
+class Command(BaseCommand):
+    """
+    Recompute or verify the denormalized board, task and per-user counters
+    
+    Usage: python manage.py rebuild_counters [--verify]
+    """
+    help = "Rebuild (or with --verify only check) the stored task counters"
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--verify', action='store_true',
+            help='Only report counters that drifted, do not change them'
+        )
+    
+    def handle(self, *args, **options):
+        targets = [
+            (Board, board_counter_expressions()),
+            (Task, task_counter_expressions()),
+        ]
+        
+        if options['verify']:
+            drifted = sum(self._verify(model, exprs) for model, exprs in targets)
+            drifted += self._verify_user_counters()
+            if drifted:
+                raise CommandError(f'{drifted} rows have drifted counters.')
+            self.stdout.write(self.style.SUCCESS('All counters are exact.'))
+            return
+        
+        with transaction.atomic():
+            for model, expressions in targets:
+                updated = model.objects.update(**expressions)
+                self.stdout.write(
+                    f'Rebuilt counters of {updated} {model.__name__} rows'
+                )
+            UserTaskCounter.objects.all().delete()
+            created = UserTaskCounter.objects.bulk_create([
+                UserTaskCounter(user_id=user_id, role=role, status=status, count=count)
+                for (user_id, role, status), count in user_counter_totals().items()
+            ], batch_size=2000)
+            self.stdout.write(f'Rebuilt {len(created)} UserTaskCounter rows')
+        self.stdout.write(self.style.SUCCESS('Counters rebuilt.'))
+    
+    def _verify(self, model, expressions):
+        """Count and report rows where a stored counter differs"""
+        actual = {f'actual_{field}': expr for field, expr in expressions.items()}
+        mismatch = Q()
+        for field in expressions:
+            mismatch |= ~Q(**{field: F(f'actual_{field}')})
+        
+        rows = model.objects.annotate(**actual).filter(mismatch).values(
+            'pk', *expressions, *actual
+        )
+        count = 0
+        for row in rows:
+            count += 1
+            self.stdout.write(self.style.ERROR(f'{model.__name__} {row}'))
+        return count
+    
+    def _verify_user_counters(self):
+        """Count and report per-user counters that differ, missing rows count as 0"""
+        stored = {
+            (user_id, role, status): count
+            for user_id, role, status, count in UserTaskCounter.objects.values_list(
+                'user_id', 'role', 'status', 'count'
+            )
+        }
+        actual = user_counter_totals()
+        count = 0
+        for key in sorted(stored.keys() | actual.keys()):
+            if stored.get(key, 0) != actual.get(key, 0):
+                count += 1
+                self.stdout.write(self.style.ERROR(
+                    f'UserTaskCounter {key}: stored {stored.get(key, 0)}, '
+                    f'actual {actual.get(key, 0)}'
+                ))
+        return count
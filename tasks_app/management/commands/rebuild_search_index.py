@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from tasks_app.search import get_search_backend
+
+
+class Command(BaseCommand):
+    """
+    Create the task search index if needed and fill it from scratch
+    
+    Usage: python manage.py rebuild_search_index
+    Run it after switching TASK_SEARCH['BACKEND'] or to repair the index.
+    """
+    help = "Rebuild the full-text index of tasks and comments"
+    
+    def handle(self, *args, **options):
+        backend = get_search_backend()
+        with transaction.atomic():
+            backend.install()
+            backend.rebuild()
+        self.stdout.write(self.style.SUCCESS(
+            f'Search index rebuilt with {type(backend).__name__}.'
+        ))
@@ -0,0 +1,44 @@
+# Generated by Django 6.0.2 on 2026-10-18 10:40
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def _count(queryset, group_field):
+    counts = queryset.order_by().values(group_field).annotate(
+        count=Count('*')
+    ).values('count')
+    return Coalesce(Subquery(counts), 0)
+
+
+def populate_counters(apps, schema_editor):
+    Board = apps.get_model('boards_app', 'Board')
+    Task = apps.get_model('tasks_app', 'Task')
+    Comment = apps.get_model('tasks_app', 'Comment')
+
+    tasks = Task.objects.filter(board_id=OuterRef('pk'))
+    Board.objects.update(
+        ticket_count=_count(tasks, 'board_id'),
+        tasks_to_do_count=_count(tasks.filter(status='to-do'), 'board_id'),
+        tasks_high_prio_count=_count(tasks.filter(priority='high'), 'board_id'),
+    )
+    comments = Comment.objects.filter(task_id=OuterRef('pk'))
+    Task.objects.update(comments_count=_count(comments, 'task_id'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards_app', '0005_board_task_counters'),
+        ('tasks_app', '0006_task_task_board_created_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='comments_count',
+            field=models.IntegerField(default=0, editable=False, verbose_name='Comments Count'),
+        ),
+        migrations.RunPython(populate_counters, migrations.RunPython.noop),
+    ]
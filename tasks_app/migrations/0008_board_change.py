@@ -0,0 +1,63 @@
+# Generated by Django 6.0.2 on 2026-10-18 11:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def log_existing_rows(apps, schema_editor):
+    """Existing tasks and comments become 'created' entries, so since=0 syncs all"""
+    Task = apps.get_model('tasks_app', 'Task')
+    Comment = apps.get_model('tasks_app', 'Comment')
+    BoardChange = apps.get_model('tasks_app', 'BoardChange')
+
+    def entries():
+        tasks = Task.objects.order_by('created_at', 'id').values_list('id', 'board_id')
+        for task_id, board_id in tasks.iterator(chunk_size=2000):
+            yield BoardChange(
+                board_id=board_id, kind='task', object_id=task_id, action='created'
+            )
+        comments = Comment.objects.order_by('created_at', 'id').values_list(
+            'id', 'task__board_id'
+        )
+        for comment_id, board_id in comments.iterator(chunk_size=2000):
+            yield BoardChange(
+                board_id=board_id, kind='comment', object_id=comment_id,
+                action='created'
+            )
+
+    batch = []
+    for entry in entries():
+        batch.append(entry)
+        if len(batch) == 2000:
+            BoardChange.objects.bulk_create(batch)
+            batch = []
+    BoardChange.objects.bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards_app', '0005_board_task_counters'),
+        ('tasks_app', '0007_task_comments_count'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BoardChange',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('task', 'Task'), ('comment', 'Comment')], max_length=10, verbose_name='Kind')),
+                ('object_id', models.IntegerField(verbose_name='Object ID')),
+                ('action', models.CharField(choices=[('created', 'Created'), ('updated', 'Updated'), ('deleted', 'Deleted')], max_length=10, verbose_name='Action')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created At')),
+                ('board', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='changes', to='boards_app.board', verbose_name='Board')),
+            ],
+            options={
+                'verbose_name': 'Board Change',
+                'verbose_name_plural': 'Board Changes',
+                'ordering': ['id'],
+                'indexes': [models.Index(fields=['board', 'id'], name='boardchange_board_id_idx')],
+            },
+        ),
+        migrations.RunPython(log_existing_rows, migrations.RunPython.noop),
+    ]
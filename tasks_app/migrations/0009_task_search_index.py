@@ -0,0 +1,49 @@
+# Generated by Django 6.0.2 on 2026-10-18 14:05
+
+from django.db import migrations
+
+# Frozen copy of SQLiteFTS5Backend.install() and rebuild() as of this
+# migration, other databases search without an index
+SEARCH_TABLE = 'tasks_app_task_search'
+
+
+def create_search_index(apps, schema_editor):
+    """Create and fill the SQLite FTS5 index of tasks and comments"""
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    tasks = apps.get_model('tasks_app', 'Task')._meta.db_table
+    comments = apps.get_model('tasks_app', 'Comment')._meta.db_table
+    schema_editor.execute(
+        f'CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} USING fts5('
+        'title, description, comments, board, '
+        "tokenize = 'porter unicode61 remove_diacritics 2')"
+    )
+    schema_editor.execute(
+        f'INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}, rank) VALUES (%s, %s)',
+        ['rank', 'bm25(10.0, 4.0, 1.0, 0.0)']
+    )
+    schema_editor.execute(
+        f'INSERT INTO {SEARCH_TABLE}(rowid, title, description, comments, board) '
+        "SELECT task.id, task.title, task.description, "
+        "COALESCE(group_concat(comment.content, char(10)), ''), "
+        "'board' || task.board_id "
+        f'FROM {tasks} task '
+        f'LEFT JOIN {comments} comment ON comment.task_id = task.id '
+        'GROUP BY task.id'
+    )
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'sqlite':
+        schema_editor.execute(f'DROP TABLE IF EXISTS {SEARCH_TABLE}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks_app', '0008_board_change'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
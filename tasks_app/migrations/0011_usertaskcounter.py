@@ -0,0 +1,49 @@
+# Generated by Django 6.0.2 on 2026-10-18 16:05
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def populate_counters(apps, schema_editor):
+    Task = apps.get_model('tasks_app', 'Task')
+    UserTaskCounter = apps.get_model('tasks_app', 'UserTaskCounter')
+
+    counters = []
+    for role in ('assignee', 'reviewer'):
+        rows = Task.objects.filter(**{f'{role}__isnull': False}).order_by().values_list(
+            f'{role}_id', 'status'
+        ).annotate(count=Count('id'))
+        counters += [
+            UserTaskCounter(user_id=user_id, role=role, status=status, count=count)
+            for user_id, status, count in rows
+        ]
+    UserTaskCounter.objects.bulk_create(counters, batch_size=2000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks_app', '0010_task_due_date_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserTaskCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('role', models.CharField(choices=[('assignee', 'Assignee'), ('reviewer', 'Reviewer')], max_length=10, verbose_name='Role')),
+                ('status', models.CharField(choices=[('to-do', 'To Do'), ('in-progress', 'In Progress'), ('review', 'Review'), ('done', 'Done')], max_length=20, verbose_name='Status')),
+                ('count', models.IntegerField(default=0, verbose_name='Count')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='task_counters', to=settings.AUTH_USER_MODEL, verbose_name='User')),
+            ],
+            options={
+                'verbose_name': 'User Task Counter',
+                'verbose_name_plural': 'User Task Counters',
+                'constraints': [models.UniqueConstraint(fields=('user', 'role', 'status'), name='usertaskcounter_unique')],
+            },
+        ),
+        migrations.RunPython(populate_counters, migrations.RunPython.noop),
+    ]
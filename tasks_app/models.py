@@ -1,4 +1,4 @@
-from django.db import models
+from django.db import models, transaction
 from django.contrib.auth import get_user_model
 
 # Create your models here.
@@ -6,6 +6,20 @@ from django.contrib.auth import get_user_model
 
 User = get_user_model()
 
+class TaskQuerySet(models.QuerySet):
+    """
+    QuerySet with helpers for task display endpoints
+    """
+    
+    def for_display(self):
+        """Load the task and the user columns TaskSerializer needs"""
+        user_fields = [f'{user}__{field}' for user in ('assignee', 'reviewer')
+                       for field in ('id', 'email', 'fullname')]
+        task_fields = [field.name for field in self.model._meta.concrete_fields]
+        return self.select_related('assignee', 'reviewer').only(
+            *task_fields, *user_fields
+        )
+
 class Task(models.Model):
     """
     Task Model for tasks in boards
@@ -66,21 +80,103 @@ class Task(models.Model):
         related_name='created_tasks',
         verbose_name="Created By"
     )
+    # Denormalized comment counter, maintained by tasks_app.counters
+    comments_count = models.IntegerField(
+        default=0, editable=False, verbose_name="Comments Count"
+    )
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="Created At")
     updated_at = models.DateTimeField(auto_now=True, verbose_name="Updated At")
     
+    objects = TaskQuerySet.as_manager()
+    
+    # Fields whose previous values the counter and search signals need on update
+    TRACKED_FIELDS = (
+        'status', 'priority', 'title', 'description', 'assignee_id', 'reviewer_id'
+    )
+    
     class Meta:
         verbose_name = "Task"
         verbose_name_plural = "Tasks"
         ordering = ['-created_at']
+        indexes = [
+            # Board detail tasks and the per-board status/priority counters
+            models.Index(
+                fields=['board', '-created_at', '-id'],
+                name='task_board_created_idx'
+            ),
+            models.Index(fields=['board', 'status'], name='task_board_status_idx'),
+            models.Index(fields=['board', 'priority'], name='task_board_priority_idx'),
+            # Keyset pagination of assigned-to-me / reviewing
+            models.Index(
+                fields=['assignee', '-created_at', '-id'],
+                name='task_assignee_created_idx'
+            ),
+            models.Index(
+                fields=['reviewer', '-created_at', '-id'],
+                name='task_reviewer_created_idx'
+            ),
+            # Due date ordering and due date / overdue filters of the same lists
+            models.Index(
+                fields=['assignee', 'due_date', 'id'],
+                name='task_assignee_due_idx'
+            ),
+            models.Index(
+                fields=['reviewer', 'due_date', 'id'],
+                name='task_reviewer_due_idx'
+            ),
+        ]
     
     def __str__(self):
         return f"{self.title} ({self.board.title})"
     
-    @property
-    def comments_count(self):
-        """Number of comments"""
-        return self.comments.count()
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance.remember_tracked_values()
+        return instance
+    
+    def remember_tracked_values(self):
+        """Snapshot tracked field values as stored in the database"""
+        self._loaded_values = {
+            field: self.__dict__[field]
+            for field in self.TRACKED_FIELDS
+            if field in self.__dict__
+        }
+    
+    def get_loaded_values(self):
+        """Tracked values as stored in the database before the pending save"""
+        return getattr(self, '_loaded_values', {})
+    
+    @classmethod
+    def lock_tracked_values(cls, tasks):
+        """
+        Re-read the tracked values of saved tasks with a row lock
+        
+        Must run in a transaction. The values loaded with the instances
+        may be outdated by a concurrent write, counter deltas are derived
+        from the locked rows instead.
+        """
+        tasks = [task for task in tasks if task.pk is not None]
+        stored = {
+            row['id']: row
+            for row in cls.objects.select_for_update().order_by('pk').filter(
+                pk__in=[task.pk for task in tasks]
+            ).values('id', *cls.TRACKED_FIELDS)
+        }
+        for task in tasks:
+            values = stored.get(task.pk)
+            if values is not None:
+                task._loaded_values = {
+                    field: values[field] for field in cls.TRACKED_FIELDS
+                }
+    
+    def save(self, *args, **kwargs):
+        # Counter updates in the post_save signal share this transaction
+        with transaction.atomic():
+            if not self._state.adding:
+                Task.lock_tracked_values([self])
+            super().save(*args, **kwargs)
+        self.remember_tracked_values()
 
 class Comment(models.Model):
     """
@@ -105,7 +201,99 @@ class Comment(models.Model):
         verbose_name = "Comment"
         verbose_name_plural = "Comments"
         ordering = ['created_at']
+        indexes = [
+            # Keyset pagination of the comments of a task
+            models.Index(
+                fields=['task', 'created_at', 'id'],
+                name='comment_task_created_idx'
+            ),
+        ]
     
     def __str__(self):
         return f"Comment by {self.author.fullname} on {self.task.title}"
     
+    def save(self, *args, **kwargs):
+        # Counter updates in the post_save signal share this transaction
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+
+
+class BoardChange(models.Model):
+    """
+    Append-only log of task and comment writes per board
+    
+    The auto-increment id is the cursor of GET /api/boards/{id}/changes/.
+    Deletes are kept as tombstones, the rows themselves are gone.
+    """
+    KIND_CHOICES = [
+        ('task', 'Task'),
+        ('comment', 'Comment'),
+    ]
+    
+    ACTION_CHOICES = [
+        ('created', 'Created'),
+        ('updated', 'Updated'),
+        ('deleted', 'Deleted'),
+    ]
+    
+    board = models.ForeignKey(
+        'boards_app.Board',
+        on_delete=models.CASCADE,
+        related_name='changes',
+        verbose_name="Board"
+    )
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES, verbose_name="Kind")
+    object_id = models.IntegerField(verbose_name="Object ID")
+    action = models.CharField(
+        max_length=10, choices=ACTION_CHOICES, verbose_name="Action"
+    )
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="Created At")
+    
+    class Meta:
+        verbose_name = "Board Change"
+        verbose_name_plural = "Board Changes"
+        ordering = ['id']
+        indexes = [
+            # Changes of a board after a cursor
+            models.Index(fields=['board', 'id'], name='boardchange_board_id_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.kind} {self.object_id} {self.action} (board {self.board_id})"
+
+
+class UserTaskCounter(models.Model):
+    """
+    Materialized number of tasks a user is assignee or reviewer of, per status
+    
+    Maintained by tasks_app.counters in the transaction of the task write.
+    Rows are created on first use and kept at 0.
+    """
+    ROLE_CHOICES = [
+        ('assignee', 'Assignee'),
+        ('reviewer', 'Reviewer'),
+    ]
+    
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='task_counters',
+        verbose_name="User"
+    )
+    role = models.CharField(max_length=10, choices=ROLE_CHOICES, verbose_name="Role")
+    status = models.CharField(
+        max_length=20, choices=Task.STATUS_CHOICES, verbose_name="Status"
+    )
+    count = models.IntegerField(default=0, verbose_name="Count")
+    
+    class Meta:
+        verbose_name = "User Task Counter"
+        verbose_name_plural = "User Task Counters"
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user', 'role', 'status'], name='usertaskcounter_unique'
+            ),
+        ]
+    
+    def __str__(self):
+        return f"{self.user_id} {self.role} {self.status}: {self.count}"
@@ -0,0 +1,232 @@
+"""
+Full-text search of tasks.
+
+A task is indexed as one document made of its title, description and the
+text of its comments. The backend class is configured with
+``TASK_SEARCH['BACKEND']``; ``"auto"`` picks the SQLite FTS5 index on
+SQLite and the unindexed ``DatabaseSearchBackend`` elsewhere. Any class
+with the methods of ``SearchBackend`` can replace it, for example one
+built on PostgreSQL's tsvector or an external search server.
+
+The signal handlers in ``tasks_app.signals`` keep the index in sync with
+single-object writes, bulk writes index their tasks themselves. The index
+is written in the transaction of the change. ``python manage.py
+rebuild_search_index`` rebuilds it from scratch.
+"""
+
+import re
+from abc import ABC, abstractmethod
+from functools import lru_cache
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connection, connections
+from django.db.models import Exists, OuterRef, Q
+from django.utils.module_loading import import_string
+
+from tasks_app.models import Comment, Task
+
+# Words of a query that are searched, further words are ignored
+MAX_QUERY_WORDS = 10
+# Fields of Task that are part of the indexed document
+INDEXED_FIELDS = ('title', 'description')
+
+WORD_RE = re.compile(r'\w+')
+
+
+def parse_words(query):
+    """Words of a search query, punctuation and operators are dropped"""
+    return WORD_RE.findall(query or '')[:MAX_QUERY_WORDS]
+
+
+class SearchBackend(ABC):
+    """
+    Interface of the task search backends
+    
+    Only search() is required, the index methods do nothing for backends
+    without index storage.
+    """
+    
+    def install(self, using=DEFAULT_DB_ALIAS):
+        """Create the index storage if the backend needs one"""
+    
+    def uninstall(self, using=DEFAULT_DB_ALIAS):
+        """Drop the index storage"""
+    
+    def index(self, task_ids):
+        """(Re)index the given tasks, including their comments"""
+    
+    def remove(self, task_ids):
+        """Drop the given tasks from the index"""
+    
+    def rebuild(self, using=DEFAULT_DB_ALIAS):
+        """Index every task from scratch"""
+    
+    @abstractmethod
+    def search(self, query, boards, offset, limit):
+        """Ids of tasks on boards matching every word of query, best first"""
+
+
+class SQLiteFTS5Backend(SearchBackend):
+    """
+    Inverted index in an SQLite FTS5 virtual table
+    
+    The rowid of the table is the task id. The board column holds one
+    token per task ("board<id>"), so scoping to the visible boards is part
+    of the MATCH and FTS5 only ranks the matches on those boards instead
+    of every match in the table. Words are matched case-insensitively,
+    without diacritics and after Porter stemming ("deploying" finds
+    "deploy"). Results are ranked by BM25 with title matches weighing most.
+    """
+    table = 'tasks_app_task_search'
+    # BM25 weights of the title, description, comments and board columns
+    weights = (10.0, 4.0, 1.0, 0.0)
+    # Ids per DELETE / INSERT ... SELECT statement
+    batch_size = 500
+    
+    def install(self, using=DEFAULT_DB_ALIAS):
+        with connections[using].cursor() as cursor:
+            cursor.execute(
+                f'CREATE VIRTUAL TABLE IF NOT EXISTS {self.table} USING fts5('
+                'title, description, comments, board, '
+                "tokenize = 'porter unicode61 remove_diacritics 2')"
+            )
+            weights = ', '.join(str(weight) for weight in self.weights)
+            cursor.execute(
+                f'INSERT INTO {self.table}({self.table}, rank) VALUES (%s, %s)',
+                ['rank', f'bm25({weights})']
+            )
+    
+    def uninstall(self, using=DEFAULT_DB_ALIAS):
+        with connections[using].cursor() as cursor:
+            cursor.execute(f'DROP TABLE IF EXISTS {self.table}')
+    
+    def index(self, task_ids):
+        self._write(task_ids, reindex=True)
+    
+    def remove(self, task_ids):
+        self._write(task_ids, reindex=False)
+    
+    def rebuild(self, using=DEFAULT_DB_ALIAS):
+        with connections[using].cursor() as cursor:
+            cursor.execute(f'DELETE FROM {self.table}')
+            cursor.execute(self._documents_sql())
+            # Merge the index segments written by the bulk insert
+            cursor.execute(
+                f'INSERT INTO {self.table}({self.table}) VALUES (%s)', ['optimize']
+            )
+    
+    def search(self, query, boards, offset, limit):
+        words = parse_words(query)
+        board_ids = list(boards.values_list('id', flat=True))
+        if not words or not board_ids:
+            return []
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'SELECT rowid FROM {self.table} WHERE {self.table} MATCH %s '
+                'ORDER BY rank LIMIT %s OFFSET %s',
+                [self.build_match(words, board_ids), limit, offset]
+            )
+            return [row[0] for row in cursor.fetchall()]
+    
+    def build_match(self, words, board_ids):
+        """
+        FTS5 query: every word as a quoted string in the text columns and
+        one of the board tokens in the board column
+        """
+        terms = ['"%s"' % word.replace('"', '""') for word in words]
+        boards = ' OR '.join(f'board{board_id}' for board_id in board_ids)
+        return (
+            f'{{title description comments}} : ({" ".join(terms)}) '
+            f'AND board : ({boards})'
+        )
+    
+    def _write(self, task_ids, reindex):
+        """Delete the documents of task_ids in batches, insert them again if reindex"""
+        task_ids = list(task_ids)
+        with connection.cursor() as cursor:
+            for start in range(0, len(task_ids), self.batch_size):
+                batch = task_ids[start:start + self.batch_size]
+                placeholders = ', '.join(['%s'] * len(batch))
+                cursor.execute(
+                    f'DELETE FROM {self.table} WHERE rowid IN ({placeholders})', batch
+                )
+                if reindex:
+                    cursor.execute(
+                        self._documents_sql(f'WHERE task.id IN ({placeholders})'), batch
+                    )
+    
+    def _documents_sql(self, where=''):
+        """INSERT ... SELECT of the documents of the tasks matched by where"""
+        tasks, comments = Task._meta.db_table, Comment._meta.db_table
+        return (
+            f'INSERT INTO {self.table}(rowid, title, description, comments, board) '
+            "SELECT task.id, task.title, task.description, "
+            "COALESCE(group_concat(comment.content, char(10)), ''), "
+            "'board' || task.board_id "
+            f'FROM {tasks} task '
+            f'LEFT JOIN {comments} comment ON comment.task_id = task.id '
+            f'{where} GROUP BY task.id'
+        )
+
+
+class DatabaseSearchBackend(SearchBackend):
+    """
+    Fallback without an index: case-insensitive substring matches
+    
+    Every search scans the tasks of the visible boards, results are
+    ordered newest first instead of by relevance.
+    """
+    
+    def search(self, query, boards, offset, limit):
+        words = parse_words(query)
+        if not words:
+            return []
+        condition = Q()
+        for word in words:
+            comments = Comment.objects.filter(
+                task_id=OuterRef('pk'), content__icontains=word
+            )
+            condition &= (Q(title__icontains=word) | Q(description__icontains=word)
+                          | Exists(comments))
+        tasks = Task.objects.filter(condition, board__in=boards.values('id'))
+        return list(
+            tasks.order_by('-created_at', '-id')
+            .values_list('id', flat=True)[offset:offset + limit]
+        )
+
+
+@lru_cache(maxsize=None)
+def get_search_backend():
+    """Process-wide backend built from the TASK_SEARCH setting"""
+    options = getattr(settings, 'TASK_SEARCH', {})
+    path = options.get('BACKEND', 'auto')
+    if path == 'auto':
+        if connection.vendor == 'sqlite':
+            return SQLiteFTS5Backend()
+        return DatabaseSearchBackend()
+    return import_string(path)()
+
+
+def text_changed(task):
+    """Whether an indexed field differs from the value loaded from the database"""
+    loaded = task.get_loaded_values()
+    return any(
+        loaded.get(field, getattr(task, field)) != getattr(task, field)
+        for field in INDEXED_FIELDS
+    )
+
+
+def tasks_written(tasks, created=False):
+    """Index created tasks and updated tasks whose text changed"""
+    task_ids = [task.pk for task in tasks if created or text_changed(task)]
+    if task_ids:
+        get_search_backend().index(task_ids)
+
+
+def task_deleted(task):
+    get_search_backend().remove([task.pk])
+
+
+def comment_written(comment):
+    """Comments are part of their task's document"""
+    get_search_backend().index([comment.task_id])
@@ -0,0 +1,176 @@
+from collections import defaultdict
+
+from django.contrib.auth import get_user_model
+from django.db.models import Q
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+from django.utils import timezone
+
+from boards_app.models import Board
+from tasks_app import changes, counters, search, summary
+from tasks_app.models import Comment, Task
+
+User = get_user_model()
+
+
+def _deleted_by(origin, model, pk):
+    """Whether the same delete() call removes this board or task"""
+    return pk in getattr(origin, '_cascade_deleted_pks', {}).get(model, ())
+
+
+@receiver(pre_delete, sender=Board)
+@receiver(pre_delete, sender=Task)
+def remember_cascade_delete(sender, instance, origin=None, **kwargs):
+    """
+    Record the boards and tasks a delete() removes on its origin
+    
+    Deleting a user deletes the boards they own, so the origin model
+    alone does not tell whether a task's board is going away.
+    """
+    if origin is not None:
+        deleted = origin.__dict__.setdefault('_cascade_deleted_pks', defaultdict(set))
+        deleted[sender].add(instance.pk)
+
+
+@receiver(post_save, sender=Task)
+def update_counters_on_task_save(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    if created:
+        counters.task_created(instance)
+    else:
+        counters.task_changed(instance, instance.get_loaded_values())
+
+
+@receiver(post_delete, sender=Task)
+def update_counters_on_task_delete(sender, instance, origin=None, **kwargs):
+    # The board row is deleted as well, its tasks left the user counters
+    # in update_user_counters_on_board_delete
+    if not _deleted_by(origin, Board, instance.board_id):
+        counters.task_deleted(instance)
+
+
+@receiver(pre_delete, sender=Board)
+def update_user_counters_on_board_delete(sender, instance, **kwargs):
+    """Cascaded task deletes skip the counters, subtract them all at once"""
+    counters.board_deleted(instance)
+
+
+@receiver(post_save, sender=Comment)
+def update_counters_on_comment_save(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        counters.comment_created(instance)
+
+
+@receiver(post_delete, sender=Comment)
+def update_counters_on_comment_delete(sender, instance, origin=None, **kwargs):
+    # The task row is deleted as well, no need to update it
+    if not _deleted_by(origin, Task, instance.task_id):
+        counters.comment_deleted(instance)
+
+
+@receiver(post_save, sender=Task)
+def log_task_save(sender, instance, created, raw=False, **kwargs):
+    if not raw:
+        changes.task_saved(instance, created)
+
+
+@receiver(post_delete, sender=Task)
+def log_task_delete(sender, instance, origin=None, **kwargs):
+    # The change log of the board is deleted as well
+    if not _deleted_by(origin, Board, instance.board_id):
+        changes.task_deleted(instance)
+
+
+@receiver(post_save, sender=Comment)
+def log_comment_save(sender, instance, created, raw=False, **kwargs):
+    if not raw:
+        changes.comment_written(instance, 'created' if created else 'updated')
+
+
+@receiver(post_delete, sender=Comment)
+def log_comment_delete(sender, instance, origin=None, **kwargs):
+    # Clients drop the comments of deleted tasks themselves
+    if not _deleted_by(origin, Task, instance.task_id):
+        changes.comment_written(instance, 'deleted')
+
+
+@receiver(post_save, sender=Task)
+def index_task_save(sender, instance, created, raw=False, **kwargs):
+    if not raw:
+        search.tasks_written([instance], created)
+
+
+@receiver(post_delete, sender=Task)
+def unindex_task_delete(sender, instance, **kwargs):
+    # The search index has no foreign key, board deletes need this too
+    search.task_deleted(instance)
+
+
+@receiver(post_save, sender=Comment)
+def index_comment_save(sender, instance, raw=False, **kwargs):
+    if not raw:
+        search.comment_written(instance)
+
+
+@receiver(post_delete, sender=Comment)
+def index_comment_delete(sender, instance, origin=None, **kwargs):
+    # The task is dropped from the index instead
+    if not _deleted_by(origin, Task, instance.task_id):
+        search.comment_written(instance)
+
+
+@receiver(post_save, sender=Task)
+def invalidate_summary_on_task_save(sender, instance, raw=False, **kwargs):
+    if not raw:
+        summary.tasks_written([instance])
+
+
+@receiver(post_delete, sender=Task)
+def invalidate_summary_on_task_delete(sender, instance, origin=None, **kwargs):
+    # Board deletes invalidate once in invalidate_summary_on_board_delete
+    if not _deleted_by(origin, Board, instance.board_id):
+        summary.tasks_written([instance])
+
+
+@receiver(post_save, sender=Board)
+def invalidate_summary_on_board_save(sender, instance, raw=False, **kwargs):
+    if not raw:
+        summary.board_saved(instance)
+
+
+@receiver(pre_delete, sender=Board)
+def invalidate_summary_on_board_delete(sender, instance, **kwargs):
+    """Members are only known before the delete"""
+    summary.boards_changed([instance.pk])
+
+
+@receiver(m2m_changed, sender=Board.members.through)
+def invalidate_summary_on_members_change(sender, instance, action, reverse,
+                                         pk_set, **kwargs):
+    """Boards appear in or disappear from the summaries of the changed users"""
+    if reverse:
+        # user.board_memberships.add/remove/clear(...)
+        if action in ('post_add', 'post_remove', 'post_clear'):
+            summary.summary_cache.invalidate([instance.pk])
+    elif action in ('post_add', 'post_remove'):
+        summary.summary_cache.invalidate(pk_set or ())
+    elif action == 'pre_clear':
+        summary.summary_cache.invalidate(
+            instance.members.values_list('id', flat=True)
+        )
+
+
+@receiver(pre_delete, sender=User)
+def touch_tasks_on_user_delete(sender, instance, **kwargs):
+    """Assignee and reviewer are set to NULL without sending signals"""
+    # Boards owned by the user are deleted with it, log nothing for them
+    tasks = list(
+        Task.objects.filter(Q(assignee=instance) | Q(reviewer=instance))
+        .exclude(board__owner=instance)
+        .only('id', 'board_id')
+    )
+    Board.objects.filter(
+        pk__in={task.board_id for task in tasks}
+    ).update(updated_at=timezone.now())
+    changes.tasks_written(tasks, 'updated')
@@ -0,0 +1,163 @@
+"""
+Dashboard summary of the tasks on a user's boards.
+
+``build_summary`` computes every counter with one grouped aggregate over
+the tasks of the visible boards, one row per board; the totals are summed
+from those rows. Summaries are cached per user, in the shared Django cache
+named by ``SUMMARY_CACHE['CACHE_ALIAS']`` or briefly in process. The
+signal handlers in ``tasks_app.signals`` drop the summaries of a board's
+owner and members when its tasks, title or members change, bulk writes do
+so themselves.
+"""
+
+from django.conf import settings
+from django.db.models import Count, Min, Q
+from django.utils import timezone
+
+from boards_app.models import Board
+from core.cache import InvalidatedCache
+from tasks_app.models import Task
+
+STATUSES = [value for value, _ in Task.STATUS_CHOICES]
+PRIORITIES = [value for value, _ in Task.PRIORITY_CHOICES]
+
+
+class SummaryCache(InvalidatedCache):
+    """
+    Cache of user_id -> summary, keyed by day as overdue counts depend on it
+    """
+    
+    @classmethod
+    def from_settings(cls):
+        """Build the cache from the SUMMARY_CACHE setting"""
+        options = getattr(settings, 'SUMMARY_CACHE', {})
+        return cls(
+            'task-summary',
+            max_size=options.get('MAX_SIZE', 10000),
+            timeout=options.get('TIMEOUT', 300),
+            cache_alias=options.get('CACHE_ALIAS'),
+            local_timeout=options.get('LOCAL_TIMEOUT', 5),
+        )
+    
+    def get(self, user_id):
+        return super().get(self._day_key(user_id))
+    
+    def set(self, user_id, summary):
+        super().set(self._day_key(user_id), summary)
+    
+    def invalidate(self, user_ids):
+        super().invalidate(self._day_key(user_id) for user_id in user_ids)
+    
+    def _day_key(self, user_id):
+        return f'{user_id}:{timezone.localdate().isoformat()}'
+
+
+summary_cache = SummaryCache.from_settings()
+
+
+def _aggregates(user, today):
+    """Aggregate expressions over the tasks of a board, by alias"""
+    open_tasks = ~Q(tasks__status='done')
+    aggregates = {
+        'task_count': Count('tasks'),
+        'urgent_count': Count('tasks', filter=open_tasks & Q(tasks__priority='high')),
+        'overdue_count': Count(
+            'tasks', filter=open_tasks & Q(tasks__due_date__lt=today)
+        ),
+        'assigned_to_me_count': Count('tasks', filter=Q(tasks__assignee=user)),
+        'reviewing_count': Count('tasks', filter=Q(tasks__reviewer=user)),
+        'nearest_due_date': Min(
+            'tasks__due_date', filter=open_tasks & Q(tasks__due_date__gte=today)
+        ),
+    }
+    # Aliases must be identifiers, "to-do" and "in-progress" are not
+    for index, value in enumerate(STATUSES):
+        aggregates[f'status_{index}'] = Count('tasks', filter=Q(tasks__status=value))
+    for index, value in enumerate(PRIORITIES):
+        aggregates[f'priority_{index}'] = Count(
+            'tasks', filter=Q(tasks__priority=value)
+        )
+    return aggregates
+
+
+def _counters(row):
+    """Summary counters of one aggregate row, or of the summed rows"""
+    return {
+        'task_count': row['task_count'],
+        'tasks_by_status': {
+            value: row[f'status_{index}'] for index, value in enumerate(STATUSES)
+        },
+        'tasks_by_priority': {
+            value: row[f'priority_{index}'] for index, value in enumerate(PRIORITIES)
+        },
+        'urgent_count': row['urgent_count'],
+        'overdue_count': row['overdue_count'],
+        'assigned_to_me_count': row['assigned_to_me_count'],
+        'reviewing_count': row['reviewing_count'],
+        'nearest_due_date': row['nearest_due_date'],
+    }
+
+
+def build_summary(user):
+    """Counters over all visible boards plus one entry per board, in one query"""
+    today = timezone.localdate()
+    aggregates = _aggregates(user, today)
+    rows = list(
+        Board.objects.visible_to(user)
+        .values('id', 'title')
+        .annotate(**aggregates)
+        .order_by('title', 'id')
+    )
+    
+    totals = {
+        alias: sum(row[alias] for row in rows)
+        for alias in aggregates if alias != 'nearest_due_date'
+    }
+    due_dates = [row['nearest_due_date'] for row in rows if row['nearest_due_date']]
+    totals['nearest_due_date'] = min(due_dates, default=None)
+    return {
+        'board_count': len(rows),
+        **_counters(totals),
+        'boards': [
+            {'id': row['id'], 'title': row['title'], **_counters(row)}
+            for row in rows
+        ],
+    }
+
+
+def get_summary(user):
+    """Cached summary of the user, built on a miss"""
+    summary = summary_cache.get(user.pk)
+    if summary is None:
+        summary = build_summary(user)
+        summary_cache.set(user.pk, summary)
+    return summary
+
+
+def board_user_ids(board_ids):
+    """
+    Owner and member ids of the boards, read from the database: a cached
+    membership entry may predate a member added by another process
+    """
+    board_ids = set(board_ids)
+    user_ids = set(
+        Board.objects.filter(pk__in=board_ids).values_list('owner_id', flat=True)
+    )
+    user_ids.update(
+        Board.members.through.objects.filter(board_id__in=board_ids)
+        .values_list('user_id', flat=True)
+    )
+    return user_ids
+
+
+def boards_changed(board_ids):
+    """Drop the summaries of everyone who sees one of the boards"""
+    summary_cache.invalidate(board_user_ids(board_ids))
+
+
+def board_saved(board):
+    summary_cache.invalidate(board_user_ids([board.pk]))
+
+
+def tasks_written(tasks):
+    boards_changed({task.board_id for task in tasks})
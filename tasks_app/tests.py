@@ -1,3 +1,990 @@
-from django.test import TestCase
+import json
+import uuid
+from datetime import date, datetime, time, timedelta, timezone as dt_timezone
+from decimal import Decimal
+from io import BytesIO, StringIO
+from unittest import skipUnless
 
-# Create your tests here.
+from asgiref.sync import sync_to_async
+from django.contrib.auth import get_user_model
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from django.utils.translation import gettext_lazy
+from django.urls import reverse
+
+from rest_framework.exceptions import ParseError
+from rest_framework.test import APIRequestFactory, APITestCase, force_authenticate
+
+from boards_app.membership import membership_cache
+from boards_app.models import Board
+from core.parsers import JSONParser
+from core.renderers import JSONRenderer, orjson
+from tasks_app.api.serializers import (
+    CommentSerializer,
+    TaskSerializer,
+    TaskValuesSerializer
+)
+from tasks_app.api.views import (
+    AsyncTaskAssignedToMeView,
+    AsyncTaskCommentsView,
+    AsyncTaskReviewingView,
+    TaskAssignedToMeView,
+    TaskCommentsView,
+    TaskReviewingView
+)
+from tasks_app import search
+from tasks_app.summary import SummaryCache, summary_cache
+from tasks_app.models import Task, UserTaskCounter
+
+User = get_user_model()
+
+
+class TaskTestMixin:
+    """
+    Shared fixtures for task API tests
+    """
+    
+    def setUp(self):
+        super().setUp()
+        # Process-global, board ids are reused once a test rolls back
+        membership_cache.clear()
+        self.addCleanup(membership_cache.clear)
+    
+    def create_user(self, email):
+        return User.objects.create_user(
+            username=email, email=email, fullname=email.split('@')[0],
+            password='secret-pass-123'
+        )
+    
+    def create_task(self, board, **kwargs):
+        kwargs.setdefault('title', 'Task')
+        kwargs.setdefault('created_by', board.owner)
+        return Task.objects.create(board=board, **kwargs)
+
+
+class TaskPaginationTests(TaskTestMixin, APITestCase):
+    """
+    Opt-in keyset pagination on the task list endpoints
+    """
+    
+    def setUp(self):
+        super().setUp()
+        self.user = self.create_user('owner@example.com')
+        self.client.force_authenticate(self.user)
+        self.board = Board.objects.create(title='Board', owner=self.user)
+        self.tasks = [
+            self.create_task(self.board, title=f'Task {index}', assignee=self.user)
+            for index in range(5)
+        ]
+    
+    def test_plain_list_without_pagination_params(self):
+        response = self.client.get(reverse('tasks-assigned-to-me'))
+        self.assertEqual(len(response.data), 5)
+    
+    def test_pages_follow_created_at_and_id(self):
+        url = reverse('tasks-assigned-to-me') + '?page_size=2'
+        seen = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            seen.extend(task['id'] for task in response.data['results'])
+            url = response.data['next']
+        expected = sorted(
+            self.tasks, key=lambda task: (task.created_at, task.id), reverse=True
+        )
+        self.assertEqual(seen, [task.id for task in expected])
+    
+    def test_comments_are_paginated_oldest_first(self):
+        task = self.tasks[0]
+        comments = [
+            task.comments.create(author=self.user, content=str(index))
+            for index in range(3)
+        ]
+        url = reverse('task-comments', args=[task.id])
+        first = self.client.get(url + '?page_size=2')
+        second = self.client.get(first.data['next'])
+        ids = [c['id'] for c in first.data['results'] + second.data['results']]
+        self.assertEqual(ids, [comment.id for comment in comments])
+        self.assertIsNone(second.data['next'])
+    
+    def test_invalid_cursor(self):
+        response = self.client.get(reverse('tasks-reviewing') + '?cursor=not-a-cursor')
+        self.assertEqual(response.status_code, 404)
+
+
+class TaskMembershipTests(TaskTestMixin, APITestCase):
+    """
+    Board membership is resolved once per request
+    """
+    
+    def setUp(self):
+        super().setUp()
+        self.owner = self.create_user('owner@example.com')
+        self.member = self.create_user('member@example.com')
+        self.outsider = self.create_user('outsider@example.com')
+        self.board = Board.objects.create(title='Board', owner=self.owner)
+        self.board.members.add(self.member)
+        self.task = self.create_task(self.board)
+        self.client.force_authenticate(self.member)
+    
+    def patch_task(self, data):
+        url = reverse('tasks-detail', args=[self.task.id])
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.patch(url, data, format='json')
+        membership_queries = [
+            query for query in context.captured_queries
+            if 'boards_app_board_members' in query['sql']
+        ]
+        return response, len(membership_queries)
+    
+    def test_patch_resolves_membership_once(self):
+        response, queries = self.patch_task(
+            {'assignee_id': self.member.id, 'reviewer_id': self.owner.id}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['assignee']['id'], self.member.id)
+        self.assertEqual(response.data['reviewer']['id'], self.owner.id)
+        # Membership once, plus the summary invalidation reading the members
+        self.assertEqual(queries, 2)
+    
+    def test_assignee_must_be_board_member(self):
+        response, _ = self.patch_task({'assignee_id': self.outsider.id})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('member of the board', str(response.data['assignee_id']))
+    
+    def test_assignee_must_exist(self):
+        response, _ = self.patch_task({'reviewer_id': 999999})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('does not exist', str(response.data['reviewer_id']))
+    
+    def test_outsider_gets_403(self):
+        self.client.force_authenticate(self.outsider)
+        response, _ = self.patch_task({'title': 'Changed'})
+        self.assertEqual(response.status_code, 403)
+
+
+class CounterTests(TaskTestMixin, APITestCase):
+    """
+    Stored board and task counters stay exact
+    """
+    
+    def setUp(self):
+        super().setUp()
+        self.owner = self.create_user('owner@example.com')
+        self.author = self.create_user('author@example.com')
+        self.board = Board.objects.create(title='Board', owner=self.owner)
+    
+    def assertBoardCounters(self, tickets, to_do, high_prio):
+        self.board.refresh_from_db()
+        self.assertEqual(
+            (self.board.ticket_count, self.board.tasks_to_do_count,
+             self.board.tasks_high_prio_count),
+            (tickets, to_do, high_prio)
+        )
+    
+    def test_task_create_change_and_delete(self):
+        task = self.create_task(self.board, status='to-do', priority='high')
+        self.create_task(self.board, status='done', priority='low')
+        self.assertBoardCounters(2, 1, 1)
+        
+        task = Task.objects.get(pk=task.pk)
+        task.status = 'review'
+        task.save()
+        self.assertBoardCounters(2, 0, 1)
+        
+        deferred = Task.objects.only('id', 'board').get(pk=task.pk)
+        deferred.priority = 'low'
+        deferred.save()
+        self.assertBoardCounters(2, 0, 0)
+        
+        Task.objects.get(pk=task.pk).delete()
+        self.assertBoardCounters(1, 0, 0)
+    
+    def test_stale_instances_keep_counters_exact(self):
+        task = self.create_task(self.board, status='to-do', assignee=self.owner)
+        first, second = Task.objects.get(pk=task.pk), Task.objects.get(pk=task.pk)
+        first.status = 'done'
+        first.save()
+        second.status = 'review'
+        second.save()
+        self.assertBoardCounters(1, 0, 0)
+        call_command('rebuild_counters', verify=True, stdout=StringIO())
+        
+        stale = Task.objects.get(pk=task.pk)
+        Task.objects.filter(pk=task.pk).update(status='to-do')  # concurrent write
+        Task.lock_tracked_values([stale])
+        self.assertEqual(stale.get_loaded_values()['status'], 'to-do')
+    
+    def test_comment_counter(self):
+        task = self.create_task(self.board)
+        comment = task.comments.create(author=self.owner, content='One')
+        task.comments.create(author=self.author, content='Two')
+        task.refresh_from_db()
+        self.assertEqual(task.comments_count, 2)
+        
+        comment.delete()
+        self.author.delete()
+        task.refresh_from_db()
+        self.assertEqual(task.comments_count, 0)
+    
+    def get_counts(self, user):
+        self.client.force_authenticate(user)
+        response = self.client.get(reverse('tasks-counts'))
+        self.assertEqual(response.status_code, 200)
+        return response.data
+    
+    def test_user_counters(self):
+        self.board.members.add(self.author)
+        task = self.create_task(
+            self.board, status='to-do', assignee=self.owner, reviewer=self.author,
+            due_date=timezone.localdate() - timedelta(days=1)
+        )
+        counts = self.get_counts(self.owner)
+        self.assertEqual(
+            (counts['assigned_count'], counts['reviewing_count'],
+             counts['overdue_count']),
+            (1, 0, 1)
+        )
+        self.assertEqual(counts['assigned_by_status']['to-do'], 1)
+        author_counts = self.get_counts(self.author)
+        self.assertEqual(author_counts['reviewing_by_status']['to-do'], 1)
+        
+        response = self.client.patch(
+            reverse('tasks-detail', args=[task.id]),
+            {'status': 'done', 'assignee_id': self.author.id,
+             'reviewer_id': self.owner.id},
+            format='json'
+        )
+        self.assertEqual(response.status_code, 200)
+        counts = self.get_counts(self.author)
+        self.assertEqual(counts['assigned_by_status'], {
+            'to-do': 0, 'in-progress': 0, 'review': 0, 'done': 1
+        })
+        self.assertEqual((counts['reviewing_count'], counts['overdue_count']), (0, 0))
+        counts = self.get_counts(self.owner)
+        self.assertEqual((counts['assigned_count'], counts['reviewing_count']), (0, 1))
+        
+        url = reverse('tasks-bulk')
+        response = self.client.post(url, [
+            {'board': self.board.id, 'title': 'Bulk', 'assignee_id': self.owner.id}
+        ], format='json')
+        bulk_id = response.data['results'][0]['id']
+        self.client.patch(url, [{'id': bulk_id, 'status': 'review'}], format='json')
+        self.assertEqual(self.get_counts(self.owner)['assigned_by_status']['review'], 1)
+        
+        Task.objects.get(pk=bulk_id).delete()
+        self.assertEqual(self.get_counts(self.owner)['assigned_count'], 0)
+        self.board.delete()
+        self.assertEqual(self.get_counts(self.author)['assigned_count'], 0)
+        call_command('rebuild_counters', verify=True, stdout=StringIO())
+    
+    def test_board_owner_delete(self):
+        self.board.members.add(self.author)
+        other_board = Board.objects.create(title='Other', owner=self.author)
+        self.create_task(self.board, assignee=self.author).comments.create(
+            author=self.author, content='Hi'
+        )
+        self.create_task(other_board, assignee=self.author)
+        self.assertEqual(self.get_counts(self.author)['assigned_count'], 2)
+        
+        self.owner.delete()
+        self.assertEqual(self.get_counts(self.author)['assigned_count'], 1)
+        call_command('rebuild_counters', verify=True, stdout=StringIO())
+    
+    def test_rebuild_and_verify_command(self):
+        self.create_task(
+            self.board, status='to-do', priority='high', assignee=self.owner
+        )
+        Board.objects.update(ticket_count=10)
+        UserTaskCounter.objects.update(count=5)
+        output = StringIO()
+        with self.assertRaises(CommandError):
+            call_command('rebuild_counters', verify=True, stdout=output)
+        self.assertIn('UserTaskCounter', output.getvalue())
+        call_command('rebuild_counters', stdout=StringIO())
+        self.assertBoardCounters(1, 1, 1)
+        self.assertEqual(self.get_counts(self.owner)['assigned_count'], 1)
+        call_command('rebuild_counters', verify=True, stdout=StringIO())
+
+
+class TaskBulkTests(TaskTestMixin, APITestCase):
+    """
+    POST/PATCH /api/tasks/bulk/
+    """
+    
+    def setUp(self):
+        super().setUp()
+        self.owner = self.create_user('owner@example.com')
+        self.member = self.create_user('member@example.com')
+        self.outsider = self.create_user('outsider@example.com')
+        self.board = Board.objects.create(title='Board', owner=self.owner)
+        self.board.members.add(self.member)
+        self.other_board = Board.objects.create(title='Other', owner=self.outsider)
+        self.client.force_authenticate(self.owner)
+        self.url = reverse('tasks-bulk')
+    
+    def item(self, **kwargs):
+        data = {'board': self.board.id, 'title': 'Imported', 'status': 'to-do'}
+        data.update(kwargs)
+        return data
+    
+    def test_create_reports_item_errors(self):
+        items = [
+            self.item(assignee_id=self.member.id, priority='high'),
+            self.item(board=self.other_board.id),
+            self.item(board=999999),
+            self.item(reviewer_id=self.outsider.id),
+            self.item(assignee_id=999999),
+            self.item(title=''),
+        ]
+        response = self.client.post(self.url, items, format='json')
+        self.assertEqual(response.status_code, 207)
+        self.assertEqual(len(response.data['results']), 1)
+        self.assertEqual(response.data['results'][0]['assignee']['id'], self.member.id)
+        
+        errors = {error['index']: error['errors'] for error in response.data['errors']}
+        self.assertEqual(sorted(errors), [1, 2, 3, 4, 5])
+        self.assertEqual(errors[1]['board'], 'No permission for this board.')
+        self.assertEqual(errors[2]['board'], 'Board not found.')
+        self.assertEqual(
+            errors[3]['reviewer_id'], 'Reviewer must be a member of the board.'
+        )
+        self.assertEqual(errors[4]['assignee_id'], 'Assignee does not exist.')
+        self.assertIn('title', errors[5])
+        
+        self.board.refresh_from_db()
+        self.assertEqual(
+            (self.board.ticket_count, self.board.tasks_to_do_count,
+             self.board.tasks_high_prio_count),
+            (1, 1, 1)
+        )
+    
+    def test_atomic_mode_writes_nothing_on_error(self):
+        items = [self.item(), self.item(board=999999)]
+        response = self.client.post(self.url + '?atomic=true', items, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(Task.objects.exists())
+    
+    def test_create_uses_constant_queries(self):
+        def post(count):
+            items = [self.item(assignee_id=self.member.id) for _ in range(count)]
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.post(self.url, items, format='json')
+            self.assertEqual(response.status_code, 201)
+            return len(context.captured_queries)
+        
+        membership_cache.clear()
+        small = post(2)
+        membership_cache.clear()
+        self.assertEqual(post(50), small)
+    
+    def test_update(self):
+        first = self.create_task(self.board, status='to-do')
+        second = self.create_task(self.board, status='to-do')
+        other = self.create_task(self.other_board)
+        items = [
+            {'id': first.id, 'status': 'done', 'assignee_id': self.member.id},
+            {'id': second.id, 'priority': 'high'},
+            {'id': other.id, 'title': 'Nope'},
+            {'title': 'No id'},
+        ]
+        response = self.client.patch(self.url, items, format='json')
+        self.assertEqual(response.status_code, 207)
+        self.assertEqual([task['id'] for task in response.data['results']],
+                         [first.id, second.id])
+        self.assertEqual([error['index'] for error in response.data['errors']], [2, 3])
+        
+        first.refresh_from_db()
+        self.assertEqual((first.status, first.assignee_id), ('done', self.member.id))
+        self.board.refresh_from_db()
+        self.assertEqual(
+            (self.board.ticket_count, self.board.tasks_to_do_count,
+             self.board.tasks_high_prio_count),
+            (2, 1, 1)
+        )
+    
+    def test_out_of_range_ids_are_item_errors(self):
+        items = [
+            self.item(),
+            self.item(board=10**30),
+            self.item(assignee_id=10**30),
+            self.item(reviewer_id=0),
+        ]
+        response = self.client.post(self.url, items, format='json')
+        self.assertEqual(response.status_code, 207)
+        self.assertEqual(len(response.data['results']), 1)
+        errors = {error['index']: error['errors'] for error in response.data['errors']}
+        self.assertEqual(sorted(errors), [1, 2, 3])
+        self.assertIn('board', errors[1])
+        self.assertIn('assignee_id', errors[2])
+        self.assertIn('reviewer_id', errors[3])
+        
+        task = self.create_task(self.board)
+        items = [{'id': task.id, 'title': 'Renamed'}, {'id': 10**30, 'title': 'Nope'}]
+        response = self.client.patch(self.url, items, format='json')
+        self.assertEqual(response.status_code, 207)
+        self.assertEqual([error['index'] for error in response.data['errors']], [1])
+    
+    def test_update_rejects_duplicate_ids(self):
+        task = self.create_task(self.board, status='to-do')
+        items = [{'id': task.id, 'status': 'done'}, {'id': task.id, 'status': 'done'}]
+        response = self.client.patch(self.url, items, format='json')
+        self.assertEqual(response.status_code, 207)
+        self.assertEqual(len(response.data['results']), 1)
+        self.assertEqual(response.data['errors'], [
+            {'index': 1, 'errors': {'id': 'Duplicate task id.'}}
+        ])
+        self.board.refresh_from_db()
+        self.assertEqual(
+            (self.board.ticket_count, self.board.tasks_to_do_count), (1, 0)
+        )
+
+
+class TaskStreamingTests(TaskTestMixin, APITestCase):
+    """
+    Opt-in streaming of the task list endpoints
+    """
+    
+    def setUp(self):
+        super().setUp()
+        self.user = self.create_user('owner@example.com')
+        self.client.force_authenticate(self.user)
+        self.board = Board.objects.create(title='Board', owner=self.user)
+        for index in range(3):
+            self.create_task(
+                self.board, title=f'Tâsk {index} ', assignee=self.user,
+                due_date=date(2026, 1, index + 1)
+            )
+        self.url = reverse('tasks-assigned-to-me')
+    
+    def test_json_stream_matches_regular_response(self):
+        regular = self.client.get(self.url)
+        streamed = self.client.get(self.url + '?stream=1')
+        self.assertTrue(streamed.streaming)
+        self.assertEqual(b''.join(streamed.streaming_content), regular.content)
+    
+    def test_ndjson_stream(self):
+        regular = self.client.get(self.url)
+        streamed = self.client.get(self.url, HTTP_ACCEPT='application/x-ndjson')
+        self.assertEqual(streamed['Content-Type'], 'application/x-ndjson')
+        lines = b''.join(streamed.streaming_content).splitlines()
+        self.assertEqual(
+            [json.loads(line) for line in lines], json.loads(regular.content)
+        )
+    
+    def test_board_detail_stream_matches_regular_response(self):
+        url = reverse('boards-detail', args=[self.board.id])
+        regular = self.client.get(url)
+        streamed = self.client.get(url + '?stream=1')
+        self.assertEqual(b''.join(streamed.streaming_content), regular.content)
+
+
+class TaskValuesSerializerTests(TaskTestMixin, APITestCase):
+    """
+    TaskValuesSerializer renders the same JSON as TaskSerializer
+    """
+    
+    def test_parity_with_task_serializer(self):
+        user = self.create_user('ünïcode@example.com')
+        board = Board.objects.create(title='Board', owner=user)
+        self.create_task(
+            board, title='Füll   task', description='Line\nbreak',
+            status='review', priority='high', assignee=user, reviewer=user,
+            due_date=date(2026, 12, 31)
+        )
+        task = self.create_task(board, title='Empty')
+        task.comments.create(author=user, content='Hi')
+        
+        tasks = Task.objects.all()
+        expected = JSONRenderer().render(
+            TaskSerializer(tasks.for_display(), many=True).data
+        )
+        actual = JSONRenderer().render(TaskValuesSerializer().serialize(tasks))
+        self.assertEqual(actual, expected)
+    
+    def test_sparse_fields(self):
+        user = self.create_user('sparse@example.com')
+        board = Board.objects.create(title='Board', owner=user)
+        task = self.create_task(
+            board, description='Long text', assignee=user, due_date=date(2026, 12, 31)
+        )
+        full = TaskValuesSerializer().serialize(Task.objects.all())[0]
+        serializer = TaskValuesSerializer(fields=['due_date', 'assignee', 'id'])
+        self.assertNotIn('description', serializer.get_value_fields())
+        self.assertEqual(serializer.serialize(Task.objects.all()), [{
+            'due_date': full['due_date'], 'assignee': full['assignee'], 'id': task.id,
+        }])
+    
+    def test_fields_parameter(self):
+        user = self.create_user('fields@example.com')
+        board = Board.objects.create(title='Board', owner=user)
+        for index in range(3):
+            self.create_task(board, title=f'Task {index}', assignee=user)
+        self.client.force_authenticate(user)
+        url = reverse('tasks-assigned-to-me')
+        
+        response = self.client.get(url + '?fields=id,title&page_size=2')
+        self.assertEqual([set(task) for task in response.data['results']],
+                         [{'id', 'title'}] * 2)
+        response = self.client.get(response.data['next'])
+        self.assertEqual(response.data['results'][0]['title'], 'Task 0')
+        
+        response = self.client.get(url + '?fields=title,password')
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('password', response.data['fields'])
+
+
+@skipUnless(orjson, 'orjson is not installed, both backends are the stdlib')
+class JSONBackendTests(TaskTestMixin, APITestCase):
+    """
+    core.renderers / core.parsers give the same results on both backends
+    """
+    
+    def render(self, data, backend):
+        with self.settings(JSON_BACKEND=backend):
+            return JSONRenderer().render(data)
+    
+    def test_renderer_parity(self):
+        data = {
+            'created_at': datetime(2026, 2, 3, 4, 5, 6, 789123, tzinfo=dt_timezone.utc),
+            'due_date': date(2026, 12, 31),
+            'time': time(8, 30, 15, 250000),
+            'amount': Decimal('12.50'),
+            'id': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+            'lazy': gettext_lazy('Not found.'),
+            'text': 'Ümlaut\u2028line\u2029',
+            3: [1, 2.5, None, True],
+            'big': 2 ** 70,
+        }
+        self.assertEqual(self.render(data, 'auto'), self.render(data, 'stdlib'))
+    
+    def test_comment_and_task_payloads(self):
+        user = self.create_user('owner@example.com')
+        board = Board.objects.create(title='Board', owner=user)
+        task = self.create_task(board, due_date=date(2026, 5, 1), assignee=user)
+        task.comments.create(author=user, content='Hällo')
+        payloads = [
+            TaskSerializer(Task.objects.all(), many=True).data,
+            CommentSerializer(task.comments.all(), many=True).data,
+        ]
+        for payload in payloads:
+            self.assertEqual(
+                self.render(payload, 'auto'), self.render(payload, 'stdlib')
+            )
+    
+    def test_parser(self):
+        body = '{"title": "Tâsk", "ids": [1, 2], "nested": {"a": null}}'.encode()
+        with self.settings(JSON_BACKEND='auto'):
+            fast = JSONParser().parse(BytesIO(body))
+        with self.settings(JSON_BACKEND='stdlib'):
+            stdlib = JSONParser().parse(BytesIO(body))
+        self.assertEqual(fast, stdlib)
+        with self.assertRaises(ParseError):
+            JSONParser().parse(BytesIO(b'{"broken": '))
+
+
+class CommentConditionalGetTests(TaskTestMixin, APITestCase):
+    """
+    GET /api/tasks/{task_id}/comments/ with If-None-Match
+    """
+    
+    def setUp(self):
+        super().setUp()
+        self.user = self.create_user('owner@example.com')
+        self.client.force_authenticate(self.user)
+        board = Board.objects.create(title='Board', owner=self.user)
+        self.task = self.create_task(board)
+        self.task.comments.create(author=self.user, content='First')
+        self.url = reverse('task-comments', args=[self.task.id])
+    
+    def get(self, etag, url=None):
+        return self.client.get(url or self.url, HTTP_IF_NONE_MATCH=etag)
+    
+    def test_not_modified_until_comments_change(self):
+        etag = self.client.get(self.url)['ETag']
+        self.assertEqual(self.get(etag).status_code, 304)
+        
+        comment = self.task.comments.create(author=self.user, content='Second')
+        response = self.get(etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data), 2)
+        etag = response['ETag']
+        
+        comment.delete()
+        self.assertEqual(self.get(etag).status_code, 200)
+    
+    def test_pages_have_their_own_etag(self):
+        etag = self.client.get(self.url)['ETag']
+        self.assertEqual(self.get(etag, self.url + '?page_size=1').status_code, 200)
+
+
+class AsyncReadViewTests(TaskTestMixin, APITestCase):
+    """
+    The async read views return the same responses as the sync views
+    """
+    
+    def setUp(self):
+        super().setUp()
+        self.user = self.create_user('owner@example.com')
+        board = Board.objects.create(title='Board', owner=self.user)
+        for index in range(3):
+            task = self.create_task(
+                board, title=f'Task {index}', assignee=self.user, reviewer=self.user
+            )
+        self.task = task
+        self.task.comments.create(author=self.user, content='First')
+        self.task.comments.create(author=self.user, content='Second')
+    
+    def build_request(self, path, **headers):
+        request = APIRequestFactory().get(path, **headers)
+        force_authenticate(request, self.user)
+        return request
+    
+    async def get_content(self, view, path, **kwargs):
+        response = await view(self.build_request(path), **kwargs)
+        if response.streaming:
+            return b''.join([chunk async for chunk in response.streaming_content])
+        return response.render().content
+    
+    async def assert_same_response(self, sync_view, async_view, path, **kwargs):
+        sync_response = await sync_to_async(sync_view)(
+            self.build_request(path), **kwargs
+        )
+        expected = sync_response.render().content
+        self.assertEqual(await self.get_content(async_view, path, **kwargs), expected)
+    
+    async def test_task_lists(self):
+        for sync_class, async_class in [
+            (TaskAssignedToMeView, AsyncTaskAssignedToMeView),
+            (TaskReviewingView, AsyncTaskReviewingView),
+        ]:
+            for query in [
+                '', '?page_size=2', '?status=to-do&ordering=-due_date&page_size=2'
+            ]:
+                await self.assert_same_response(
+                    sync_class.as_view(), async_class.as_view(), '/' + query
+                )
+    
+    async def test_task_list_stream(self):
+        path = '/?stream=1'
+        sync_response = await sync_to_async(TaskAssignedToMeView.as_view())(
+            self.build_request(path)
+        )
+        expected = await sync_to_async(b''.join)(sync_response.streaming_content)
+        content = await self.get_content(AsyncTaskAssignedToMeView.as_view(), path)
+        self.assertEqual(content, expected)
+    
+    async def test_comments(self):
+        for query in ['', '?page_size=1']:
+            await self.assert_same_response(
+                TaskCommentsView.as_view(), AsyncTaskCommentsView.as_view(),
+                '/' + query, task_id=self.task.id
+            )
+    
+    async def test_comments_not_modified(self):
+        view = AsyncTaskCommentsView.as_view()
+        response = await view(self.build_request('/'), task_id=self.task.id)
+        request = self.build_request('/', HTTP_IF_NONE_MATCH=response['ETag'])
+        response = await view(request, task_id=self.task.id)
+        self.assertEqual(response.status_code, 304)
+
+
+class TaskSearchTests(TaskTestMixin, APITestCase):
+    """
+    GET /api/tasks/search/?q= and the index maintenance
+    """
+    
+    def setUp(self):
+        super().setUp()
+        self.user = self.create_user('owner@example.com')
+        self.client.force_authenticate(self.user)
+        self.board = Board.objects.create(title='Board', owner=self.user)
+        self.title_match = self.create_task(self.board, title='Deploy release')
+        self.description_match = self.create_task(
+            self.board, title='Checklist', description='Deploy after the café review'
+        )
+        other_board = Board.objects.create(
+            title='Other', owner=self.create_user('other@example.com')
+        )
+        self.create_task(other_board, title='Deploy elsewhere')
+        self.url = reverse('tasks-search')
+    
+    def search(self, query, **params):
+        response = self.client.get(self.url, {'q': query, **params})
+        self.assertEqual(response.status_code, 200)
+        return [task['id'] for task in response.data['results']]
+    
+    def test_ranked_results_of_visible_boards(self):
+        self.assertEqual(
+            self.search('deploy'), [self.title_match.id, self.description_match.id]
+        )
+        self.assertEqual(self.search('Deploy CAFE'), [self.description_match.id])
+        self.assertEqual(self.search('reviews deploying'), [self.description_match.id])
+        self.assertEqual(self.search('deploy missing'), [])
+    
+    def test_pages(self):
+        response = self.client.get(self.url, {'q': 'deploy', 'page_size': 1})
+        self.assertEqual(len(response.data['results']), 1)
+        self.assertIn('page=2', response.data['next'])
+        self.assertEqual(
+            self.search('deploy', page_size=1, page=2), [self.description_match.id]
+        )
+        response = self.client.get(self.url, {'q': 'deploy', 'page': 0})
+        self.assertEqual(response.status_code, 404)
+    
+    def test_query_without_words(self):
+        response = self.client.get(self.url, {'q': ' "* -'})
+        self.assertEqual(response.status_code, 400)
+    
+    def test_index_follows_task_and_comment_writes(self):
+        task = self.title_match
+        task.title = 'Rollout'
+        task.save()
+        self.assertEqual(self.search('rollout'), [task.id])
+        self.assertEqual(self.search('deploy'), [self.description_match.id])
+        
+        comment = task.comments.create(author=self.user, content='Blocked by QA')
+        self.assertEqual(self.search('blocked'), [task.id])
+        comment.delete()
+        self.assertEqual(self.search('blocked'), [])
+        
+        task.delete()
+        self.assertEqual(self.search('rollout'), [])
+        self.board.delete()
+        self.assertEqual(self.search('deploy'), [])
+    
+    def test_bulk_writes_are_indexed(self):
+        url = reverse('tasks-bulk')
+        response = self.client.post(
+            url, [{'board': self.board.id, 'title': 'Imported backlog'}], format='json'
+        )
+        task_id = response.data['results'][0]['id']
+        self.assertEqual(self.search('backlog'), [task_id])
+        
+        self.client.patch(
+            url, [{'id': task_id, 'title': 'Imported icebox'}], format='json'
+        )
+        self.assertEqual(self.search('backlog'), [])
+        self.assertEqual(self.search('icebox'), [task_id])
+    
+    def test_database_backend(self):
+        self.addCleanup(search.get_search_backend.cache_clear)
+        search.get_search_backend.cache_clear()
+        backend = 'tasks_app.search.DatabaseSearchBackend'
+        with self.settings(TASK_SEARCH={'BACKEND': backend}):
+            self.title_match.comments.create(author=self.user, content='Needs review')
+            self.assertEqual(
+                set(self.search('deploy')),
+                {self.title_match.id, self.description_match.id}
+            )
+            self.assertEqual(self.search('deploy review'), [
+                self.description_match.id, self.title_match.id
+            ])
+
+
+class TaskListFilterTests(TaskTestMixin, APITestCase):
+    """
+    Filters and ordering of GET /api/tasks/assigned-to-me/ and /reviewing/
+    """
+    
+    def setUp(self):
+        super().setUp()
+        self.user = self.create_user('owner@example.com')
+        self.client.force_authenticate(self.user)
+        self.board = Board.objects.create(title='Board', owner=self.user)
+        self.other_board = Board.objects.create(title='Other', owner=self.user)
+        today = timezone.localdate()
+        self.overdue = self.create_task(
+            self.board, status='to-do', priority='high', assignee=self.user,
+            due_date=today - timedelta(days=2)
+        )
+        self.done = self.create_task(
+            self.board, status='done', priority='low', assignee=self.user,
+            due_date=today - timedelta(days=1)
+        )
+        self.upcoming = self.create_task(
+            self.other_board, status='review', priority='high', assignee=self.user,
+            reviewer=self.user, due_date=today + timedelta(days=3)
+        )
+        self.undated = self.create_task(
+            self.other_board, status='in-progress', priority='medium',
+            assignee=self.user
+        )
+        self.url = reverse('tasks-assigned-to-me')
+    
+    def get_ids(self, url=None, **params):
+        response = self.client.get(url or self.url, params)
+        self.assertEqual(response.status_code, 200)
+        return [task['id'] for task in response.data]
+    
+    def test_filters(self):
+        today = timezone.localdate()
+        self.assertEqual(
+            set(self.get_ids(status='to-do,review')),
+            {self.overdue.id, self.upcoming.id}
+        )
+        self.assertEqual(
+            set(self.get_ids(priority='high', board=self.board.id)), {self.overdue.id}
+        )
+        self.assertEqual(
+            set(self.get_ids(due_after=today - timedelta(days=1), due_before=today)),
+            {self.done.id}
+        )
+        self.assertEqual(self.get_ids(overdue='true'), [self.overdue.id])
+        self.assertEqual(
+            set(self.get_ids(overdue='false')),
+            {self.done.id, self.upcoming.id, self.undated.id}
+        )
+        self.assertEqual(
+            self.get_ids(reverse('tasks-reviewing'), status='review'),
+            [self.upcoming.id]
+        )
+    
+    def test_invalid_values(self):
+        response = self.client.get(self.url, {
+            'status': 'todo', 'board': 'x', 'due_before': '31.01.2026',
+            'overdue': 'maybe', 'ordering': 'title',
+        })
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            set(response.data), {'status', 'board', 'due_before', 'overdue', 'ordering'}
+        )
+        for board in ['\u00b2', '0', '-1', '9999999999999999999999999']:
+            response = self.client.get(self.url, {'board': board})
+            self.assertEqual(response.status_code, 400)
+            self.assertEqual(
+                response.data['board'], 'Expected comma separated board ids.'
+            )
+    
+    def test_due_date_ordering_pages(self):
+        for ordering, expected in [
+            ('due_date', [self.overdue, self.done, self.upcoming, self.undated]),
+            ('-due_date', [self.upcoming, self.done, self.overdue, self.undated]),
+        ]:
+            expected = [task.id for task in expected]
+            self.assertEqual(self.get_ids(ordering=ordering), expected)
+            
+            ids, url = [], f'{self.url}?ordering={ordering}&page_size=1'
+            while url:
+                response = self.client.get(url)
+                ids += [task['id'] for task in response.data['results']]
+                url = response.data['next']
+            self.assertEqual(ids, expected)
+
+
+class SummaryTests(TaskTestMixin, APITestCase):
+    """
+    GET /api/summary/ and its per-user cache
+    """
+    
+    def setUp(self):
+        super().setUp()
+        summary_cache.clear()
+        self.addCleanup(summary_cache.clear)
+        self.user = self.create_user('owner@example.com')
+        self.member = self.create_user('member@example.com')
+        self.client.force_authenticate(self.user)
+        self.board = Board.objects.create(title='Alpha', owner=self.user)
+        self.board.members.add(self.member)
+        self.other_board = Board.objects.create(title='Beta', owner=self.member)
+        today = timezone.localdate()
+        self.create_task(
+            self.board, status='to-do', priority='high', assignee=self.user,
+            due_date=today - timedelta(days=1)
+        )
+        self.create_task(
+            self.board, status='done', priority='high',
+            due_date=today + timedelta(days=1)
+        )
+        self.create_task(
+            self.board, status='review', priority='low', reviewer=self.user,
+            due_date=today + timedelta(days=5)
+        )
+        self.create_task(self.other_board, status='to-do')
+        self.url = reverse('summary')
+    
+    def get_summary(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        return response.data
+    
+    def test_invalidation_does_not_trust_membership_cache(self):
+        # Entry cached before another process added the member
+        membership_cache.set(self.board.pk, (self.user.id, frozenset()))
+        self.client.force_authenticate(self.member)
+        task_count = self.get_summary()['task_count']
+        self.create_task(self.board)
+        self.assertEqual(self.get_summary()['task_count'], task_count + 1)
+    
+    def test_counters(self):
+        with self.assertNumQueries(1):
+            data = self.get_summary()
+        today = timezone.localdate()
+        self.assertEqual(data['board_count'], 1)
+        self.assertEqual(data['task_count'], 3)
+        self.assertEqual(
+            data['tasks_by_status'],
+            {'to-do': 1, 'in-progress': 0, 'review': 1, 'done': 1}
+        )
+        self.assertEqual(data['tasks_by_priority'], {'low': 1, 'medium': 0, 'high': 2})
+        self.assertEqual(data['urgent_count'], 1)
+        self.assertEqual(data['overdue_count'], 1)
+        self.assertEqual(data['assigned_to_me_count'], 1)
+        self.assertEqual(data['reviewing_count'], 1)
+        self.assertEqual(data['nearest_due_date'], today + timedelta(days=5))
+        self.assertEqual(
+            [(board['id'], board['task_count']) for board in data['boards']],
+            [(self.board.id, 3)]
+        )
+        
+        self.client.force_authenticate(self.member)
+        data = self.get_summary()
+        self.assertEqual(
+            [(board['title'], board['task_count']) for board in data['boards']],
+            [('Alpha', 3), ('Beta', 1)]
+        )
+        self.assertEqual(data['tasks_by_status']['to-do'], 2)
+        self.assertEqual(data['assigned_to_me_count'], 0)
+    
+    def test_cached_until_tasks_change(self):
+        self.get_summary()
+        with self.assertNumQueries(0):
+            self.get_summary()
+        
+        self.client.force_authenticate(self.member)
+        self.assertEqual(self.get_summary()['task_count'], 4)
+        task = self.create_task(self.board, status='in-progress')
+        self.assertEqual(self.get_summary()['task_count'], 5)
+        self.client.force_authenticate(self.user)
+        self.assertEqual(self.get_summary()['tasks_by_status']['in-progress'], 1)
+        
+        task.delete()
+        self.assertEqual(self.get_summary()['task_count'], 3)
+        
+        self.client.post(
+            reverse('tasks-bulk'), [{'board': self.board.id, 'title': 'Imported'}],
+            format='json'
+        )
+        self.assertEqual(self.get_summary()['task_count'], 4)
+    
+    def test_shared_cache_sees_invalidations_of_other_processes(self):
+        shared = SummaryCache('task-summary', cache_alias='default')
+        other_process = SummaryCache('task-summary', cache_alias='default')
+        shared.set(self.user.pk, {'task_count': 3})
+        other_process.invalidate([self.user.pk])
+        self.assertIsNone(shared.get(self.user.pk))
+    
+    def test_cached_until_boards_or_members_change(self):
+        self.assertEqual(self.get_summary()['board_count'], 1)
+        self.other_board.members.add(self.user)
+        self.assertEqual(self.get_summary()['board_count'], 2)
+        self.user.board_memberships.remove(self.other_board)
+        self.assertEqual(self.get_summary()['board_count'], 1)
+        
+        self.board.title = 'Renamed'
+        self.board.save()
+        self.assertEqual(self.get_summary()['boards'][0]['title'], 'Renamed')
+        self.board.delete()
+        self.assertEqual(self.get_summary()['board_count'], 0)